@@ -9,8 +9,7 @@ Quick usage::
     print(state["report_path"])
 """
 
-from src.cli.interactive import interactive_loop, run_research
-from src.graph.builder import build_research_graph, compile_graph
+from __future__ import annotations
 
 __all__ = [
     "build_research_graph",
@@ -18,3 +17,17 @@ __all__ = [
     "interactive_loop",
     "run_research",
 ]
+
+
+def __getattr__(name: str):
+    # PEP 562 lazy re-exports: ``import src.config`` (or any sub-module)
+    # no longer drags in the whole graph / LangGraph import chain.
+    if name in {"interactive_loop", "run_research"}:
+        from src.cli import interactive
+
+        return getattr(interactive, name)
+    if name in {"build_research_graph", "compile_graph"}:
+        from src.graph import builder
+
+        return getattr(builder, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,135 @@
+"""Disk-backed response cache for LLM and search calls.
+
+Re-researching a topic (common while iterating on prompts or the report
+layout) would otherwise re-issue every Tavily search and LLM call.  Entries
+live in a small SQLite file, keyed by a BLAKE2b hash of the request, and
+expire after ``cache.ttl_seconds``.  Set ``cache.enabled: false`` in
+``settings.yaml`` to always hit the live APIs.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import inspect
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable
+
+import orjson
+
+from src.config import get_settings
+
+
+class ResponseCache:
+    """Thread-safe SQLite key → JSON value store with per-entry expiry."""
+
+    def __init__(self, path: Path, ttl_seconds: int) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL)"
+        )
+        # Drop what expired since the last run so the file does not grow forever
+        self._conn.execute("DELETE FROM responses WHERE expires_at < ?", (time.time(),))
+        self._conn.commit()
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached value for *key*, or ``None`` on miss / expiry.
+
+        An expired entry is deleted on the way out.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and row[1] < time.time():
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                row = None
+        if row is None:
+            return None
+        return orjson.loads(row[0])
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a JSON-serialisable *value* under *key*."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?)",
+                (key, orjson.dumps(value), time.time() + self.ttl_seconds),
+            )
+            self._conn.commit()
+
+
+@lru_cache(maxsize=1)
+def get_cache() -> ResponseCache | None:
+    """Return the shared cache, or ``None`` when ``cache.enabled`` is false."""
+    cfg = get_settings().get("cache", {})
+    if not cfg.get("enabled", False):
+        return None
+    directory = Path(cfg.get("dir", "~/.cache/deep-research")).expanduser()
+    ttl = cfg.get("ttl_seconds", 7 * 24 * 3600)
+    return ResponseCache(directory / "responses.sqlite3", ttl)
+
+
+def make_key(*parts: Any) -> str:
+    """Hash *parts* (via ``repr``) into a fixed-length cache key."""
+    return hashlib.blake2b(repr(parts).encode()).hexdigest()
+
+
+def cached(
+    key_fn: Callable[..., str],
+    dump: Callable[[Any], Any] = lambda v: v,
+    load: Callable[[Any], Any] = lambda v: v,
+    should_store: Callable[[Any], bool] = lambda v: v is not None,
+):
+    """Decorate a sync or async function with the response cache.
+
+    *key_fn* receives the call's arguments and returns the cache key;
+    *dump* / *load* convert the return value to and from JSON-friendly data.
+    Only return values accepted by *should_store* are written, so a result
+    degraded by a transient failure is not replayed until it expires.
+    """
+
+    def decorator(fn):
+        if inspect.iscoroutinefunction(fn):
+
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                cache = get_cache()
+                if cache is None:
+                    return await fn(*args, **kwargs)
+                key = key_fn(*args, **kwargs)
+                hit = cache.get(key)
+                if hit is not None:
+                    return load(hit)
+                value = await fn(*args, **kwargs)
+                if should_store(value):
+                    cache.set(key, dump(value))
+                return value
+
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            cache = get_cache()
+            if cache is None:
+                return fn(*args, **kwargs)
+            key = key_fn(*args, **kwargs)
+            hit = cache.get(key)
+            if hit is not None:
+                return load(hit)
+            value = fn(*args, **kwargs)
+            if should_store(value):
+                cache.set(key, dump(value))
+            return value
+
+        return wrapper
+
+    return decorator
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
+import threading
 import time
 
 from dotenv import load_dotenv
@@ -17,7 +19,54 @@ def _load_env() -> None:
     load_dotenv(".env")
 
 
-def run_research(topic: str, sections: list[str] | None = None) -> dict:
+def _warmup() -> None:
+    """Pay cold-start costs while the user is still typing a topic.
+
+    Loads settings, builds the cached LLM client, and imports the lazily
+    loaded search / report dependencies.  No request is sent: the run's
+    connections belong to the async clients on the shared event loop, and
+    a Tavily ping would be billed on every start.  Failures are swallowed —
+    the real run will surface them.
+    """
+    try:
+        from src.config import get_settings
+        from src.llm.provider import get_llm
+        from src.report import charts, html_report  # noqa: F401
+        from src.search.tavily_client import _get_client
+
+        get_settings()
+        get_llm()
+        _get_client()
+    except Exception:
+        pass
+
+
+_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Return the process-wide event loop used to run the graph.
+
+    Reusing one loop (instead of ``asyncio.run`` per topic) keeps the
+    cached LLM clients' async connection pools valid across REPL runs.
+    """
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = asyncio.new_event_loop()
+    return _loop
+
+
+async def _astream_final(graph, initial_state: dict) -> dict | None:
+    """Drive the graph with ``astream`` and return the last emitted state."""
+    final_state = None
+    async for event in graph.astream(initial_state, stream_mode="values"):
+        final_state = event
+    return final_state
+
+
+def run_research(
+    topic: str, sections: list[str] | None = None, graph=None
+) -> dict:
     """Run the full research pipeline on *topic* and return the final state.
 
     Parameters
@@ -27,17 +76,21 @@ def run_research(topic: str, sections: list[str] | None = None) -> dict:
     sections : list[str], optional
         Custom research sections. Defaults to
         ``["Market Trends", "Competitor Analysis", "SWOT Analysis"]``.
+    graph : CompiledStateGraph, optional
+        Pre-compiled research graph to reuse. Compiled on demand if omitted.
     """
     _load_env()
 
     assert os.getenv("GROQ_API_KEY"), "❌ Set GROQ_API_KEY in your .env"
     assert os.getenv("TAVILY_API_KEY"), "❌ Set TAVILY_API_KEY in your .env"
 
-    graph = compile_graph()
+    if graph is None:
+        graph = compile_graph()
 
     initial_state = {
         "topic": topic,
         "sub_topics": sections or DEFAULT_SECTIONS,
+        "section_briefs": [],
         "agent_results": [],
         "synthesis": "",
         "report_path": "",
@@ -51,9 +104,9 @@ def run_research(topic: str, sections: list[str] | None = None) -> dict:
 
     start = time.time()
 
-    final_state = None
-    for event in graph.stream(initial_state, stream_mode="values"):
-        final_state = event
+    final_state = _get_loop().run_until_complete(
+        _astream_final(graph, initial_state)
+    )
 
     elapsed = time.time() - start
 
@@ -69,10 +122,13 @@ def run_research(topic: str, sections: list[str] | None = None) -> dict:
 def interactive_loop() -> None:
     """REPL: ask the user for a topic, run research, repeat."""
     _load_env()
+    threading.Thread(target=_warmup, daemon=True).start()
 
     print("\n🔬 Deep Research Analyst — Interactive Mode")
     print("Type a topic to research, or 'quit' to exit.\n")
 
+    graph = compile_graph()  # compiled once, reused for every topic
+
     while True:
         topic = input("📎 Topic: ").strip()
         if not topic or topic.lower() in {"quit", "exit", "q"}:
@@ -80,7 +136,7 @@ def interactive_loop() -> None:
             break
 
         try:
-            state = run_research(topic)
+            state = run_research(topic, graph=graph)
             synthesis = state.get("synthesis", "")
             if synthesis:
                 print(f"\n{'─' * 60}")
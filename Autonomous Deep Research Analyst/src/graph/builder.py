@@ -10,6 +10,7 @@ from src.nodes import (
     orchestrator_router,
     report_writer,
     research_agent_node,
+    section_writer,
     synthesiser,
 )
 
@@ -22,6 +23,9 @@ def build_research_graph() -> StateGraph:
         START → orchestrator ──[Send()]──→ research_agent (×N parallel)
                                                 │
                                                 ▼
+                                          section_writer  (one abatch call)
+                                                │
+                                                ▼
                                            synthesiser
                                                 │
                                                 ▼
@@ -35,12 +39,14 @@ def build_research_graph() -> StateGraph:
     # Register nodes
     workflow.add_node("orchestrator", orchestrator)
     workflow.add_node("research_agent", research_agent_node)
+    workflow.add_node("section_writer", section_writer)
     workflow.add_node("synthesiser", synthesiser)
     workflow.add_node("report_writer", report_writer)
 
     # Edges
     workflow.add_conditional_edges("orchestrator", orchestrator_router)
-    workflow.add_edge("research_agent", "synthesiser")
+    workflow.add_edge("research_agent", "section_writer")
+    workflow.add_edge("section_writer", "synthesiser")
     workflow.add_edge("synthesiser", "report_writer")
     workflow.add_edge("report_writer", END)
 
@@ -1,5 +1,5 @@
 """LLM sub-package."""
 
-from src.llm.provider import get_llm, llm_invoke
+from src.llm.provider import allm_batch, allm_invoke, get_llm, llm_invoke
 
-__all__ = ["get_llm", "llm_invoke"]
+__all__ = ["allm_batch", "allm_invoke", "get_llm", "llm_invoke"]
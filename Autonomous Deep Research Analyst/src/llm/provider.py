@@ -2,16 +2,43 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
 import time
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
-from langchain_groq import ChatGroq
-
+from src.cache import get_cache, make_key
 from src.config import get_settings
 
+if TYPE_CHECKING:
+    from langchain_groq import ChatGroq
+
+# Resolved once at import so the hot invoke path never re-reads settings
+_CFG = get_settings()
+_PRIMARY: str = _CFG["llm"]["primary_model"]
+_FALLBACK: str = _CFG["llm"]["fallback_model"]
+_TEMPERATURE: float = _CFG["llm"]["temperature"]
+_RETRIES: int = _CFG["retry"]["max_attempts"]
+_BASE_DELAY: int = _CFG["retry"]["base_delay_seconds"]
+
+
+@lru_cache(maxsize=8)
+def _cached_llm(model: str, temperature: float, api_key: str | None) -> ChatGroq:
+    from langchain_groq import ChatGroq
+
+    # Retries are handled by the loops below; disable the SDK's own retries
+    # so a 429 is not backed off twice.
+    return ChatGroq(
+        model=model, temperature=temperature, api_key=api_key, max_retries=0
+    )
+
 
 def get_llm(model: str | None = None, temperature: float | None = None) -> ChatGroq:
-    """Create a ChatGroq instance.
+    """Return a shared ChatGroq instance.
+
+    Instances are cached per ``(model, temperature, api_key)`` so every
+    sub-agent and the synthesiser reuse one HTTP connection pool.
 
     Parameters
     ----------
@@ -20,38 +47,66 @@ def get_llm(model: str | None = None, temperature: float | None = None) -> ChatG
     temperature : float, optional
         Sampling temperature. Falls back to ``settings.yaml → llm.temperature``.
     """
-    cfg = get_settings()
-    return ChatGroq(
-        model=model or cfg["llm"]["primary_model"],
-        temperature=temperature if temperature is not None else cfg["llm"]["temperature"],
-        api_key=os.getenv("GROQ_API_KEY"),
+    return _cached_llm(
+        model or _PRIMARY,
+        temperature if temperature is not None else _TEMPERATURE,
+        os.getenv("GROQ_API_KEY"),
     )
 
 
+def _is_rate_limited(exc: Exception) -> bool:
+    err_str = str(exc)
+    return "429" in err_str or "rate_limit" in err_str.lower()
+
+
+def _retry_wait(exc: Exception, attempt: int, base_delay: int) -> float:
+    """Seconds to wait before the next attempt.
+
+    Prefers the server's ``retry-after`` header (exposed by the Groq SDK on
+    ``RateLimitError.response``) and falls back to exponential back-off.
+    """
+    headers = getattr(getattr(exc, "response", None), "headers", None) or {}
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return min(2**attempt * (base_delay // 2), 60)
+
+
+def _retry_plan(max_retries: int | None) -> tuple[list[str], int, int]:
+    """Return ``(models, retries, base_delay)`` from settings."""
+    return [_PRIMARY, _FALLBACK], max_retries or _RETRIES, _BASE_DELAY
+
+
+def _response_key(messages: list) -> str:
+    # Only primary-model answers are stored under this key; a fallback answer
+    # is used for the current run but not replayed in place of the primary.
+    return make_key("llm", _PRIMARY, messages)
+
+
 def llm_invoke(messages: list, *, max_retries: int | None = None) -> str:
     """Invoke the LLM with automatic retry + fallback on rate-limit errors.
 
     1. Try the **primary** model up to *max_retries* times (exponential back-off).
     2. If still rate-limited, switch to the **fallback** model.
     """
-    cfg = get_settings()
-    primary = cfg["llm"]["primary_model"]
-    fallback = cfg["llm"]["fallback_model"]
-    retries = max_retries or cfg["retry"]["max_attempts"]
-    base_delay = cfg["retry"]["base_delay_seconds"]
-
-    models = [primary, fallback]
+    models, retries, base_delay = _retry_plan(max_retries)
+    cache = get_cache()
+    key = _response_key(messages)
+    hit = cache.get(key) if cache else None
+    if hit is not None:
+        return hit
 
     for model in models:
         llm = get_llm(model)
         for attempt in range(1, retries + 1):
             try:
                 resp = llm.invoke(messages)
+                if cache and model == _PRIMARY:
+                    cache.set(key, resp.content)
                 return resp.content
             except Exception as exc:
-                err_str = str(exc)
-                if "429" in err_str or "rate_limit" in err_str.lower():
-                    wait = min(2**attempt * (base_delay // 2), 60)
+                if _is_rate_limited(exc):
+                    wait = _retry_wait(exc, attempt, base_delay)
                     print(
                         f"  ⏳ Rate-limited on {model} (attempt {attempt}/{retries}), "
                         f"retrying in {wait}s …"
@@ -63,3 +118,94 @@ def llm_invoke(messages: list, *, max_retries: int | None = None) -> str:
         print(f"  ⚠️  {model} exhausted retries, trying fallback …")
 
     raise RuntimeError("All models exhausted rate limits. Try again later.")
+
+
+async def allm_invoke(messages: list, *, max_retries: int | None = None) -> str:
+    """Async counterpart of :func:`llm_invoke`.
+
+    Uses ``ainvoke`` and ``asyncio.sleep`` so concurrent sub-agents keep
+    overlapping their network I/O while one of them is backing off.
+    """
+    models, retries, base_delay = _retry_plan(max_retries)
+    cache = get_cache()
+    key = _response_key(messages)
+    hit = cache.get(key) if cache else None
+    if hit is not None:
+        return hit
+
+    for model in models:
+        llm = get_llm(model)
+        for attempt in range(1, retries + 1):
+            try:
+                resp = await llm.ainvoke(messages)
+                if cache and model == _PRIMARY:
+                    cache.set(key, resp.content)
+                return resp.content
+            except Exception as exc:
+                if _is_rate_limited(exc):
+                    wait = _retry_wait(exc, attempt, base_delay)
+                    print(
+                        f"  ⏳ Rate-limited on {model} (attempt {attempt}/{retries}), "
+                        f"retrying in {wait}s …"
+                    )
+                    await asyncio.sleep(wait)
+                else:
+                    raise
+
+        print(f"  ⚠️  {model} exhausted retries, trying fallback …")
+
+    raise RuntimeError("All models exhausted rate limits. Try again later.")
+
+
+async def allm_batch(
+    message_lists: list[list], *, max_retries: int | None = None
+) -> list[str]:
+    """Run many prompts through one ``abatch`` call with retry + fallback.
+
+    Only the prompts that were rate-limited are re-submitted on the next
+    attempt; the remaining ones keep their first successful response.
+    Results are returned in the same order as *message_lists*.
+    """
+    models, retries, base_delay = _retry_plan(max_retries)
+    cache = get_cache()
+    keys = [_response_key(m) for m in message_lists]
+    outputs: list[str | None] = [None] * len(message_lists)
+    if cache:
+        outputs = [cache.get(k) for k in keys]
+    pending = [i for i, out in enumerate(outputs) if out is None]
+    if not pending:
+        return outputs  # type: ignore[return-value]
+
+    for model in models:
+        llm = get_llm(model)
+        for attempt in range(1, retries + 1):
+            responses = await llm.abatch(
+                [message_lists[i] for i in pending],
+                config={"max_concurrency": len(pending)},
+                return_exceptions=True,
+            )
+            still_pending: list[int] = []
+            wait = 0.0
+            for idx, resp in zip(pending, responses):
+                if not isinstance(resp, Exception):
+                    outputs[idx] = resp.content
+                    if cache and model == _PRIMARY:
+                        cache.set(keys[idx], resp.content)
+                elif _is_rate_limited(resp):
+                    still_pending.append(idx)
+                    wait = max(wait, _retry_wait(resp, attempt, base_delay))
+                else:
+                    raise resp
+            pending = still_pending
+            if not pending:
+                return outputs  # type: ignore[return-value]
+
+            print(
+                f"  ⏳ Rate-limited on {model} for {len(pending)} prompt(s) "
+                f"(attempt {attempt}/{retries}), retrying in {wait}s …"
+            )
+            await asyncio.sleep(wait)
+
+        print(f"  ⚠️  {model} exhausted retries, trying fallback …")
+
+    raise RuntimeError("All models exhausted rate limits. Try again later.")
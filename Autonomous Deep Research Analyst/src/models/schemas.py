@@ -1,14 +1,20 @@
-"""Pydantic schemas for the Deep Research Analyst pipeline."""
+"""Schemas for the Deep Research Analyst pipeline."""
 
 from __future__ import annotations
 
-from typing import List, Optional
+from dataclasses import dataclass
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
-class SearchResult(BaseModel):
-    """A single search hit from Tavily."""
+@dataclass(slots=True, frozen=True)
+class SearchResult:
+    """A single search hit from Tavily.
+
+    A slotted dataclass rather than a Pydantic model: hundreds are built per
+    research run from already well-typed Tavily JSON, so validation buys
+    nothing and ``__slots__`` keeps each instance small.
+    """
 
     title: str
     url: str
@@ -19,10 +25,12 @@ class SearchResult(BaseModel):
 class AgentResult(BaseModel):
     """Output produced by one research sub-agent."""
 
+    model_config = ConfigDict(frozen=True)
+
     section_name: str = Field(description="e.g. 'Market Trends'")
     content: str = Field(description="Markdown analysis text")
-    sources: List[SearchResult] = Field(default_factory=list)
-    chart_data: Optional[dict] = Field(
+    sources: list[SearchResult] = Field(default_factory=list)
+    chart_data: dict | None = Field(
         default=None,
         description="Optional {labels: [...], values: [...]} for charting",
     )
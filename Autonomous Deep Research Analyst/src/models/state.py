@@ -19,6 +19,7 @@ class ResearchState(TypedDict):
 
     topic: str  # user's research subject
     sub_topics: List[str]  # planned sub-sections
+    section_briefs: Annotated[list, operator.add]  # per-section prompts + sources
     agent_results: Annotated[list, operator.add]  # accumulates AgentResult dicts
     synthesis: Optional[str]  # merged final analysis
     report_path: Optional[str]  # path to generated report
@@ -3,6 +3,7 @@
 from src.nodes.orchestrator import DEFAULT_SECTIONS, orchestrator, orchestrator_router
 from src.nodes.report_writer import report_writer
 from src.nodes.research_agent import research_agent_node
+from src.nodes.section_writer import section_writer
 from src.nodes.synthesiser import synthesiser
 
 __all__ = [
@@ -11,5 +12,6 @@ __all__ = [
     "orchestrator_router",
     "report_writer",
     "research_agent_node",
+    "section_writer",
     "synthesiser",
 ]
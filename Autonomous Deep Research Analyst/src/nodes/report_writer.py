@@ -9,12 +9,14 @@ from langchain_core.messages import AIMessage
 
 from src.config import get_settings
 from src.models.state import ResearchState
-from src.report.charts import generate_charts
-from src.report.html_report import build_html_report
 
 
 def report_writer(state: ResearchState) -> dict:
     """Generate an HTML report with embedded charts."""
+    # Imported lazily: Matplotlib and Markdown are only needed here
+    from src.report.charts import generate_charts
+    from src.report.html_report import build_html_report
+
     cfg = get_settings()
     topic = state["topic"]
     results = state.get("agent_results", [])
@@ -29,8 +31,8 @@ def report_writer(state: ResearchState) -> dict:
 
     print("📝 Report Writer: generating HTML report …")
 
-    chart_paths = generate_charts(results, output_dir)
-    build_html_report(topic, results, synthesis, chart_paths, output_path)
+    charts = generate_charts(results)
+    build_html_report(topic, results, synthesis, charts, output_path)
 
     print(f"   ✅ Report saved → {output_path}")
     return {
@@ -1,17 +1,14 @@
-"""Research sub-agent node — search → synthesise → return AgentResult."""
+"""Research sub-agent node — search → section brief for the batched writer."""
 
 from __future__ import annotations
 
-import json
+import dataclasses
 import textwrap
-from typing import Optional
 
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import HumanMessage
 
-from src.llm.provider import llm_invoke
-from src.models.schemas import AgentResult
 from src.models.state import SubAgentInput
-from src.search.tavily_client import recursive_search
+from src.search.tavily_client import arecursive_search
 
 # ── Per-section system prompts ──────────────────────────────────────
 
@@ -56,23 +53,14 @@ SECTION_PROMPTS: dict[str, str] = {
 }
 
 
-def _extract_chart_data(text: str) -> tuple[str, Optional[dict]]:
-    """Extract ``chart_data`` JSON block from LLM output."""
-    chart_data = None
-    if "```chart_data" in text:
-        parts = text.split("```chart_data")
-        clean = parts[0]
-        try:
-            json_block = parts[1].split("```")[0].strip()
-            chart_data = json.loads(json_block)
-        except (IndexError, json.JSONDecodeError):
-            pass
-        return clean.strip(), chart_data
-    return text.strip(), None
+async def research_agent_node(state: SubAgentInput) -> dict:
+    """Generic sub-agent: search → build the section prompt.
 
-
-def research_agent_node(state: SubAgentInput) -> dict:
-    """Generic sub-agent: search → synthesise → return AgentResult."""
+    Declared ``async`` so the ``Send()`` fan-out runs all sections
+    concurrently on one event loop.  The LLM call itself is deferred to
+    :func:`~src.nodes.section_writer.section_writer`, which batches every
+    section brief into a single request.
+    """
     topic = state["topic"]
     section = state["section_name"]
     depth = state.get("search_depth", 2)
@@ -80,7 +68,7 @@ def research_agent_node(state: SubAgentInput) -> dict:
     print(f"  🔍 [{section}] Searching for: {topic} (depth={depth})")
 
     # 1. Recursive search
-    results = recursive_search(
+    results = await arecursive_search(
         query=f"{topic} {section.lower()}",
         max_depth=depth,
         results_per_round=5,
@@ -88,11 +76,21 @@ def research_agent_node(state: SubAgentInput) -> dict:
     print(f"  📄 [{section}] Got {len(results)} search results")
 
     # 2. Build context from search hits
-    search_context = "\n\n".join(
-        f"### {r.title}\n**URL:** {r.url}\n{r.snippet}" for r in results
-    )
-
-    # 3. LLM synthesis (with retry + fallback)
+    parts: list[str] = []
+    append = parts.append
+    for r in results:
+        append("### ")
+        append(r.title)
+        append("\n**URL:** ")
+        append(r.url)
+        append("\n")
+        append(r.snippet)
+        append("\n\n")
+    if parts:
+        parts.pop()  # no separator after the last hit
+    search_context = "".join(parts)
+
+    # 3. Section prompt for the batched LLM call
     system_prompt = SECTION_PROMPTS.get(section, f"Write a detailed {section} section.")
     user_msg = (
         f"Research topic: **{topic}**\n\n"
@@ -100,25 +98,14 @@ def research_agent_node(state: SubAgentInput) -> dict:
         f"Now write the {section} section."
     )
 
-    raw_content = llm_invoke(
-        [
-            SystemMessage(content=system_prompt),
-            HumanMessage(content=user_msg),
-        ]
-    )
-
-    content, chart_data = _extract_chart_data(raw_content)
-
-    agent_result = AgentResult(
-        section_name=section,
-        content=content,
-        sources=results[:10],
-        chart_data=chart_data,
-    )
-
-    print(f"  ✅ [{section}] Analysis complete ({len(content)} chars)")
+    brief = {
+        "section_name": section,
+        "system_prompt": system_prompt,
+        "user_msg": user_msg,
+        "sources": [dataclasses.asdict(r) for r in results[:10]],
+    }
 
     return {
-        "agent_results": [agent_result.model_dump()],
-        "messages": [HumanMessage(content=f"[{section}] completed")],
+        "section_briefs": [brief],
+        "messages": [HumanMessage(content=f"[{section}] search completed")],
     }
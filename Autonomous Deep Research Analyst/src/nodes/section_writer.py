@@ -0,0 +1,69 @@
+"""Section writer node — one batched LLM call for every research section."""
+
+from __future__ import annotations
+
+from typing import Optional
+
+import orjson
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+
+from src.llm.provider import allm_batch
+from src.models.state import ResearchState
+
+
+def _extract_chart_data(text: str) -> tuple[str, Optional[dict]]:
+    """Extract ``chart_data`` JSON block from LLM output."""
+    clean, sep, rest = text.partition("```chart_data")
+    if not sep:
+        return text.strip(), None
+    json_block, _, _ = rest.partition("```")
+    try:
+        chart_data = orjson.loads(json_block)
+    except orjson.JSONDecodeError:
+        chart_data = None
+    return clean.strip(), chart_data
+
+
+async def section_writer(state: ResearchState) -> dict:
+    """Write all sections from the accumulated briefs via ``abatch``.
+
+    Runs once after the research fan-in, so N sections cost one batched
+    request (one rate-limit window) instead of N independent retry chains.
+    """
+    briefs = state.get("section_briefs", [])
+    if not briefs:
+        return {
+            "messages": [AIMessage(content="Section writer: no briefs received.")]
+        }
+
+    print(f"✍️  Section Writer: drafting {len(briefs)} sections in one batch …")
+
+    message_lists = [
+        [SystemMessage(content=b["system_prompt"]), HumanMessage(content=b["user_msg"])]
+        for b in briefs
+    ]
+    raw_contents = await allm_batch(message_lists)
+
+    agent_results: list[dict] = []
+    for brief, raw_content in zip(briefs, raw_contents):
+        content, chart_data = _extract_chart_data(raw_content)
+        # Same shape as ``AgentResult.model_dump()``; the sources were already
+        # validated by ``recursive_search`` so re-validating them is skipped.
+        agent_results.append(
+            {
+                "section_name": brief["section_name"],
+                "content": content,
+                "sources": brief["sources"],
+                "chart_data": chart_data,
+            }
+        )
+        print(
+            f"  ✅ [{brief['section_name']}] Analysis complete ({len(content)} chars)"
+        )
+
+    return {
+        "agent_results": agent_results,
+        "messages": [
+            AIMessage(content=f"Section writer: {len(briefs)} sections drafted.")
+        ],
+    }
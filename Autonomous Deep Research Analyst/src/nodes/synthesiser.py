@@ -7,11 +7,17 @@ from langchain_core.messages import AIMessage, HumanMessage
 from src.llm.provider import llm_invoke
 from src.models.state import ResearchState
 
-SYNTHESIS_PROMPT = """\
+# The synthesis prompt, pre-split at its two placeholders so each call is
+# a single join instead of a ``str.format`` parse.
+_SYNTHESIS_HEAD = """\
 You are a senior research analyst.  Below are individual research sections
-on the topic: **{topic}**.
+on the topic: **"""
 
-{sections_text}
+_SYNTHESIS_MID = """**.
+
+"""
+
+_SYNTHESIS_TAIL = """
 
 ──────────────────────────────────────────────
 Write a comprehensive **Executive Synthesis** that:
@@ -36,24 +42,25 @@ def synthesiser(state: ResearchState) -> dict:
             "messages": [AIMessage(content="Synthesiser: no results received.")],
         }
 
-    # Build per-section text block
+    # Build per-section text block.  Sources are already cited inline in
+    # each section and listed once by the report writer, so they are kept
+    # out of the prompt to save input tokens.
     blocks: list[str] = []
     for r in results:
         name = r["section_name"] if isinstance(r, dict) else r.section_name
         content = r["content"] if isinstance(r, dict) else r.content
-        sources = r["sources"] if isinstance(r, dict) else r.sources
-
-        src_lines: list[str] = []
-        for s in sources or []:
-            if isinstance(s, dict):
-                src_lines.append(f"  - {s.get('title', 'Untitled')} ({s.get('url', '')})")
-            else:
-                src_lines.append(f"  - {s}")
-        src_list = "\n".join(src_lines)
-        blocks.append(f"### {name}\n{content}\n\n**Sources:**\n{src_list}")
+        blocks.append(f"### {name}\n{content}")
 
     sections_text = "\n\n---\n\n".join(blocks)
-    prompt = SYNTHESIS_PROMPT.format(topic=state["topic"], sections_text=sections_text)
+    prompt = "".join(
+        [
+            _SYNTHESIS_HEAD,
+            state["topic"],
+            _SYNTHESIS_MID,
+            sections_text,
+            _SYNTHESIS_TAIL,
+        ]
+    )
 
     print("🧪 Synthesiser: merging all sections into executive summary …")
     synthesis = llm_invoke([HumanMessage(content=prompt)])
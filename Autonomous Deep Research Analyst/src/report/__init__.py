@@ -1,6 +1,21 @@
-"""Report sub-package — chart generation and HTML report building."""
+"""Report sub-package — chart generation and HTML report building.
 
-from src.report.charts import generate_charts
-from src.report.html_report import build_html_report
+Exports are resolved lazily (PEP 562) so importing the package does not
+pull in Matplotlib or Markdown until a report is actually built.
+"""
+
+from __future__ import annotations
 
 __all__ = ["build_html_report", "generate_charts"]
+
+
+def __getattr__(name: str):
+    if name == "generate_charts":
+        from src.report.charts import generate_charts
+
+        return generate_charts
+    if name == "build_html_report":
+        from src.report.html_report import build_html_report
+
+        return build_html_report
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
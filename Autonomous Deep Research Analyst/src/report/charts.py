@@ -2,54 +2,91 @@
 
 from __future__ import annotations
 
-from pathlib import Path
+import base64
+import io
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
 
 import matplotlib
 matplotlib.use("Agg")  # non-interactive backend
 import matplotlib.pyplot as plt
 
 
-def generate_charts(results: list[dict], output_dir: Path) -> dict[str, Path]:
-    """Create Matplotlib charts from ``chart_data`` in agent results.
+def _render_one(chart_data: dict, section: str) -> tuple[str, str]:
+    """Render a single chart and return ``(section_key, base64_png)``.
 
-    Returns a mapping ``{section_key: png_path}``.
+    Top-level (picklable) so it can run in a worker process.
     """
-    chart_paths: dict[str, Path] = {}
+    safe_name = section.lower().replace(" ", "_")
+
+    labels = chart_data.get("labels", [])
+    values = chart_data.get("values", [])
+    chart_type = chart_data.get("type", "bar")
+    chart_title = chart_data.get("title", section)
+
+    fig, ax = plt.subplots(figsize=(8, 5))
+    if chart_type == "pie":
+        ax.pie(values, labels=labels, autopct="%1.1f%%", startangle=140)
+    elif chart_type == "horizontal_bar":
+        ax.barh(labels, values, color="steelblue")
+        ax.set_xlabel("Value")
+    else:
+        ax.bar(labels, values, color="steelblue")
+        ax.set_ylabel("Value")
+        plt.xticks(rotation=30, ha="right")
+
+    ax.set_title(chart_title, fontsize=13, fontweight="bold")
+    fig.tight_layout()
+
+    # Charts are inlined into the report, so encode in memory — no PNG
+    # file is written and read back.  Low zlib effort: PNG encoding
+    # dominates render time for simple charts.
+    buf = io.BytesIO()
+    fig.savefig(
+        buf,
+        format="png",
+        dpi=120,
+        pil_kwargs={"optimize": False, "compress_level": 1},
+    )
+    plt.close(fig)
+    return safe_name, base64.b64encode(buf.getvalue()).decode()
+
 
+def generate_charts(results: list[dict]) -> dict[str, str]:
+    """Create Matplotlib charts from ``chart_data`` in agent results.
+
+    Charts are rendered in parallel worker processes (PNG encoding is
+    CPU-bound).  Returns a mapping ``{section_key: base64_png}``.
+    """
+    jobs: list[tuple[dict, str]] = []
     for r in results:
         chart_data = r.get("chart_data")
         if not chart_data:
             continue
+        if not chart_data.get("labels") or not chart_data.get("values"):
+            continue
+        jobs.append((chart_data, r.get("section_name", "chart")))
 
-        section = r.get("section_name", "chart")
-        safe_name = section.lower().replace(" ", "_")
-
-        labels = chart_data.get("labels", [])
-        values = chart_data.get("values", [])
-        chart_type = chart_data.get("type", "bar")
-        chart_title = chart_data.get("title", section)
+    if not jobs:
+        return {}
 
-        if not labels or not values:
-            continue
+    if len(jobs) == 1:
+        rendered = [_render_one(*jobs[0])]
+    else:
+        workers = min(len(jobs), os.cpu_count() or 1)
+        # Spawned, not forked: this runs on a LangGraph worker thread, and
+        # forking a multithreaded process can deadlock the child
+        spawn = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=spawn) as executor:
+            rendered = list(
+                executor.map(
+                    _render_one,
+                    [data for data, _ in jobs],
+                    [section for _, section in jobs],
+                )
+            )
 
-        fig, ax = plt.subplots(figsize=(8, 5))
-        if chart_type == "pie":
-            ax.pie(values, labels=labels, autopct="%1.1f%%", startangle=140)
-        elif chart_type == "horizontal_bar":
-            ax.barh(labels, values, color="steelblue")
-            ax.set_xlabel("Value")
-        else:
-            ax.bar(labels, values, color="steelblue")
-            ax.set_ylabel("Value")
-            plt.xticks(rotation=30, ha="right")
-
-        ax.set_title(chart_title, fontsize=13, fontweight="bold")
-        fig.tight_layout()
-
-        path = output_dir / f"{safe_name}_chart.png"
-        fig.savefig(path, dpi=150)
-        plt.close(fig)
-        chart_paths[safe_name] = path
-        print(f"   📊 Chart saved → {path}")
-
-    return chart_paths
+    charts = dict(rendered)
+    print(f"   📊 Rendered {len(charts)} chart(s)")
+    return charts
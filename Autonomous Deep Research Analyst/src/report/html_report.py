@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-import base64
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
 import markdown as md_lib
-from pydantic import BaseModel
 
 # ── HTML template ───────────────────────────────────────────────────
 
@@ -75,24 +75,37 @@ HTML_TEMPLATE = """\
 
 # ── helpers ─────────────────────────────────────────────────────────
 
+# Built once per thread: loading extensions and compiling their patterns is
+# the expensive part of ``markdown.markdown()``, and a ``Markdown`` instance
+# keeps per-conversion state so it cannot be shared between threads.
+_local = threading.local()
+
+
 def _md_to_html(text: str) -> str:
     """Convert Markdown text to HTML."""
-    return md_lib.markdown(text, extensions=["tables", "fenced_code", "nl2br"])
+    md = getattr(_local, "md", None)
+    if md is None:
+        md = _local.md = md_lib.Markdown(
+            extensions=["tables", "fenced_code", "nl2br"]
+        )
+    return md.reset().convert(text)
 
 
-def _img_to_base64(path: Path) -> str:
-    """Read a PNG and return an HTML ``<img>`` tag with inline base64 data."""
-    data = path.read_bytes()
-    b64 = base64.b64encode(data).decode()
+def _img_tag(b64: str) -> str:
+    """Return an HTML ``<img>`` tag with inline base64 PNG data."""
     return f'<img src="data:image/png;base64,{b64}" style="max-width:100%;margin:1em 0;">'
 
 
+def _escape(text: str) -> str:
+    return text.replace("<", "&lt;").replace(">", "&gt;")
+
+
 def _format_source(src) -> tuple[str, str]:
     """Extract ``(title, url)`` from various source representations."""
-    if isinstance(src, dict):
+    if type(src) is dict:  # the common case: sources from model_dump()
         return src.get("title", "Untitled"), src.get("url", "")
-    if isinstance(src, BaseModel):
-        return getattr(src, "title", "Untitled"), getattr(src, "url", "")
+    if hasattr(src, "url"):
+        return getattr(src, "title", "Untitled"), src.url
     return str(src)[:80], str(src)
 
 
@@ -102,42 +115,43 @@ def build_html_report(
     topic: str,
     results: list[dict],
     synthesis: str,
-    chart_paths: dict[str, Path],
+    charts: dict[str, str],
     output_path: Path,
 ) -> None:
     """Assemble a self-contained HTML report and write to *output_path*."""
 
-    synthesis_html = _md_to_html(synthesis)
+    # Synthesis and every section are independent documents: convert them
+    # together, then stitch headings and charts in a cheap serial pass.
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        synthesis_html, *section_htmls = pool.map(
+            _md_to_html, [synthesis] + [r.get("content", "") for r in results]
+        )
 
     sections_parts: list[str] = []
-    all_sources: list[tuple[str, str]] = []
+    seen: dict[str, str] = {}  # url → title, first occurrence wins
 
-    for r in results:
+    for r, content_html in zip(results, section_htmls):
         section_name = r.get("section_name", "Section")
-        content = r.get("content", "")
         sources = r.get("sources", [])
         safe = section_name.lower().replace(" ", "_")
 
         section_html = f'<hr class="page-break">\n<h1>{section_name}</h1>\n'
-        section_html += _md_to_html(content)
+        section_html += content_html
 
-        chart_path = chart_paths.get(safe)
-        if chart_path and chart_path.exists():
-            section_html += _img_to_base64(chart_path)
+        chart_b64 = charts.get(safe)
+        if chart_b64:
+            section_html += _img_tag(chart_b64)
 
         sections_parts.append(section_html)
 
         for src in sources or []:
-            all_sources.append(_format_source(src))
-
-    # De-duplicate sources
-    seen: set[str] = set()
-    source_items: list[str] = []
-    for title, url in all_sources:
-        if url and url not in seen:
-            seen.add(url)
-            safe_title = title.replace("<", "&lt;").replace(">", "&gt;")
-            source_items.append(f'<li><a href="{url}">{safe_title}</a></li>')
+            title, url = _format_source(src)
+            if url:
+                seen.setdefault(url, title)
+
+    source_items = [
+        f'<li><a href="{url}">{_escape(title)}</a></li>' for url, title in seen.items()
+    ]
 
     html = HTML_TEMPLATE.format(
         topic=topic,
@@ -1,5 +1,5 @@
 """Search sub-package."""
 
-from src.search.tavily_client import recursive_search
+from src.search.tavily_client import arecursive_search, recursive_search
 
-__all__ = ["recursive_search"]
+__all__ = ["arecursive_search", "recursive_search"]
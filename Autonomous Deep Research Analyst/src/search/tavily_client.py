@@ -2,22 +2,407 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+import dataclasses
+import heapq
 import os
-from typing import List
+import re
+import weakref
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, List
 
-from langchain_core.messages import HumanMessage
-from tavily import TavilyClient
+import orjson
+from langchain_core.messages import HumanMessage, SystemMessage
 
+from src.cache import cached, get_cache, make_key
 from src.config import get_settings
-from src.llm.provider import llm_invoke
+from src.llm.provider import allm_invoke, llm_invoke
 from src.models.schemas import SearchResult
 
+if TYPE_CHECKING:
+    from tavily import AsyncTavilyClient, TavilyClient
 
+
+# One async client per event loop: its httpx pool cannot outlive the loop
+_async_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+# Per-loop cap on in-flight Tavily calls, shared by all parallel sub-agents
+_semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+# Per-loop follow-up query batcher, shared by all parallel sub-agents
+_batchers: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+# How long the first follow-up request waits for sibling sub-agents to join
+# its batch; the agents' search rounds finish close together.
+_BATCH_WINDOW_SECONDS = 0.05
+
+
+@lru_cache(maxsize=1)
 def _get_client() -> TavilyClient:
+    """Shared client so every search reuses one keep-alive connection pool."""
+    from tavily import TavilyClient
+
     return TavilyClient(api_key=os.getenv("TAVILY_API_KEY"))
 
 
+def _get_async_client() -> AsyncTavilyClient:
+    """Shared async client for the running event loop."""
+    from tavily import AsyncTavilyClient
+
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = AsyncTavilyClient(api_key=os.getenv("TAVILY_API_KEY"))
+        _async_clients[loop] = client
+    return client
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    """Shared ``search.max_concurrency`` semaphore for the running event loop."""
+    loop = asyncio.get_running_loop()
+    sem = _semaphores.get(loop)
+    if sem is None:
+        sem = asyncio.Semaphore(_max_concurrency())
+        _semaphores[loop] = sem
+    return sem
+
+
+def _max_concurrency() -> int:
+    # 1 serialises every call, e.g. to stay inside Tavily's free-tier limits
+    return max(1, get_settings()["search"].get("max_concurrency", 4))
+
+
+def _search_params(
+    max_depth: int | None, results_per_round: int | None
+) -> tuple[int, int, str]:
+    """Resolve ``(max_depth, results_per_round, search_depth)`` from settings."""
+    cfg = get_settings()
+    return (
+        max_depth or cfg["search"]["max_search_rounds"],
+        results_per_round or cfg["search"]["max_results_per_query"],
+        cfg["search"]["search_depth"],
+    )
+
+
+def _new_pool(results_per_round: int) -> _ResultPool:
+    capacity = get_settings()["search"].get("max_total_results", 50)
+    return _ResultPool(capacity, results_per_round)
+
+
+def _normalize_query(q: str) -> str:
+    return " ".join(q.lower().split())
+
+
+def _hits_key(q: str, search_depth: str, max_results: int) -> str:
+    return make_key("tavily", _normalize_query(q), search_depth, max_results)
+
+
+def _search_one(tavily: TavilyClient, q: str, **kwargs) -> list[dict] | None:
+    """Run one Tavily query and return its hits, logging and swallowing errors.
+
+    Hits are cached per ``(query, search_depth, max_results)`` so a run whose
+    follow-ups overlap an earlier session's only pays for the new queries.
+    """
+    cache = get_cache()
+    key = _hits_key(q, **kwargs)
+    hits = cache.get(key) if cache else None
+    if hits is not None:
+        return hits
+    try:
+        raw = tavily.search(query=q, include_answer=False, **kwargs)
+    except Exception as exc:
+        print(f"  ⚠️  Tavily error for '{q[:60]}': {exc}")
+        return None
+    hits = raw.get("results", [])
+    if cache:
+        cache.set(key, hits)
+    return hits
+
+
+async def _asearch_one(
+    tavily: AsyncTavilyClient, q: str, **kwargs
+) -> list[dict] | None:
+    """Async :func:`_search_one`, bounded by the per-loop semaphore."""
+    cache = get_cache()
+    key = _hits_key(q, **kwargs)
+    hits = cache.get(key) if cache else None
+    if hits is not None:
+        return hits
+    async with _get_semaphore():
+        try:
+            raw = await tavily.search(query=q, include_answer=False, **kwargs)
+        except Exception as exc:
+            print(f"  ⚠️  Tavily error for '{q[:60]}': {exc}")
+            return None
+    hits = raw.get("results", [])
+    if cache:
+        cache.set(key, hits)
+    return hits
+
+
+class _ResultPool:
+    """Unique-URL search hits for one ``recursive_search`` call.
+
+    Holds at most *capacity* results: once full, a new hit only gets in by
+    evicting the lowest-scored one (tracked in a min-heap), so memory stays
+    bounded however many rounds and follow-ups a search runs.
+    """
+
+    def __init__(self, capacity: int, recent_size: int) -> None:
+        self.capacity = capacity
+        self.results: dict[str, SearchResult] = {}
+        # ``(url, prompt line)`` for the newest hits, formatted once on insert
+        # so the follow-up prompt never re-lists or re-slices the results
+        self.recent: deque[tuple[str, str]] = deque(maxlen=recent_size)
+        self._heap: list[tuple[float, str]] = []
+        # Hits examined / duplicates seen in the latest round
+        self._examined = self._duplicates = 0
+
+    def fetch_size(self, results_per_round: int) -> int:
+        """``max_results`` for the next round's queries.
+
+        Over-fetches (2×, Tavily's cap is 20) while most hits in the last
+        round were URLs already collected, and falls back to 1× otherwise.
+        """
+        mostly_duplicates = self._duplicates * 2 >= self._examined > 0
+        self._examined = self._duplicates = 0
+        if mostly_duplicates:
+            return min(results_per_round * 2, 20)
+        return results_per_round
+
+    def add_hits(self, hits: list[dict], limit: int) -> None:
+        """Add up to *limit* new (unseen URL) Tavily *hits*."""
+        results, heap = self.results, self._heap
+        added = 0
+        for hit in hits:
+            if added >= limit:
+                break
+            self._examined += 1
+            url = hit.get("url", "")
+            if not url or url in results:
+                self._duplicates += 1
+                continue
+            score = hit.get("score", 0.0)
+            if len(results) >= self.capacity:
+                if score <= heap[0][0]:
+                    continue
+                _, evicted = heapq.heapreplace(heap, (score, url))
+                del results[evicted]
+            else:
+                heapq.heappush(heap, (score, url))
+            title, content = hit.get("title", ""), hit.get("content", "")
+            results[url] = SearchResult(
+                title=title, url=url, snippet=content[:500], score=score
+            )
+            self.recent.append((url, f"- {title}: {content[:150]}"))
+            added += 1
+
+
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL)
+# First JSON array, allowing one level of nested brackets inside strings
+_JSON_ARRAY_RE = re.compile(r"\[[^\[\]]*(?:\[[^\[\]]*\][^\[\]]*)*\]", re.DOTALL)
+
+# Static instructions go first (as their own message) so the provider's
+# prompt cache can match the prefix across rounds and sessions.
+_FOLLOWUP_SYSTEM = (
+    "You generate specific follow-up web search queries that find deeper "
+    "data, statistics, or expert opinions on a research topic, given the "
+    "latest search results. Return ONLY a JSON array of strings."
+)
+
+
+def _followup_messages(query: str, lines: list[str], results_per_round: int) -> list:
+    # One join over the pre-formatted lines builds the whole message; no
+    # intermediate snippets string is materialised and then re-copied.
+    content = "\n".join(
+        [
+            f"Topic: {query}",
+            "Results:",
+            *lines,
+            "",
+            f"Number of queries: {results_per_round}",
+        ]
+    )
+    return [SystemMessage(content=_FOLLOWUP_SYSTEM), HumanMessage(content=content)]
+
+
+def _parse_queries(text: str) -> list[str]:
+    """Parse the follow-up LLM output into a list of queries (``[]`` on failure)."""
+    fence = _FENCE_RE.search(text)
+    match = _JSON_ARRAY_RE.search(fence.group(1) if fence else text)
+    if match is None:
+        return []
+    try:
+        return orjson.loads(match.group(0))
+    except orjson.JSONDecodeError:
+        return []
+
+
+_FOLLOWUP_BATCH_SYSTEM = (
+    "You generate specific follow-up web search queries that find deeper "
+    "data, statistics, or expert opinions on research topics, given the "
+    "latest search results for each numbered topic. Return ONLY a JSON "
+    "object mapping each topic number (as a string) to a JSON array of "
+    "strings."
+)
+_JSON_OBJECT_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+
+def _followup_batch_messages(
+    requests: list[tuple[str, list[str], int]],
+) -> list:
+    """One prompt covering several ``(query, prompt lines, count)`` requests."""
+    parts: list[str] = []
+    for i, (query, lines, n) in enumerate(requests, 1):
+        parts += [f"Topic {i}: {query}", "Results:", *lines]
+        parts += [f"Number of queries: {n}", ""]
+    content = "\n".join(parts[:-1])
+    return [
+        SystemMessage(content=_FOLLOWUP_BATCH_SYSTEM),
+        HumanMessage(content=content),
+    ]
+
+
+def _parse_query_map(text: str, n: int) -> list[list]:
+    """Parse a batched reply into *n* query lists (empty where missing)."""
+    fence = _FENCE_RE.search(text)
+    match = _JSON_OBJECT_RE.search(fence.group(1) if fence else text)
+    try:
+        mapping = orjson.loads(match.group(0)) if match else {}
+    except orjson.JSONDecodeError:
+        mapping = {}
+    if not isinstance(mapping, dict):
+        mapping = {}
+    return [
+        q if isinstance(q := mapping.get(str(i)), list) else []
+        for i in range(1, n + 1)
+    ]
+
+
+class _FollowupBatcher:
+    """Coalesce follow-up query generation across concurrent sub-agents.
+
+    Each :func:`arecursive_search` round ends with one LLM call for
+    follow-up queries.  Requests arriving within ``_BATCH_WINDOW_SECONDS``
+    of each other are answered by a single call returning a JSON object
+    keyed by topic number, so N parallel agents cost one round-trip.
+    """
+
+    def __init__(self) -> None:
+        self._pending: list[tuple[str, list[str], int, asyncio.Future]] = []
+        # Running flushes; the loop keeps only weak references to tasks
+        self._tasks: set[asyncio.Task] = set()
+
+    async def generate(
+        self, query: str, recent: deque[tuple[str, str]], results_per_round: int
+    ) -> list:
+        lines = [line for _, line in sorted(recent)]
+        # Cached per topic: batch composition depends on agent timing, so the
+        # combined prompt alone would rarely repeat across runs.
+        cache = get_cache()
+        key = make_key("followup", query, lines, results_per_round)
+        hit = cache.get(key) if cache else None
+        if hit is not None:
+            return hit
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((query, lines, results_per_round, future))
+        if len(self._pending) == 1:
+            loop.call_later(_BATCH_WINDOW_SECONDS, self._start_flush, loop)
+        queries = await future
+        if cache and queries:
+            cache.set(key, queries)
+        return queries
+
+    def _start_flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        task = loop.create_task(self._flush())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _flush(self) -> None:
+        batch, self._pending = self._pending, []
+        try:
+            if len(batch) == 1:
+                query, lines, n, _ = batch[0]
+                messages = _followup_messages(query, lines, n)
+                results = [_parse_queries(await allm_invoke(messages))]
+            else:
+                requests = [(query, lines, n) for query, lines, n, _ in batch]
+                text = await allm_invoke(_followup_batch_messages(requests))
+                results = _parse_query_map(text, len(batch))
+        except Exception as exc:
+            # Each waiting search records the failure and carries on
+            for *_, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for (*_, future), queries in zip(batch, results):
+            if not future.done():
+                future.set_result(queries)
+
+
+def _get_batcher() -> _FollowupBatcher:
+    loop = asyncio.get_running_loop()
+    batcher = _batchers.get(loop)
+    if batcher is None:
+        batcher = _batchers[loop] = _FollowupBatcher()
+    return batcher
+
+
+def _fresh_queries(queries: list, seen: set[str], limit: int) -> list[str]:
+    """Return up to *limit* queries not searched before, recording them in *seen*.
+
+    Queries are compared case- and whitespace-insensitively, so follow-ups
+    that merely restate an earlier query do not cost another Tavily call.
+    """
+    fresh: list[str] = []
+    for q in queries:
+        if not isinstance(q, str):
+            continue
+        norm = _normalize_query(q)
+        if norm and norm not in seen:
+            seen.add(norm)
+            fresh.append(q)
+            if len(fresh) == limit:
+                break
+    return fresh
+
+
+def _search_key(
+    query: str,
+    max_depth: int | None = None,
+    results_per_round: int | None = None,
+) -> str:
+    return make_key("search", query, *_search_params(max_depth, results_per_round))
+
+
+def _dump_results(results: List[SearchResult]) -> list[dict]:
+    return [dataclasses.asdict(r) for r in results]
+
+
+def _load_results(data: list[dict]) -> List[SearchResult]:
+    return [SearchResult(**r) for r in data]
+
+
+class _PartialResults(list):
+    """Results of a search in which a Tavily call or follow-up step failed.
+
+    Returned to the caller like any list, but never cached: an outage must
+    not be replayed as the topic's answer until the entry expires.
+    """
+
+
+def _complete(results: List[SearchResult]) -> bool:
+    return bool(results) and not isinstance(results, _PartialResults)
+
+
+_cached_search = cached(
+    _search_key, dump=_dump_results, load=_load_results, should_store=_complete
+)
+
+
+@_cached_search
 def recursive_search(
     query: str,
     max_depth: int | None = None,
@@ -34,64 +419,100 @@ def recursive_search(
     results_per_round : int, optional
         Max hits per query per round (default from settings).
     """
-    cfg = get_settings()
-    max_depth = max_depth or cfg["search"]["max_search_rounds"]
-    results_per_round = results_per_round or cfg["search"]["max_results_per_query"]
-    search_depth = cfg["search"]["search_depth"]
+    max_depth, results_per_round, search_depth = _search_params(
+        max_depth, results_per_round
+    )
 
     tavily = _get_client()
-    all_results: dict[str, SearchResult] = {}
-    current_queries = [query]
+    found = _new_pool(results_per_round)
+    seen_queries: set[str] = set()
+    current_queries = _fresh_queries([query], seen_queries, 1)
+    failed = False
 
     for depth in range(max_depth):
         next_queries: list[str] = []
 
-        for q in current_queries:
+        # Queries within a round are independent: fan them out, then merge
+        # in submission order so de-duplication stays deterministic.
+        kwargs = {
+            "max_results": found.fetch_size(results_per_round),
+            "search_depth": search_depth if depth == 0 else "basic",
+        }
+        workers = max(1, min(len(current_queries), _max_concurrency()))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            raws = list(
+                pool.map(lambda q: _search_one(tavily, q, **kwargs), current_queries)
+            )
+        failed = failed or None in raws
+        for hits in raws:
+            if hits:
+                found.add_hits(hits, results_per_round)
+
+        # Generate follow-up queries for the next depth round
+        if depth < max_depth - 1 and found.results:
+            lines = [line for _, line in sorted(found.recent)]
+            messages = _followup_messages(query, lines, results_per_round)
             try:
-                raw = tavily.search(
-                    query=q,
-                    max_results=results_per_round,
-                    search_depth=search_depth if depth == 0 else "basic",
-                    include_answer=False,
-                )
-            except Exception as exc:
-                print(f"  ⚠️  Tavily error for '{q[:60]}': {exc}")
-                continue
+                text = llm_invoke(messages)
+            except Exception:
+                text = ""
+                failed = True
+            next_queries = _parse_queries(text)
 
-            for hit in raw.get("results", []):
-                url = hit.get("url", "")
-                if url and url not in all_results:
-                    all_results[url] = SearchResult(
-                        title=hit.get("title", ""),
-                        url=url,
-                        snippet=hit.get("content", "")[:500],
-                        score=hit.get("score", 0.0),
-                    )
+        current_queries = _fresh_queries(
+            next_queries, seen_queries, results_per_round
+        )
 
-        # Generate follow-up queries for the next depth round
-        if depth < max_depth - 1 and all_results:
-            snippets = "\n".join(
-                f"- {r.title}: {r.snippet[:150]}"
-                for r in list(all_results.values())[-results_per_round:]
-            )
-            followup_prompt = (
-                f"Based on these search results about '{query}':\n{snippets}\n\n"
-                f"Generate {results_per_round} specific follow-up search queries "
-                f"to find deeper data, statistics, or expert opinions. "
-                f"Return ONLY a JSON array of strings."
-            )
+    return (_PartialResults if failed else list)(found.results.values())
+
+
+@_cached_search
+async def arecursive_search(
+    query: str,
+    max_depth: int | None = None,
+    results_per_round: int | None = None,
+) -> List[SearchResult]:
+    """Async counterpart of :func:`recursive_search`.
+
+    Uses ``AsyncTavilyClient`` and :func:`allm_invoke` so that parallel
+    sub-agents share one event loop instead of blocking worker threads;
+    their follow-up query requests are batched into shared LLM calls.
+    """
+    max_depth, results_per_round, search_depth = _search_params(
+        max_depth, results_per_round
+    )
+
+    tavily = _get_async_client()
+    found = _new_pool(results_per_round)
+    seen_queries: set[str] = set()
+    current_queries = _fresh_queries([query], seen_queries, 1)
+    failed = False
+
+    for depth in range(max_depth):
+        next_queries: list[str] = []
+
+        kwargs = {
+            "max_results": found.fetch_size(results_per_round),
+            "search_depth": search_depth if depth == 0 else "basic",
+        }
+        raws = await asyncio.gather(
+            *(_asearch_one(tavily, q, **kwargs) for q in current_queries)
+        )
+        failed = failed or None in raws
+        for hits in raws:
+            if hits:
+                found.add_hits(hits, results_per_round)
+
+        if depth < max_depth - 1 and found.results:
             try:
-                text = llm_invoke([HumanMessage(content=followup_prompt)])
-                if "```" in text:
-                    text = text.split("```")[1]
-                    if text.startswith("json"):
-                        text = text[4:]
-                next_queries = json.loads(text)
-                if not isinstance(next_queries, list):
-                    next_queries = []
+                next_queries = await _get_batcher().generate(
+                    query, found.recent, results_per_round
+                )
             except Exception:
-                next_queries = []
+                failed = True
 
-        current_queries = next_queries[:results_per_round]
+        current_queries = _fresh_queries(
+            next_queries, seen_queries, results_per_round
+        )
 
-    return list(all_results.values())
+    return (_PartialResults if failed else list)(found.results.values())
@@ -11,11 +11,13 @@ def test_imports():
         orchestrator,
         orchestrator_router,
         research_agent_node,
+        section_writer,
         synthesiser,
         report_writer,
     )
 
     assert callable(orchestrator)
+    assert callable(section_writer)
     assert callable(compile_graph)
 
 
@@ -34,6 +36,9 @@ def test_search_result_model():
     sr = SearchResult(title="Test", url="https://example.com", snippet="Hello")
     assert sr.title == "Test"
     assert sr.score == 0.0
+    # Frozen → hashable, so duplicate hits collapse in a set
+    dup = SearchResult(title="Test", url="https://example.com", snippet="Hello")
+    assert len({sr, dup}) == 1
 
 
 def test_agent_result_model():
@@ -43,3 +48,135 @@ def test_agent_result_model():
     ar = AgentResult(section_name="Test", content="Body text")
     assert ar.sources == []
     assert ar.chart_data is None
+
+
+def test_retry_wait_prefers_retry_after_header():
+    """A server-provided retry-after hint overrides exponential back-off."""
+    from types import SimpleNamespace
+
+    from src.llm.provider import _retry_wait
+
+    exc = Exception("429")
+    exc.response = SimpleNamespace(headers={"retry-after": "2.5"})
+    assert _retry_wait(exc, attempt=3, base_delay=10) == 2.5
+    assert _retry_wait(Exception("429"), attempt=1, base_delay=10) == 10
+
+
+def test_response_cache_roundtrip_and_expiry(tmp_path):
+    """Cached values round-trip through SQLite and vanish once expired."""
+    from src.cache import ResponseCache, make_key
+
+    cache = ResponseCache(tmp_path / "cache.sqlite3", ttl_seconds=60)
+    key = make_key("llm", "model", ["hello"])
+    assert cache.get(key) is None
+    cache.set(key, [{"title": "t"}])
+    assert cache.get(key) == [{"title": "t"}]
+
+    expired = ResponseCache(tmp_path / "cache.sqlite3", ttl_seconds=-1)
+    expired.set(key, "stale")
+    assert expired.get(key) is None
+    rows = expired._conn.execute("SELECT COUNT(*) FROM responses").fetchone()
+    assert rows == (0,)
+
+
+def test_failed_search_round_is_not_cached(tmp_path, monkeypatch):
+    """A search degraded by a Tavily outage is returned but not stored."""
+    from src import cache as cache_mod
+    from src.search import tavily_client as tc
+
+    store = cache_mod.ResponseCache(tmp_path / "cache.sqlite3", ttl_seconds=60)
+    monkeypatch.setattr(tc, "get_cache", lambda: store)
+    monkeypatch.setattr(cache_mod, "get_cache", lambda: store)
+    monkeypatch.setattr(tc, "_get_client", lambda: None)
+    hits = [{"title": "t", "url": "https://example.com", "content": "c"}]
+    replies = iter([None, hits])
+    monkeypatch.setattr(tc, "_search_one", lambda *a, **k: next(replies))
+
+    assert tc.recursive_search("topic", max_depth=1) == []
+    assert len(tc.recursive_search("topic", max_depth=1)) == 1
+    assert store.get(tc._search_key("topic", 1)) is not None
+
+
+def test_fallback_answer_is_not_cached(tmp_path, monkeypatch):
+    """Only the primary model's answers are stored under the response key."""
+    from types import SimpleNamespace
+
+    from src.cache import ResponseCache
+    from src.llm import provider
+
+    store = ResponseCache(tmp_path / "cache.sqlite3", ttl_seconds=60)
+    monkeypatch.setattr(provider, "get_cache", lambda: store)
+
+    class _Llm:
+        def __init__(self, model):
+            self.model = model
+
+        def invoke(self, messages):
+            if self.model == provider._PRIMARY:
+                raise Exception("429 rate_limit")
+            return SimpleNamespace(content="fallback")
+
+    monkeypatch.setattr(provider, "get_llm", _Llm)
+    monkeypatch.setattr(provider.time, "sleep", lambda _: None)
+    assert provider.llm_invoke(["hi"], max_retries=1) == "fallback"
+    assert store.get(provider._response_key(["hi"])) is None
+
+
+def test_fresh_queries_skips_repeats_across_rounds():
+    """Follow-up queries that restate an earlier one are not searched again."""
+    from src.search.tavily_client import _fresh_queries
+
+    seen: set[str] = set()
+    assert _fresh_queries(["AI Trends"], seen, 5) == ["AI Trends"]
+    assert _fresh_queries(["ai  trends", "AI risks", 3, "ai risks"], seen, 5) == [
+        "AI risks"
+    ]
+
+
+def test_parse_queries_tolerates_chatty_output():
+    """Follow-up queries are found in fenced, bare, or prose-wrapped output."""
+    from src.search.tavily_client import _parse_queries
+
+    assert _parse_queries('```json\n["a", "b"]\n```') == ["a", "b"]
+    assert _parse_queries('Sure! ["x [1]", "y"] Hope that helps.') == ["x [1]", "y"]
+    assert _parse_queries("no queries here") == []
+    assert _parse_queries("```\n[1,\n]```") == []
+
+
+def test_result_pool_evicts_lowest_score_when_full():
+    """A full pool only admits hits that outscore its weakest entry."""
+    from src.search.tavily_client import _ResultPool
+
+    pool = _ResultPool(capacity=2, recent_size=5)
+    pool.add_hits(
+        [
+            {"url": "a", "score": 0.5},
+            {"url": "b", "score": 0.2},
+            {"url": "c", "score": 0.1},
+            {"url": "d", "score": 0.9},
+        ],
+        limit=5,
+    )
+    assert list(pool.results) == ["a", "d"]
+
+
+def test_parse_query_map_spreads_batched_reply():
+    """A batched follow-up reply is split back into per-topic query lists."""
+    from src.search.tavily_client import _parse_query_map
+
+    text = '```json\n{"1": ["a"], "3": ["c", "d"], "2": "oops"}\n```'
+    assert _parse_query_map(text, 3) == [["a"], [], ["c", "d"]]
+    assert _parse_query_map("not json", 2) == [[], []]
+
+
+def test_result_pool_stops_after_limit_and_overfetches_on_duplicates():
+    """Each query adds at most *limit* hits; duplicate-heavy rounds fetch more."""
+    from src.search.tavily_client import _ResultPool
+
+    pool = _ResultPool(capacity=50, recent_size=5)
+    assert pool.fetch_size(5) == 5
+    pool.add_hits([{"url": u, "score": 0.5} for u in "abc"], limit=2)
+    assert list(pool.results) == ["a", "b"]
+    assert pool.fetch_size(5) == 5
+    pool.add_hits([{"url": u, "score": 0.5} for u in "abx"], limit=5)
+    assert pool.fetch_size(5) == 10
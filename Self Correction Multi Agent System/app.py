@@ -13,6 +13,7 @@ import uuid
 
 import streamlit as st
 from dotenv import load_dotenv
+from langgraph.types import Command
 
 # ── Load env before any src imports ──────────────────────────────────
 load_dotenv()
@@ -20,6 +21,7 @@ load_dotenv()
 from src.db.manager import DatabaseManager, _ENV_VAR_MAP  # noqa: E402
 from src.graph.builder import compile_graph  # noqa: E402
 from src.models.schemas import SQLQuery  # noqa: E402
+from src.nodes.executor import _get_db_manager  # noqa: E402
 
 # ─────────────────────────────────────────────────────────────────────
 # Page config
@@ -37,14 +39,20 @@ if "app" not in st.session_state:
     st.session_state.app = compile_graph()
 
 if "db_manager" not in st.session_state:
-    st.session_state.db_manager = DatabaseManager()
+    # The graph's own manager, so stats and "Clear Cache" act on its caches
+    st.session_state.db_manager = _get_db_manager()
 
 if "history" not in st.session_state:
     st.session_state.history = []  # list of past query dicts
 
 
+@st.cache_data(ttl=None)
 def _available_databases() -> dict[str, str]:
-    """Return {dialect: connection_string} for every DB configured in .env."""
+    """Return {dialect: connection_string} for every DB configured in .env.
+
+    Cached across reruns: env vars are loaded once at startup and do not
+    change mid-session.
+    """
     available: dict[str, str] = {}
     for dialect, env_var in _ENV_VAR_MAP.items():
         conn_str = os.getenv(env_var, "").strip()
@@ -58,30 +66,53 @@ def _available_databases() -> dict[str, str]:
     return available
 
 
-def _run_workflow(question: str, dialect: str) -> dict:
-    """Execute the agent graph and capture per-node progress."""
-    app = st.session_state.app
-    db_manager: DatabaseManager = st.session_state.db_manager
-
+def _start_workflow(question: str, dialect: str) -> dict:
+    """Start the agent graph on a fresh thread; returns the run record."""
     thread_id = f"st-{uuid.uuid4().hex[:8]}"
-    config = {"configurable": {"thread_id": thread_id}}
-
+    run = {
+        "config": {"configurable": {"thread_id": thread_id}},
+        "steps": [],
+        "accumulated": {},
+        # Monotonic clock; raw nanoseconds in the loop, converted at render time
+        "start_ns": time.perf_counter_ns(),
+        "pending": None,
+    }
     initial_state = {
         "user_question": question,
         "dialect": dialect,
         "max_retries": 3,
         "messages": [],
     }
+    _advance_workflow(run, initial_state)
+    return run
+
 
-    steps: list[dict] = []
-    accumulated: dict = {}
-    start = time.time()
+def _advance_workflow(run: dict, graph_input) -> None:
+    """Stream the graph until it finishes or pauses for human approval.
 
-    for state_chunk in app.stream(initial_state, config=config):
+    On a pause ``run["pending"]`` holds the interrupt payload; resume with
+    ``_advance_workflow(run, Command(resume="yes" | "no"))``.
+    """
+    app = st.session_state.app
+    run["pending"] = None
+    for state_chunk in app.stream(graph_input, config=run["config"]):
         for node_name, node_state in state_chunk.items():
-            elapsed = round(time.time() - start, 2)
-            steps.append({"node": node_name, "elapsed_s": elapsed})
-            accumulated.update(node_state)
+            if node_name == "__interrupt__":
+                run["pending"] = node_state[0].value
+                continue
+            run["steps"].append(
+                {
+                    "node": node_name,
+                    "elapsed_ns": time.perf_counter_ns() - run["start_ns"],
+                }
+            )
+            run["accumulated"].update(node_state)
+
+
+def _summarise_run(run: dict) -> dict:
+    """Flatten a finished run into the fields the UI renders."""
+    db_manager: DatabaseManager = st.session_state.db_manager
+    accumulated = run["accumulated"]
 
     sql_obj: SQLQuery | None = accumulated.get("generated_sql")
     exec_result = accumulated.get("execution_result")
@@ -95,9 +126,9 @@ def _run_workflow(question: str, dialect: str) -> dict:
         "row_count": exec_result.row_count if exec_result else 0,
         "success": exec_result.success if exec_result else False,
         "retry_count": accumulated.get("retry_count", 0),
-        "steps": steps,
+        "steps": run["steps"],
         "cache_stats": db_manager.cache.stats(),
-        "elapsed_s": round(time.time() - start, 2),
+        "elapsed_s": round((time.perf_counter_ns() - run["start_ns"]) / 1e9, 2),
     }
 
 
@@ -118,7 +149,7 @@ with st.sidebar:
 
     selected_dialect = st.selectbox(
         "🗄️ Select Database",
-        options=list(available_dbs.keys()),
+        options=available_dbs.keys(),
         help="Databases are detected from environment variables in `.env`.",
     )
 
@@ -143,6 +174,7 @@ with st.sidebar:
 
     if st.button("🗑️ Clear Cache"):
         st.session_state.db_manager.cache.clear()
+        st.session_state.db_manager.answer_cache.clear()
         st.rerun()
 
     st.divider()
@@ -173,29 +205,24 @@ with st.form("query_form", clear_on_submit=False):
     )
 
 # ─────────────────────────────────────────────────────────────────────
-# Run workflow on submit
+# Result rendering
 # ─────────────────────────────────────────────────────────────────────
-if submitted and user_question.strip():
-    with st.status("Running agent workflow…", expanded=True) as status:
-        st.write(f"**Database:** {selected_dialect}")
-        st.write(f"**Question:** {user_question}")
-
-        result = _run_workflow(user_question.strip(), selected_dialect)
-
-        # Show step-by-step progress
-        for step in result["steps"]:
-            st.write(f"✅ **{step['node']}** — {step['elapsed_s']}s")
-
-        if result["success"]:
-            status.update(
-                label=f"✅ Completed in {result['elapsed_s']}s",
-                state="complete",
-            )
-        else:
-            status.update(
-                label=f"⚠️ Completed with issues ({result['elapsed_s']}s)",
-                state="error",
-            )
+def _render_result(question: str, result: dict, status) -> None:
+    """Show progress, answer, SQL, rows and metadata for a finished run."""
+    # Show step-by-step progress
+    for step in result["steps"]:
+        status.write(f"✅ **{step['node']}** — {step['elapsed_ns'] / 1e9:.2f}s")
+
+    if result["success"]:
+        status.update(
+            label=f"✅ Completed in {result['elapsed_s']}s",
+            state="complete",
+        )
+    else:
+        status.update(
+            label=f"⚠️ Completed with issues ({result['elapsed_s']}s)",
+            state="error",
+        )
 
     # ── Answer ───────────────────────────────────────────────────────
     st.subheader("💬 Answer")
@@ -229,12 +256,59 @@ if submitted and user_question.strip():
     # Save to history
     st.session_state.history.append(
         {
-            "question": user_question.strip(),
+            "question": question,
             "sql": result["sql"],
             "row_count": result["row_count"],
             "elapsed_s": result["elapsed_s"],
         }
     )
 
+
+def _finish_run(question: str, run: dict, status) -> None:
+    """Render a finished run, or park it until the user approves the query."""
+    if run["pending"] is not None:
+        status.update(label="⏸️ Waiting for approval", state="running")
+        st.session_state.pending_run = {"question": question, "run": run}
+        st.rerun()
+    _render_result(question, _summarise_run(run), status)
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Run workflow on submit
+# ─────────────────────────────────────────────────────────────────────
+if submitted and user_question.strip():
+    st.session_state.pop("pending_run", None)  # a new question abandons it
+    with st.status("Running agent workflow…", expanded=True) as status:
+        st.write(f"**Database:** {selected_dialect}")
+        st.write(f"**Question:** {user_question}")
+
+        run = _start_workflow(user_question.strip(), selected_dialect)
+    _finish_run(user_question.strip(), run, status)
+
 elif submitted:
     st.warning("Please enter a question before submitting.")
+
+# ─────────────────────────────────────────────────────────────────────
+# Human approval for sensitive queries (graph paused on interrupt())
+# ─────────────────────────────────────────────────────────────────────
+elif "pending_run" in st.session_state:
+    pending = st.session_state.pending_run
+    request = pending["run"]["pending"]
+
+    st.warning("⚠️ This query will modify data. Do you approve?")
+    st.code(request["query"], language="sql")
+    st.caption(f"💡 {request['explanation']}")
+
+    approve_col, reject_col = st.columns(2)
+    decision = None
+    if approve_col.button("✅ Approve", type="primary", use_container_width=True):
+        decision = "yes"
+    if reject_col.button("❌ Reject", use_container_width=True):
+        decision = "no"
+
+    if decision is not None:
+        del st.session_state.pending_run
+        with st.status("Resuming agent workflow…", expanded=True) as status:
+            st.write(f"**Question:** {pending['question']}")
+            _advance_workflow(pending["run"], Command(resume=decision))
+        _finish_run(pending["question"], pending["run"], status)
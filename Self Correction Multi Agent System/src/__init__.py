@@ -4,15 +4,24 @@ Self-Correcting Multi-Agent SQL System.
 Top-level convenience imports::
 
     from src import run_agent, compile_graph, DatabaseManager
+
+The names are imported on first access, so ``import src`` reads neither
+``.env`` nor the ``DB_*`` settings (the CLI loads ``.env`` first).
 """
 
-from src.cli.interactive import run_agent
-from src.db.manager import DatabaseManager
-from src.graph.builder import build_sql_agent_graph, compile_graph
+from importlib import import_module
+
+_EXPORTS = {
+    "run_agent": "src.cli.interactive",
+    "compile_graph": "src.graph.builder",
+    "build_sql_agent_graph": "src.graph.builder",
+    "DatabaseManager": "src.db.manager",
+}
+
+__all__ = list(_EXPORTS)
+
 
-__all__ = [
-    "run_agent",
-    "compile_graph",
-    "build_sql_agent_graph",
-    "DatabaseManager",
-]
+def __getattr__(name: str):
+    if name in _EXPORTS:
+        return getattr(import_module(_EXPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,7 +3,8 @@ Interactive CLI for the Self-Correcting SQL Agent.
 
 Provides two entry points:
 
-* :func:`run_agent` — single-shot query execution (importable API).
+* :func:`run_agent` — single-shot query execution (importable API);
+  prompts on stdin when a sensitive query needs approval.
 * :func:`interactive_loop` — REPL with ``cache`` and ``q`` commands.
 * ``__main__`` — run via ``python -m src.cli.interactive``.
 
@@ -27,8 +28,9 @@ Example (interactive)
 
 from __future__ import annotations
 
-from src.graph.builder import compile_graph
+from langgraph.types import Command
 
+from src.llm.provider import _ensure_dotenv
 
 # Module-level compiled app (created once on first use)
 _app = None
@@ -38,6 +40,11 @@ def _get_app():
     """Lazily compile the agent graph."""
     global _app
     if _app is None:
+        # Connection strings and DB_* settings are read from the environment
+        # when the graph's modules are first imported
+        _ensure_dotenv()
+        from src.graph.builder import compile_graph
+
         _app = compile_graph()
     return _app
 
@@ -86,10 +93,20 @@ def run_agent(
     }
 
     accumulated: dict = {}
-    for state in app.stream(initial_state, config=config):
-        for node_name, node_state in state.items():
-            print(f"✓ Completed: {node_name}")
-            accumulated.update(node_state)
+    graph_input: dict | Command | None = initial_state
+    while graph_input is not None:
+        pending = None
+        for state in app.stream(graph_input, config=config):
+            for node_name, node_state in state.items():
+                if node_name == "__interrupt__":
+                    pending = node_state[0].value
+                    continue
+                print(f"✓ Completed: {node_name}")
+                accumulated.update(node_state)
+        # The graph stopped at human approval: ask, then resume the thread
+        graph_input = (
+            Command(resume=_ask_approval(pending)) if pending is not None else None
+        )
 
     return {
         "answer": accumulated.get("final_answer", "Query could not be completed"),
@@ -99,6 +116,17 @@ def run_agent(
     }
 
 
+def _ask_approval(request: dict) -> str:
+    """Prompt on stdin for a sensitive query; returns the raw reply."""
+    print("\n" + "=" * 60)
+    print("⚠️  SENSITIVE QUERY REQUIRES APPROVAL")
+    print("=" * 60)
+    print(f"\nQuery: {request['query']}")
+    print(f"\nExplanation: {request['explanation']}")
+    print("\nThis query will modify data. Do you approve?")
+    return input("Type 'yes' to approve, anything else to reject: ")
+
+
 def interactive_loop(dialect: str = "MySQL") -> None:
     """Start the interactive query REPL.
 
@@ -112,6 +140,7 @@ def interactive_loop(dialect: str = "MySQL") -> None:
     dialect : str, default ``"MySQL"``
         Default SQL dialect for all queries.
     """
+    _ensure_dotenv()
     # Import here so the DB-manager singleton exists by the time we need it
     from src.nodes.executor import _get_db_manager
 
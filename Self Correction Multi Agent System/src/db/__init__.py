@@ -4,10 +4,21 @@ Database layer — caching and connection management.
 Re-exports
 ----------
 - :class:`QueryCache`
+- :class:`AnswerCache`
+- :class:`SemanticQueryCache`
 - :class:`DatabaseManager`
+- :func:`is_sensitive_sql`
 """
 
-from src.db.cache import QueryCache
+from src.db.cache import AnswerCache, QueryCache
 from src.db.manager import DatabaseManager
+from src.db.semantic_cache import SemanticQueryCache
+from src.db.sensitivity import is_sensitive_sql
 
-__all__ = ["QueryCache", "DatabaseManager"]
+__all__ = [
+    "QueryCache",
+    "AnswerCache",
+    "SemanticQueryCache",
+    "DatabaseManager",
+    "is_sensitive_sql",
+]
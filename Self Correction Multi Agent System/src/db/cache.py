@@ -5,7 +5,13 @@ This module provides a thread-safe (single-process) LRU cache that stores
 successful SQL query results keyed by ``SHA-256(dialect + normalized_sql)``.
 
 The cache automatically evicts least-recently-used entries when the
-configurable memory limit is reached (default **100 MB**).
+configurable memory limit is reached (default **100 MB**).  Entries may
+record the tables they read; :meth:`QueryCache.invalidate_tables` drops
+exactly the entries that depend on a table a write statement touched.
+
+:class:`AnswerCache` sits one level higher: it maps a normalised question
+(plus dialect and schema) to the final natural-language answer, so a
+repeated question skips the whole planner → answer pipeline.
 
 Example
 -------
@@ -26,10 +32,10 @@ Example
 from __future__ import annotations
 
 import hashlib
-import json
-import sys
+import threading
+import time
 from collections import OrderedDict
-from typing import Optional
+from typing import Iterable, Optional
 
 from src.models.schemas import QueryResult
 
@@ -44,6 +50,9 @@ class QueryCache:
         When this limit is exceeded the least-recently-used entries
         are evicted until there is room for the new entry.
 
+    All methods are guarded by one re-entrant lock, so a manager shared
+    between sessions (threads) can be used concurrently.
+
     Attributes
     ----------
     hits : int
@@ -61,7 +70,14 @@ class QueryCache:
     def __init__(self, max_size_bytes: int = 100 * 1024 * 1024) -> None:
         self.max_size_bytes = max_size_bytes
         self.current_size_bytes = 0
-        self._cache: OrderedDict[str, tuple[QueryResult, int]] = OrderedDict()
+        # OrderedDict rather than a plain dict: its C-level move_to_end /
+        # popitem(last=False) beat pop-and-reinsert / next(iter(d)) eviction.
+        self._cache: OrderedDict[str, tuple[QueryResult, int, frozenset[str]]] = (
+            OrderedDict()
+        )
+        # table name → keys of the entries that read it
+        self._table_keys: dict[str, set[str]] = {}
+        self._lock = threading.RLock()
         self.hits = 0
         self.misses = 0
 
@@ -69,11 +85,13 @@ class QueryCache:
     # Internal helpers
     # ------------------------------------------------------------------
 
-    def _make_key(self, dialect: str, sql_query: str) -> str:
+    def make_key(self, dialect: str, sql_query: str) -> str:
         """Create a unique cache key from dialect + normalised SQL.
 
         The SQL is lowered, whitespace-collapsed, then hashed with SHA-256
-        to produce a fixed-length key regardless of query length.
+        to produce a fixed-length key regardless of query length.  Callers
+        that both look up and store a query should compute the key once and
+        use :meth:`get_by_key` / :meth:`put_by_key`.
 
         Parameters
         ----------
@@ -94,9 +112,19 @@ class QueryCache:
     def _estimate_size(self, result: QueryResult) -> int:
         """Estimate the memory size of a ``QueryResult`` in bytes.
 
-        Uses ``sys.getsizeof`` on the JSON-serialised payload.
+        Reads :attr:`QueryResult.byte_size`, computed once when the result
+        was built, so caching never re-serialises the rows.
         """
-        return sys.getsizeof(json.dumps(result.model_dump(), default=str))
+        return result.byte_size
+
+    def _unindex(self, key: str, tables: frozenset[str]) -> None:
+        """Remove *key* from the reverse index of each of its *tables*."""
+        for table in tables:
+            keys = self._table_keys.get(table)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._table_keys[table]
 
     # ------------------------------------------------------------------
     # Public API
@@ -119,13 +147,18 @@ class QueryCache:
         QueryResult or None
             Cached result on hit, ``None`` on miss.
         """
-        key = self._make_key(dialect, sql_query)
-        if key in self._cache:
-            self._cache.move_to_end(key)
-            self.hits += 1
-            return self._cache[key][0]
-        self.misses += 1
-        return None
+        return self.get_by_key(self.make_key(dialect, sql_query))
+
+    def get_by_key(self, key: str) -> Optional[QueryResult]:
+        """Like :meth:`get`, for a key already built with :meth:`make_key`."""
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+            return None
 
     def put(self, dialect: str, sql_query: str, result: QueryResult) -> None:
         """Store a result in the cache.
@@ -144,37 +177,84 @@ class QueryCache:
         result : QueryResult
             Execution result to cache.
         """
+        self.put_by_key(self.make_key(dialect, sql_query), result)
+
+    def put_by_key(
+        self, key: str, result: QueryResult, tables: frozenset[str] = frozenset()
+    ) -> None:
+        """Like :meth:`put`, for a key already built with :meth:`make_key`.
+
+        *tables* are the (lower-cased) tables the query reads; the entry is
+        dropped by :meth:`invalidate_tables` when any of them is written.
+        """
         if not result.success:
             return
 
-        key = self._make_key(dialect, sql_query)
         entry_size = self._estimate_size(result)
 
         if entry_size > self.max_size_bytes:
             return
 
-        # Replace existing entry
-        if key in self._cache:
-            _, old_size = self._cache.pop(key)
-            self.current_size_bytes -= old_size
+        with self._lock:
+            # Replace existing entry (single lookup: pop with a default)
+            old = self._cache.pop(key, None)
+            if old is not None:
+                self.current_size_bytes -= old[1]
+                self._unindex(key, old[2])
+
+            # Evict LRU entries until there is room
+            while (
+                self.current_size_bytes + entry_size > self.max_size_bytes
+                and self._cache
+            ):
+                evicted_key, (_, evicted_size, evicted_tables) = (
+                    self._cache.popitem(last=False)
+                )
+                self.current_size_bytes -= evicted_size
+                self._unindex(evicted_key, evicted_tables)
+
+            self._cache[key] = (result, entry_size, tables)
+            self.current_size_bytes += entry_size
+            for table in tables:
+                self._table_keys.setdefault(table, set()).add(key)
+
+    def invalidate_tables(self, tables: Iterable[str]) -> int:
+        """Drop every entry that reads any of *tables*.
 
-        # Evict LRU entries until there is room
-        while (
-            self.current_size_bytes + entry_size > self.max_size_bytes
-            and self._cache
-        ):
-            _, (_, evicted_size) = self._cache.popitem(last=False)
-            self.current_size_bytes -= evicted_size
+        Parameters
+        ----------
+        tables : iterable of str
+            Lower-cased names of the tables a statement wrote to.
 
-        self._cache[key] = (result, entry_size)
-        self.current_size_bytes += entry_size
+        Returns
+        -------
+        int
+            Number of entries removed.
+        """
+        removed = 0
+        with self._lock:
+            for table in tables:
+                for key in self._table_keys.pop(table, ()):
+                    entry = self._cache.pop(key, None)
+                    if entry is None:
+                        continue
+                    self.current_size_bytes -= entry[1]
+                    self._unindex(key, entry[2])
+                    removed += 1
+        return removed
+
+    def __contains__(self, key: str) -> bool:
+        """Membership test by key; does not touch LRU order or counters."""
+        return key in self._cache
 
     def clear(self) -> None:
         """Flush the entire cache and reset hit/miss counters."""
-        self._cache.clear()
-        self.current_size_bytes = 0
-        self.hits = 0
-        self.misses = 0
+        with self._lock:
+            self._cache.clear()
+            self._table_keys.clear()
+            self.current_size_bytes = 0
+            self.hits = 0
+            self.misses = 0
 
     def stats(self) -> dict:
         """Return cache statistics.
@@ -202,3 +282,77 @@ class QueryCache:
                 f"{(self.hits / total * 100):.1f}%" if total > 0 else "N/A"
             ),
         }
+
+
+class AnswerCache:
+    """TTL + LRU cache of final answers keyed by normalised question.
+
+    Parameters
+    ----------
+    max_entries : int, default ``512``
+        Maximum number of answers kept (least-recently-used evicted).
+    ttl_seconds : float, default ``3600``
+        Lifetime of an answer; bounds staleness after writes made outside
+        the agent.
+
+    Example
+    -------
+    >>> answers = AnswerCache()
+    >>> answers.put("How many users?", "SQLite", "Table: users", "There are 3.")
+    >>> answers.get("how many  users", "SQLite", "Table: users")
+    'There are 3.'
+    """
+
+    def __init__(self, max_entries: int = 512, ttl_seconds: float = 3600) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        # key → (monotonic expiry, answer)
+        self._cache: OrderedDict[tuple[str, str, str], tuple[float, str]] = (
+            OrderedDict()
+        )
+        # Shared by every Streamlit session thread via the DB manager
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def normalize_question(question: str) -> str:
+        """Lower-case, collapse whitespace and drop trailing ``?!.``.
+
+        Other punctuation is kept: operators and signs (``> 30`` vs
+        ``< 30``, ``-5``, ``3.5``) change what is being asked.
+        """
+        return " ".join(question.lower().split()).rstrip("?!. ")
+
+    def get(self, question: str, dialect: str, schema: str) -> Optional[str]:
+        """Return the cached answer, or ``None`` on miss / expiry.
+
+        The schema text is part of the key, so an answer is never served
+        after the database schema changed.
+        """
+        key = (self.normalize_question(question), dialect, schema)
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+            return entry[1]
+
+    def put(self, question: str, dialect: str, schema: str, answer: str) -> None:
+        """Store *answer*, evicting the least-recently-used entry if full."""
+        key = (self.normalize_question(question), dialect, schema)
+        with self._lock:
+            self._cache.pop(key, None)
+            self._cache[key] = (time.monotonic() + self.ttl_seconds, answer)
+            if len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached answer."""
+        with self._lock:
+            self._cache.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._cache)
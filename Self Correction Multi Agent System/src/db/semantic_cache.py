@@ -0,0 +1,242 @@
+"""
+Second-tier query cache keyed on a canonical form of the SQL.
+
+:class:`~src.db.cache.QueryCache` keys on ``dialect + lower-cased,
+whitespace-collapsed SQL``, so queries the planner regenerates with a
+trailing ``;``, a comment, or different spacing around punctuation miss.
+:class:`SemanticQueryCache` sits above it: each stored query is also
+indexed under a canonical signature, and an exact-key miss falls back to
+that index.  Results are stored once, in the underlying LRU.
+
+Canonicalisation uses `sqlglot <https://github.com/tobymao/sqlglot>`_ when
+installed (``pip install .[sql]``; AST round-trip, identifier
+normalisation) and a regex normaliser otherwise.  Sensitive (write)
+statements never use the signature index.
+
+Each stored result also records the tables its query reads
+(:func:`referenced_tables`); :meth:`SemanticQueryCache.invalidate` drops
+the results that read a table a write statement touched.  Dependencies
+are resolved by name only, so a write reaching a table through a view,
+trigger or cascade is not seen.
+
+Example
+-------
+>>> from src.db.cache import QueryCache
+>>> from src.db.semantic_cache import SemanticQueryCache, canonicalize_sql
+>>> from src.db.semantic_cache import referenced_tables
+>>> canonicalize_sql("SELECT id , name FROM users ; -- all", "SQLite")  # regex
+'select id,name from users'
+>>> sorted(referenced_tables("SELECT * FROM main.users u, orders", "SQLite"))
+['orders', 'users']
+"""
+
+from __future__ import annotations
+
+import re
+from collections import OrderedDict
+from typing import Optional
+
+from src.db.cache import QueryCache
+from src.models.schemas import QueryResult
+
+try:  # optional: AST-based canonicalisation
+    import sqlglot
+    from sqlglot import exp
+except ImportError:  # pragma: no cover - depends on the environment
+    sqlglot = None
+
+_SQLGLOT_DIALECTS: dict[str, str] = {
+    "MySQL": "mysql",
+    "PostgreSQL": "postgres",
+    "SQLite": "sqlite",
+    "SQL Server": "tsql",
+    "Oracle": "oracle",
+}
+
+_COMMENT_RE = re.compile(r"--[^\n]*|/\*.*?\*/", re.DOTALL)
+# Quoted literals / identifiers are kept verbatim (captured by the split)
+_QUOTED_RE = re.compile(r"""('(?:[^']|'')*'|"(?:[^"]|"")*")""")
+_PUNCT_SPACE_RE = re.compile(r"\s*([(),=<>])\s*")
+_WS_RE = re.compile(r"\s+")
+
+# Regex fallback for table extraction: the (optionally qualified, quoted)
+# names following a table-position keyword, including ``FROM a x, b y`` lists
+_NAME = r'(?:[\w$]+|"[^"]+"|`[^`]+`|\[[^\]]+\])'
+_IDENT = rf"{_NAME}(?:\s*\.\s*{_NAME})*"
+_CLAUSE_WORDS = (
+    "JOIN|INNER|LEFT|RIGHT|FULL|CROSS|NATURAL|ON|USING|WHERE|GROUP|ORDER|"
+    "HAVING|LIMIT|OFFSET|FETCH|UNION|EXCEPT|INTERSECT|SET|VALUES|SELECT|"
+    "WINDOW|RETURNING"
+)
+_ALIASED = rf"{_IDENT}(?:\s+(?:AS\s+)?(?!(?:{_CLAUSE_WORDS})\b)\w+)?"
+_TABLE_LIST_RE = re.compile(
+    r"\b(?:FROM|JOIN|INTO|UPDATE|TRUNCATE(?:\s+TABLE)?|TABLE)\s+"
+    r"(?:IF\s+(?:NOT\s+)?EXISTS\s+)?"
+    rf"({_ALIASED}(?:\s*,\s*{_ALIASED})*)",
+    re.IGNORECASE,
+)
+_TABLE_NAME_RE = re.compile(_IDENT)
+
+
+def _regex_canonical(sql: str) -> str:
+    parts = _QUOTED_RE.split(_COMMENT_RE.sub(" ", sql))
+    for i in range(0, len(parts), 2):  # even indices are outside quotes
+        part = _PUNCT_SPACE_RE.sub(r"\1", parts[i].lower())
+        parts[i] = _WS_RE.sub(" ", part)
+    return "".join(parts).strip().rstrip(";").strip()
+
+
+def canonicalize_sql(sql_query: str, dialect: str) -> str:
+    """Return a whitespace/comment/case-insensitive signature of *sql_query*.
+
+    Parameters
+    ----------
+    sql_query : str
+        Raw SQL string.
+    dialect : str
+        Database dialect (e.g. ``"MySQL"``), used by the sqlglot parser.
+
+    Returns
+    -------
+    str
+        Canonical SQL text; two queries with the same signature return
+        the same rows.
+    """
+    if sqlglot is not None:
+        try:
+            statements = sqlglot.parse(
+                sql_query, read=_SQLGLOT_DIALECTS.get(dialect)
+            )
+            # A trailing comment parses as an extra, empty statement
+            rendered = (
+                statement.sql(normalize=True, pretty=False, comments=False)
+                for statement in statements
+                if statement is not None
+            )
+            return "; ".join(text for text in rendered if text)
+        except Exception:  # unparsable: fall back to the regex form
+            pass
+    return _regex_canonical(sql_query)
+
+
+def _table_name(identifier: str) -> str:
+    """``main."Users"`` → ``users``: last dotted part, unquoted, lower-cased."""
+    last = re.split(r"\s*\.\s*", identifier)[-1]
+    return last.strip('"`[]').lower()
+
+
+def referenced_tables(sql_query: str, dialect: str) -> frozenset[str]:
+    """Return the lower-cased names of the tables *sql_query* reads or writes.
+
+    Parameters
+    ----------
+    sql_query : str
+        Raw SQL string (may contain several statements).
+    dialect : str
+        Database dialect, used by the sqlglot parser.
+
+    Returns
+    -------
+    frozenset[str]
+        Unqualified table names; empty for table-less queries like
+        ``SELECT 1``.
+    """
+    if sqlglot is not None:
+        try:
+            statements = sqlglot.parse(
+                sql_query, read=_SQLGLOT_DIALECTS.get(dialect)
+            )
+            return frozenset(
+                table.name.lower()
+                for statement in statements
+                if statement is not None
+                for table in statement.find_all(exp.Table)
+            )
+        except Exception:  # unparsable: fall back to the regex scan
+            pass
+    parts = _QUOTED_RE.split(_COMMENT_RE.sub(" ", sql_query))
+    # Quoted identifiers are needed here, only string literals are dropped
+    text = "".join(p for p in parts if not p.startswith("'"))
+    return frozenset(
+        _table_name(_TABLE_NAME_RE.match(item.strip()).group())
+        for match in _TABLE_LIST_RE.finditer(text)
+        for item in match.group(1).split(",")
+    )
+
+
+class SemanticQueryCache:
+    """Canonical-signature index in front of a :class:`QueryCache`.
+
+    Parameters
+    ----------
+    cache : QueryCache
+        Underlying exact-key LRU that owns the cached results.
+    max_aliases : int, default ``4096``
+        Maximum signature → key entries kept (oldest dropped first).
+    """
+
+    def __init__(self, cache: QueryCache, max_aliases: int = 4096) -> None:
+        self.cache = cache
+        self.max_aliases = max_aliases
+        self._aliases: OrderedDict[str, str] = OrderedDict()
+
+    def _signature(self, dialect: str, sql_query: str) -> str:
+        return self.cache.make_key(dialect, canonicalize_sql(sql_query, dialect))
+
+    def lookup(
+        self, dialect: str, sql_query: str, is_sensitive: bool = False
+    ) -> tuple[str, Optional[QueryResult]]:
+        """Return ``(exact_key, cached_result_or_None)``.
+
+        The exact key is checked first; on a miss a non-sensitive query is
+        retried under the key of any query sharing its canonical signature.
+        Hit/miss counters of the underlying cache are bumped once.
+        """
+        key = self.cache.make_key(dialect, sql_query)
+        target = key
+        if key not in self.cache and not is_sensitive:
+            target = self._aliases.get(self._signature(dialect, sql_query), key)
+        return key, self.cache.get_by_key(target)
+
+    def store(
+        self,
+        dialect: str,
+        sql_query: str,
+        key: str,
+        result: QueryResult,
+        is_sensitive: bool = False,
+    ) -> None:
+        """Store *result* under *key* and index its canonical signature.
+
+        The entry is linked to the tables the query reads, see
+        :meth:`invalidate`.
+        """
+        self.cache.put_by_key(key, result, referenced_tables(sql_query, dialect))
+        if is_sensitive or key not in self.cache:
+            return
+        self._aliases[self._signature(dialect, sql_query)] = key
+        if len(self._aliases) > self.max_aliases:
+            self._aliases.popitem(last=False)
+
+    def invalidate(self, dialect: str, sql_query: str) -> int:
+        """Drop the cached results that read a table *sql_query* writes.
+
+        All tables named in the statement count as written (a superset of
+        the true targets, which only costs hit rate).  When none can be
+        found the whole cache is flushed.
+
+        Returns
+        -------
+        int
+            Number of results removed (``-1`` after a full flush).
+        """
+        tables = referenced_tables(sql_query, dialect)
+        if not tables:
+            self.cache.clear()
+            self.clear()
+            return -1
+        return self.cache.invalidate_tables(tables)
+
+    def clear(self) -> None:
+        """Drop every signature alias (the underlying cache is untouched)."""
+        self._aliases.clear()
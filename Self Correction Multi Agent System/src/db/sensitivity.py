@@ -0,0 +1,67 @@
+"""
+Rule-based detection of sensitive (state-modifying) SQL.
+
+The planner used to ask the LLM to set ``SQLQuery.is_sensitive``; a
+precompiled regex over the generated statement is both cheaper and
+deterministic.  Because it is the only approval gate it is an
+**allow-list**: after stripping comments and string literals, every
+statement must start with ``SELECT`` or ``WITH``.  Such a statement is
+still sensitive when it contains a write / DDL / privilege / procedure
+keyword at statement level or inside a CTE body (e.g. a ``WITH`` clause
+feeding a ``DELETE``, or ``WITH d AS (DELETE ... RETURNING *)``) or
+``INTO`` (``SELECT ... INTO`` creates a table).
+
+Example
+-------
+>>> from src.db.sensitivity import is_sensitive_sql
+>>> is_sensitive_sql("SELECT * FROM users")
+False
+>>> is_sensitive_sql("/* cleanup */ delete from logs")
+True
+>>> is_sensitive_sql("SELECT 1; DROP TABLE users")
+True
+>>> is_sensitive_sql("CALL purge_logs()")
+True
+"""
+
+from __future__ import annotations
+
+import re
+
+# One left-to-right scan, so a quote inside a comment (or ``--`` inside a
+# literal) cannot hide the rest of the statement
+_NOISE_RE = re.compile(r"'(?:[^']|'')*'|--[^\n]*|/\*.*?\*/", re.DOTALL)
+_READ_ONLY_RE = re.compile(r"[\s(]*(?:SELECT|WITH)\b", re.IGNORECASE)
+_KEYWORDS = (
+    "DELETE|UPDATE|DROP|TRUNCATE|ALTER|INSERT|GRANT|REVOKE|MERGE|CREATE|"
+    "REPLACE|RENAME|EXEC|EXECUTE|CALL|COPY|VACUUM|ATTACH|DETACH"
+)
+# Statement-leading keyword, a data-modifying CTE body after ``(``, the
+# statement that follows a CTE's ``)``, or ``INTO`` anywhere
+_SENSITIVE_RE = re.compile(
+    rf"(?:^|;|\(|\))\s*(?:{_KEYWORDS})\b|\bINTO\b", re.IGNORECASE
+)
+
+
+def _strip_noise(match: re.Match) -> str:
+    return "''" if match.group().startswith("'") else " "
+
+
+def is_sensitive_sql(sql_query: str) -> bool:
+    """Return ``True`` unless *sql_query* only reads data.
+
+    Parameters
+    ----------
+    sql_query : str
+        Raw SQL string (may contain several statements and comments).
+
+    Returns
+    -------
+    bool
+        Whether the query needs human approval before execution.
+    """
+    sql = _NOISE_RE.sub(_strip_noise, sql_query)
+    statements = [s for s in sql.split(";") if s.strip()]
+    if any(not _READ_ONLY_RE.match(statement) for statement in statements):
+        return True
+    return _SENSITIVE_RE.search(sql) is not None
@@ -5,8 +5,10 @@ Re-exports
 ----------
 - :func:`build_sql_agent_graph`
 - :func:`compile_graph`
+- :class:`BatchedMemorySaver`
 """
 
 from src.graph.builder import build_sql_agent_graph, compile_graph
+from src.graph.checkpoint import BatchedMemorySaver
 
-__all__ = ["build_sql_agent_graph", "compile_graph"]
+__all__ = ["build_sql_agent_graph", "compile_graph", "BatchedMemorySaver"]
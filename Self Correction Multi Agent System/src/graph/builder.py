@@ -2,8 +2,9 @@
 Graph builder — assembles and compiles the LangGraph state machine.
 
 This module wires together all nodes and conditional edges into the
-final ``StateGraph[AgentState]``, then compiles it with a
-``MemorySaver`` checkpointer for conversation-thread persistence.
+final ``StateGraph[AgentState]``, then compiles it with an in-memory
+checkpointer for conversation-thread persistence (by default one that only
+stores the latest checkpoint of each run; see :mod:`src.graph.checkpoint`).
 
 Graph topology
 --------------
@@ -18,6 +19,8 @@ Graph topology
                                                            ▼
                                                        Debugger ──► Executor (retry)
 
+A repeated question answered from the answer cache goes Planner ──► END.
+
 Example
 -------
 >>> from src.graph.builder import build_sql_agent_graph, compile_graph
@@ -32,6 +35,7 @@ from __future__ import annotations
 from langgraph.checkpoint.memory import MemorySaver
 from langgraph.graph import END, StateGraph
 
+from src.graph.checkpoint import BatchedMemorySaver, state_serde
 from src.models.state import AgentState
 from src.nodes.answer import generate_answer_node
 from src.nodes.approval import human_approval
@@ -80,6 +84,7 @@ def build_sql_agent_graph() -> StateGraph:
         {
             "human_approval": "human_approval",
             "executor": "executor",
+            "end": END,  # answer served from cache
         },
     )
 
@@ -114,6 +119,7 @@ def compile_graph(
     workflow: StateGraph | None = None,
     *,
     checkpointer=None,
+    checkpoint_mode: str = "end_of_workflow",
 ):
     """Compile the workflow into an executable LangGraph app.
 
@@ -123,13 +129,24 @@ def compile_graph(
         Pre-built workflow.  If ``None``, calls
         :func:`build_sql_agent_graph` internally.
     checkpointer
-        LangGraph checkpointer (default: in-memory ``MemorySaver``).
+        LangGraph checkpointer.  If ``None``, one is created according to
+        *checkpoint_mode*.
+    checkpoint_mode : {"end_of_workflow", "every_step"}
+        ``"end_of_workflow"`` uses :class:`BatchedMemorySaver`, which keeps
+        only the latest checkpoint of each run; ``"every_step"`` uses a
+        plain ``MemorySaver`` with the full step history.  Ignored when
+        *checkpointer* is given.
 
     Returns
     -------
     CompiledStateGraph
         Ready-to-invoke agent application.
 
+    Raises
+    ------
+    ValueError
+        If *checkpoint_mode* is not recognised.
+
     Example
     -------
     >>> app = compile_graph()
@@ -138,6 +155,11 @@ def compile_graph(
     if workflow is None:
         workflow = build_sql_agent_graph()
     if checkpointer is None:
-        checkpointer = MemorySaver()
+        if checkpoint_mode == "end_of_workflow":
+            checkpointer = BatchedMemorySaver(serde=state_serde())
+        elif checkpoint_mode == "every_step":
+            checkpointer = MemorySaver(serde=state_serde())
+        else:
+            raise ValueError(f"Unknown checkpoint_mode: {checkpoint_mode!r}")
 
     return workflow.compile(checkpointer=checkpointer)
@@ -0,0 +1,120 @@
+"""
+End-of-workflow checkpointing for the agent graph.
+
+LangGraph hands the checkpointer a full checkpoint after **every**
+super-step.  ``MemorySaver`` serialises each one — including the
+``messages`` list and the multi-KB ``db_schema`` — although the app only
+ever resumes from the latest.  :class:`BatchedMemorySaver` keeps the most
+recent checkpoint per thread in memory, unserialised, and writes it to the
+underlying ``MemorySaver`` storage only when the checkpointer is next read
+(resuming after an interrupt, ``get_state``, a new run on the same
+thread).  Intermediate checkpoints are never serialised.
+
+Pending task writes are still stored immediately, so a run interrupted at
+human approval resumes exactly as with ``MemorySaver``.
+
+Example
+-------
+>>> from src.graph.builder import compile_graph
+>>> app = compile_graph(checkpoint_mode="end_of_workflow")
+>>> type(app.checkpointer).__name__
+'BatchedMemorySaver'
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+# Pydantic models held in AgentState; allow-listed so a resumed run (e.g.
+# after human approval) may restore them from a checkpoint
+_STATE_TYPES = [
+    ("src.models.schemas", name)
+    for name in ("SQLQuery", "QueryResult", "ValidationResult", "DebuggerAnalysis")
+]
+
+
+def state_serde() -> JsonPlusSerializer:
+    """Checkpoint serializer that allows the agent's state models."""
+    try:
+        return JsonPlusSerializer(allowed_msgpack_modules=_STATE_TYPES)
+    except TypeError:  # older LangGraph: no allow-list, everything loads
+        return JsonPlusSerializer()
+
+
+class BatchedMemorySaver(MemorySaver):
+    """``MemorySaver`` that persists only the latest checkpoint of a run.
+
+    Checkpoint values are held by reference until flushed; graph state
+    reducers return new objects, so they are not mutated in the meantime.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._lock = threading.RLock()
+        # (thread_id, checkpoint_ns) → (config, checkpoint, metadata, versions)
+        self._pending: dict[tuple[str, str], tuple] = {}
+        # (thread_id, checkpoint_ns) → id of the last checkpoint written
+        self._flushed: dict[tuple[str, str], str] = {}
+
+    def put(self, config, checkpoint, metadata, new_versions):
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"]["checkpoint_ns"]
+        slot = (thread_id, checkpoint_ns)
+        with self._lock:
+            previous = self._pending.get(slot)
+            if previous is not None:
+                # Superseded: its task writes are folded into *checkpoint*
+                self.writes.pop((*slot, previous[1]["id"]), None)
+                new_versions = {**previous[3], **new_versions}
+            self._pending[slot] = (config, checkpoint, metadata, new_versions)
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+
+    def flush(self) -> None:
+        """Write every buffered checkpoint to the underlying storage."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            for slot, (config, checkpoint, metadata, versions) in pending.items():
+                configurable = dict(config["configurable"])
+                # Parent is the last *stored* checkpoint, not a dropped one
+                configurable["checkpoint_id"] = self._flushed.get(slot)
+                versions = {
+                    k: checkpoint["channel_versions"].get(k, v)
+                    for k, v in versions.items()
+                }
+                super().put(
+                    {**config, "configurable": configurable},
+                    checkpoint,
+                    metadata,
+                    versions,
+                )
+                self._flushed[slot] = checkpoint["id"]
+
+    def get_tuple(self, config):
+        self.flush()
+        return super().get_tuple(config)
+
+    def list(self, config, **kwargs):
+        self.flush()
+        return super().list(config, **kwargs)
+
+    def get_delta_channel_history(self, *args, **kwargs):
+        self.flush()
+        return super().get_delta_channel_history(*args, **kwargs)
+
+    def delete_thread(self, thread_id: str) -> None:
+        with self._lock:
+            for slot in [s for s in self._pending if s[0] == thread_id]:
+                del self._pending[slot]
+            for slot in [s for s in self._flushed if s[0] == thread_id]:
+                del self._flushed[slot]
+        super().delete_thread(thread_id)
@@ -19,6 +19,14 @@ Environment variables
 ``LLM_TEMPERATURE``
     Sampling temperature override (default ``0``).
 
+``LLM_MODEL`` / ``LLM_TEMPERATURE`` are resolved once per process; call
+``_default_model.cache_clear()`` (and ``_default_temperature``) after
+changing them at runtime.
+
+A ``.env`` file is read by :func:`_ensure_dotenv` on the first
+:func:`get_llm` call (and by ``DatabaseManager.get_engine`` and the CLI)
+rather than at import, so importing the package touches no files.
+
 Example
 -------
 >>> from src.llm.provider import get_llm
@@ -30,14 +38,34 @@ Example
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 
 from dotenv import load_dotenv
 
-load_dotenv()
-
 # ---- Defaults -----------------------------------------------------------
 _DEFAULT_MODEL = "llama-3.3-70b-versatile"
 _DEFAULT_TEMPERATURE = 0.0
+_API_KEY_ENV = {"groq": "GROQ_API_KEY", "openai": "OPENAI_API_KEY"}
+
+_DOTENV_LOADED = False
+
+
+def _ensure_dotenv() -> None:
+    """Load ``.env`` into the environment once per process."""
+    global _DOTENV_LOADED
+    if not _DOTENV_LOADED:
+        load_dotenv()
+        _DOTENV_LOADED = True
+
+
+@lru_cache(maxsize=1)
+def _default_model() -> str:
+    return os.getenv("LLM_MODEL", _DEFAULT_MODEL).strip().lower()
+
+
+@lru_cache(maxsize=1)
+def _default_temperature() -> float:
+    return float(os.getenv("LLM_TEMPERATURE", str(_DEFAULT_TEMPERATURE)))
 
 
 def get_llm(
@@ -46,7 +74,10 @@ def get_llm(
     temperature: float | None = None,
     **kwargs,
 ):
-    """Create and return a LangChain chat model.
+    """Return a shared LangChain chat model.
+
+    Instances are cached per ``(provider, model, temperature, kwargs)``, so
+    every node reuses one client and its HTTP connection pool.
 
     Parameters
     ----------
@@ -80,24 +111,42 @@ def get_llm(
     >>> type(llm_oai).__name__
     'ChatOpenAI'
     """
-    resolved_model = (
-        model
-        or os.getenv("LLM_MODEL", _DEFAULT_MODEL)
-    ).strip().lower()
+    _ensure_dotenv()
 
+    resolved_model = model.strip().lower() if model else _default_model()
     resolved_temp = (
-        temperature
-        if temperature is not None
-        else float(os.getenv("LLM_TEMPERATURE", str(_DEFAULT_TEMPERATURE)))
+        temperature if temperature is not None else _default_temperature()
     )
 
+    # The API key is part of the cache key so a rotated key gets a new client
+    api_key = os.getenv(_API_KEY_ENV.get(provider, ""))
+    args = (provider, resolved_model, resolved_temp, api_key)
+    extra = tuple(sorted(kwargs.items()))
+    try:
+        hash(extra)
+    except TypeError:  # unhashable kwargs (e.g. a dict): build uncached
+        return _build_llm.__wrapped__(*args, extra)
+    return _build_llm(*args, extra)
+
+
+@lru_cache(maxsize=8)
+def _build_llm(
+    provider: str,
+    model: str,
+    temperature: float,
+    api_key: str | None,
+    extra: tuple,
+):
+    """Instantiate the chat model; cached so every node shares one client."""
+    kwargs = dict(extra)
+
     if provider == "groq":
         from langchain_groq import ChatGroq
 
         return ChatGroq(
-            model=resolved_model,
-            temperature=resolved_temp,
-            api_key=os.getenv("GROQ_API_KEY"),
+            model=model,
+            temperature=temperature,
+            api_key=api_key,
             **kwargs,
         )
 
@@ -105,9 +154,9 @@ def get_llm(
         from langchain_openai import ChatOpenAI
 
         return ChatOpenAI(
-            model=resolved_model,
-            temperature=resolved_temp,
-            api_key=os.getenv("OPENAI_API_KEY"),
+            model=model,
+            temperature=temperature,
+            api_key=api_key,
             **kwargs,
         )
 
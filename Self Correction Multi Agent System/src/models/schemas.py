@@ -9,6 +9,16 @@ the agent pipeline.  Each model maps to a specific stage:
 - **ValidationResult** — Validator output (issues / suggestions)
 - **DebuggerAnalysis** — Debugger output (root-cause + corrected SQL)
 
+Serialisation is left to pydantic-core: its native ``model_dump_json``
+(Rust) outperforms ``orjson.dumps(model.model_dump())`` on these models,
+and LangGraph checkpoints them with its own msgpack serializer anyway.
+
+Validation runs only where data enters from outside (LLM structured
+output, user input).  Internally built instances — ``QueryResult`` from
+driver rows, the debugger's corrected ``SQLQuery`` — use
+``model_construct``; ``QueryResult.byte_size`` is still computed there,
+since ``model_construct`` calls ``model_post_init``.
+
 Example
 -------
 >>> from src.models.schemas import SQLQuery
@@ -24,9 +34,11 @@ False
 
 from __future__ import annotations
 
-from typing import List, Literal, Optional
+import sys
+from typing import Any, List, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+from pydantic.json_schema import SkipJsonSchema
 
 
 class SQLQuery(BaseModel):
@@ -40,6 +52,8 @@ class SQLQuery(BaseModel):
         Human-readable explanation of what the query does.
     is_sensitive : bool
         ``True`` when the query modifies data (DELETE, UPDATE, DROP, …).
+        Not part of the LLM output schema: the planner sets it with
+        :func:`~src.db.sensitivity.is_sensitive_sql`.
     dialect : str
         Target SQL dialect (MySQL, PostgreSQL, SQLite, SQL Server, Oracle).
 
@@ -57,8 +71,9 @@ class SQLQuery(BaseModel):
 
     query: str = Field(description="The SQL query to be executed.")
     explanation: str = Field(description="Explanation of what the query does")
-    is_sensitive: bool = Field(
-        description="Whether the query modifies data (DELETE, UPDATE, DROP)"
+    is_sensitive: SkipJsonSchema[bool] = Field(
+        default=False,
+        description="Whether the query modifies data (DELETE, UPDATE, DROP)",
     )
     dialect: Literal["MySQL", "PostgreSQL", "SQLite", "SQL Server", "Oracle"] = Field(
         description="The SQL dialect of the query.",
@@ -79,6 +94,12 @@ class QueryResult(BaseModel):
         Error description when ``success`` is ``False``.
     row_count : int
         Number of rows returned / affected.
+    truncated : bool
+        ``True`` when more rows matched than were fetched (see
+        ``DB_MAX_ROWS``); ``row_count`` then counts only the fetched rows.
+    byte_size : int
+        Approximate in-memory size, computed once at construction (used by
+        :class:`~src.db.cache.QueryCache` for its memory budget).
 
     Example
     -------
@@ -91,6 +112,21 @@ class QueryResult(BaseModel):
     data: Optional[List[dict]] = None
     error_message: Optional[str] = None
     row_count: int = 0
+    truncated: bool = False
+
+    _byte_size: int = PrivateAttr(default=0)
+
+    def model_post_init(self, __context: Any) -> None:
+        # Shallow walk of rows + cell values: no serialisation needed
+        size = 256 + sys.getsizeof(self.error_message or "")
+        getsizeof = sys.getsizeof
+        for row in self.data or ():
+            size += getsizeof(row) + sum(getsizeof(v) for v in row.values())
+        self._byte_size = size
+
+    @property
+    def byte_size(self) -> int:
+        return self._byte_size
 
 
 class ValidationResult(BaseModel):
@@ -81,7 +81,12 @@ class AgentState(TypedDict):
         *Set by*: ``run_agent`` (initial state).
     final_answer : str | None
         Natural-language answer generated from validated results.
-        *Set by*: ``generate_answer_node``.
+        *Set by*: ``generate_answer_node`` (or ``sql_planner`` on an
+        answer-cache hit).
+    answer_from_cache : bool
+        ``True`` when the Planner served ``final_answer`` from the answer
+        cache; the graph then ends without executing any SQL.
+        *Set by*: ``sql_planner``.
     messages : list
         LangGraph message accumulator (uses ``add_messages`` reducer).
         *Appended by*: all nodes.
@@ -112,4 +117,5 @@ class AgentState(TypedDict):
     retry_count: int
     max_retries: int
     final_answer: Optional[str]
+    answer_from_cache: bool
     messages: Annotated[list, add_messages]
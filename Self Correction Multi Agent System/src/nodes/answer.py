@@ -15,21 +15,19 @@ The top 5 customers by revenue are …
 
 from __future__ import annotations
 
-import json
+from operator import itemgetter
 
+import orjson
 from langchain_core.messages import HumanMessage, SystemMessage
 
 from src.llm.provider import get_llm
 from src.models.state import AgentState
+from src.nodes.executor import _get_db_manager
 
-_llm = None
-
-
-def _get_llm():
-    global _llm
-    if _llm is None:
-        _llm = get_llm()
-    return _llm
+# Every state key the node reads, fetched in one call
+_pull = itemgetter(
+    "execution_result", "user_question", "generated_sql", "dialect", "db_schema"
+)
 
 
 def generate_answer_node(state: AgentState) -> dict:
@@ -39,18 +37,22 @@ def generate_answer_node(state: AgentState) -> dict:
     ----------
     state : AgentState
         Must contain ``execution_result``, ``user_question``,
-        ``generated_sql``.
+        ``generated_sql``, ``dialect``, ``db_schema``.
 
     Returns
     -------
     dict
         Keys: ``final_answer`` (str), ``messages``.
     """
-    llm = _get_llm()
+    llm = get_llm()
 
-    execution_result = state["execution_result"]
-    user_question = state["user_question"]
-    sql = state["generated_sql"]
+    execution_result, user_question, sql, dialect, schema = _pull(state)
+
+    truncated_note = (
+        " (truncated: more rows matched than were fetched)"
+        if execution_result.truncated
+        else ""
+    )
 
     system_prompt = (
         "You are a data analyst. Convert the SQL results into a clear, "
@@ -65,17 +67,24 @@ def generate_answer_node(state: AgentState) -> dict:
                 content=f"""
 Question: {user_question}
 SQL Used: {sql.query}
-Results: {json.dumps(
+Results: {orjson.dumps(
     execution_result.data[:20] if execution_result.data else [],
     default=str,
-)}
-Total Rows: {execution_result.row_count}
+    option=orjson.OPT_SERIALIZE_NUMPY,
+).decode()}
+Total Rows: {execution_result.row_count}{truncated_note}
 
 Provide a comprehensive answer."""
             ),
         ]
     )
 
+    # Read-only answers are reusable until the schema or the data changes
+    if not sql.is_sensitive:
+        _get_db_manager().answer_cache.put(
+            user_question, dialect, schema, response.content
+        )
+
     return {
         "final_answer": response.content,
         "messages": [HumanMessage(content=response.content)],
@@ -2,35 +2,36 @@
 Human approval gate for sensitive SQL queries.
 
 This node pauses the pipeline and asks the user to approve any query
-flagged as *sensitive* (DELETE, UPDATE, DROP, TRUNCATE, ALTER).
+flagged as *sensitive* (DELETE, UPDATE, DROP, TRUNCATE, ALTER, …).
 
-In a **production** environment you would replace the ``input()`` call
-with an async callback, a Slack webhook, or an API endpoint.
+The pause is LangGraph's :func:`~langgraph.types.interrupt`: the run
+stops after checkpointing, nothing blocks on a terminal read, and the
+caller resumes the same thread with ``Command(resume="yes")`` (anything
+else rejects).  The CLI prompts on stdin between the two calls; the
+Streamlit app shows Approve / Reject buttons.
 
 Example
 -------
->>> # In an interactive session:
->>> from src.nodes.approval import human_approval
->>> state = {
-...     "generated_sql": SQLQuery(
-...         query="DROP TABLE logs",
-...         explanation="Remove the logs table",
-...         is_sensitive=True,
-...         dialect="MySQL",
-...     ),
-... }
->>> output = human_approval(state)   # prompts for input
+>>> from langgraph.types import Command
+>>> config = {"configurable": {"thread_id": "t1"}}
+>>> for chunk in app.stream(initial_state, config=config):
+...     if "__interrupt__" in chunk:
+...         print(chunk["__interrupt__"][0].value["query"])
+DROP TABLE logs
+>>> for chunk in app.stream(Command(resume="yes"), config=config):
+...     ...
 """
 
 from __future__ import annotations
 
 from langchain_core.messages import HumanMessage
+from langgraph.types import interrupt
 
 from src.models.state import AgentState
 
 
 def human_approval(state: AgentState) -> dict:
-    """Prompt the user to approve or reject a sensitive query.
+    """Pause for the user to approve or reject a sensitive query.
 
     Parameters
     ----------
@@ -44,23 +45,18 @@ def human_approval(state: AgentState) -> dict:
 
     Notes
     -----
-    * In notebook / CLI mode this blocks on ``input()``.
-    * Replace with an async callback for web / API deployments.
+    The interrupt payload is a dict with ``query`` and ``explanation``.
+    The resume value may be ``"yes"`` (case-insensitive) or ``True`` to
+    approve.
     """
     sql_query = state["generated_sql"]
 
-    print("\n" + "=" * 60)
-    print("⚠️  SENSITIVE QUERY REQUIRES APPROVAL")
-    print("=" * 60)
-    print(f"\nQuery: {sql_query.query}")
-    print(f"\nExplanation: {sql_query.explanation}")
-    print("\nThis query will modify data. Do you approve?")
-
-    approval = (
-        input("Type 'yes' to approve, anything else to reject: ").strip().lower()
+    decision = interrupt(
+        {"query": sql_query.query, "explanation": sql_query.explanation}
     )
+    approved = decision is True or str(decision).strip().lower() == "yes"
 
     return {
-        "human_approved": approval == "yes",
-        "messages": [HumanMessage(content=f"Human approval: {approval == 'yes'}")],
+        "human_approved": approved,
+        "messages": [HumanMessage(content=f"Human approval: {approved}")],
     }
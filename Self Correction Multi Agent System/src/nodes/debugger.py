@@ -23,20 +23,48 @@ Example
 
 from __future__ import annotations
 
+import re
+from functools import lru_cache
+from operator import itemgetter
+
 from langchain_core.messages import HumanMessage, SystemMessage
 
+from src.db.sensitivity import is_sensitive_sql
 from src.llm.provider import get_llm
 from src.models.schemas import DebuggerAnalysis, SQLQuery
 from src.models.state import AgentState
+from src.nodes.executor import _get_db_manager
+
+# Errors that suggest the (question-trimmed) schema lacked a needed object
+_MISSING_OBJECT_RE = re.compile(
+    r"no such (?:table|column)|unknown (?:table|column)|does(?:n't| not) exist"
+    r"|invalid object name|invalid column name",
+    re.IGNORECASE,
+)
+
+# Every state key the node reads, fetched in one call
+_pull = itemgetter(
+    "execution_result",
+    "validation_result",
+    "generated_sql",
+    "db_schema",
+    "dialect",
+    "user_question",
+)
+
+
+@lru_cache(maxsize=8)
+def _debugger_prefix(dialect: str, schema: str) -> str:
+    """Static head of the debugger prompt, built once per (dialect, schema)."""
+    return f"""You are an expert SQL debugger. Analyze the failed query and provide a corrected version.
 
-_llm = None
+DATABASE DIALECT: {dialect}
 
+DATABASE SCHEMA:
+{schema}
 
-def _get_llm():
-    global _llm
-    if _llm is None:
-        _llm = get_llm()
-    return _llm
+ORIGINAL QUERY:
+"""
 
 
 def debugger_node(state: AgentState) -> dict:
@@ -54,14 +82,11 @@ def debugger_node(state: AgentState) -> dict:
         Keys: ``debugger_analysis``, ``generated_sql`` (corrected),
         ``retry_count``, ``messages``.
     """
-    llm = _get_llm()
+    llm = get_llm()
 
-    execution_result = state["execution_result"]
-    validation_result = state["validation_result"]
-    sql = state["generated_sql"]
-    schema = state["db_schema"]
-    dialect = state["dialect"]
-    user_question = state["user_question"]
+    execution_result, validation_result, sql, schema, dialect, user_question = (
+        _pull(state)
+    )
 
     # Collect all error information
     error_info: list[str] = []
@@ -70,20 +95,17 @@ def debugger_node(state: AgentState) -> dict:
     if validation_result and not validation_result.is_valid:
         error_info.extend(validation_result.issues)
 
-    system_prompt = f"""You are an expert SQL debugger. Analyze the failed query and provide a corrected version.
-
-DATABASE DIALECT: {dialect}
-
-DATABASE SCHEMA:
-{schema}
+    # The planner only sent the tables the question names; if the failure
+    # points at a missing table/column, show the debugger everything
+    if any(_MISSING_OBJECT_RE.search(err) for err in error_info):
+        schema = _get_db_manager().get_schema(dialect)
 
-ORIGINAL QUERY:
-{sql.query}
-
-ERRORS:
-{chr(10).join(error_info)}
-
-Analyze the root cause and provide a corrected query that will work."""
+    system_prompt = (
+        _debugger_prefix(dialect, schema)
+        + f"{sql.query}\n\nERRORS:\n"
+        + "\n".join(error_info)
+        + "\n\nAnalyze the root cause and provide a corrected query that will work."
+    )
 
     response = llm.with_structured_output(DebuggerAnalysis).invoke(
         [
@@ -92,11 +114,12 @@ Analyze the root cause and provide a corrected query that will work."""
         ]
     )
 
-    # Replace the generated SQL with the corrected version
-    corrected_sql = SQLQuery(
+    # Replace the generated SQL with the corrected version; the fields come
+    # from an already validated DebuggerAnalysis, so skip re-validation
+    corrected_sql = SQLQuery.model_construct(
         query=response.corrected_query,
         explanation=f"Corrected: {response.root_cause}",
-        is_sensitive=sql.is_sensitive,
+        is_sensitive=is_sensitive_sql(response.corrected_query),
         dialect=dialect,
     )
 
@@ -50,7 +50,9 @@ def sql_executor_node(state: AgentState) -> dict:
     sql = state["generated_sql"]
     dialect = state["dialect"]
 
-    result, from_cache = db_manager.execute_query(dialect, sql.query)
+    result, from_cache = db_manager.execute_query(
+        dialect, sql.query, is_sensitive=sql.is_sensitive
+    )
     source = "📦 cache" if from_cache else "🗄️ database"
 
     return {
@@ -25,30 +25,64 @@ Example
 
 from __future__ import annotations
 
+import re
+from difflib import get_close_matches
+from functools import lru_cache
+from operator import itemgetter
+
 from langchain_core.messages import HumanMessage, SystemMessage
 
-from src.db.manager import DatabaseManager
+from src.db.sensitivity import is_sensitive_sql
 from src.llm.provider import get_llm
 from src.models.schemas import SQLQuery
 from src.models.state import AgentState
+from src.nodes.executor import _get_db_manager  # shared: one set of caches
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
 
-# Module-level singletons (lazy; override in tests via dependency injection)
-_db_manager: DatabaseManager | None = None
-_llm = None
+# Required state keys, fetched in one call (optional ones use .get)
+_pull = itemgetter("dialect", "user_question")
 
 
-def _get_db_manager() -> DatabaseManager:
-    global _db_manager
-    if _db_manager is None:
-        _db_manager = DatabaseManager()
-    return _db_manager
+def _match_tables(question: str, tables: list[str]) -> set[str]:
+    """Tables the question refers to, by name or a close misspelling.
 
+    ``order_items`` matches "order items"; ``customers`` matches
+    "customer" and "custmers".  Table names shorter than three characters
+    only match exactly.
+    """
+    words = _WORD_RE.findall(question.lower())
+    phrase = f" {' '.join(words)} "
+    matched: set[str] = set()
+    for table in tables:
+        name = table.lower()
+        spaced = " ".join(_WORD_RE.findall(name))
+        stem = spaced[:-1] if spaced.endswith("s") and len(spaced) > 3 else spaced
+        if f" {spaced} " in phrase or (
+            len(stem) >= 3 and re.search(rf" {re.escape(stem)}(?:e?s)? ", phrase)
+        ):
+            matched.add(table)
+        elif len(name) >= 3 and get_close_matches(name, words, n=1, cutoff=0.8):
+            matched.add(table)
+    return matched
+
+
+@lru_cache(maxsize=8)
+def _planner_prefix(dialect: str, schema: str) -> str:
+    """Static head of the planner prompt, built once per (dialect, schema)."""
+    return f"""You are an expert SQL developer. Generate a SQL query for the {dialect} database.
 
-def _get_llm():
-    global _llm
-    if _llm is None:
-        _llm = get_llm()
-    return _llm
+DATABASE SCHEMA:
+{schema}
+
+RULES:
+1. Use only tables and columns that exist in the schema
+2. Use proper {dialect} syntax
+3. For aggregations, always include GROUP BY
+4. Use appropriate JOINs when accessing multiple tables
+5. Return results in a structured format
+
+"""
 
 
 def sql_planner(state: AgentState) -> dict:
@@ -58,40 +92,58 @@ def sql_planner(state: AgentState) -> dict:
     ----------
     state : AgentState
         Must contain ``user_question``, ``dialect``.
-        Optional: ``db_schema`` (if missing it will be introspected),
+        Optional: ``db_schema`` (if missing it will be introspected and
+        trimmed to the tables the question mentions),
         ``debugger_analysis`` (used on retries).
 
     Returns
     -------
     dict
         Keys: ``generated_sql``, ``db_schema``,
-        ``requires_human_approval``, ``messages``.
+        ``requires_human_approval``, ``messages`` — or, when the question
+        was answered before, ``final_answer`` and ``answer_from_cache``.
     """
     db_manager = _get_db_manager()
-    llm = _get_llm()
 
-    dialect = state["dialect"]
-    schema = state.get("db_schema") or db_manager.get_schema(dialect)
-    user_question = state["user_question"]
+    dialect, user_question = _pull(state)
+    schema = state.get("db_schema")
+    if not schema:
+        # Only the tables the question names (plus FK neighbours) go to the
+        # LLM; with no recognisable table name, the whole schema does.
+        tables = _match_tables(user_question, db_manager.get_table_names(dialect))
+        schema = (
+            db_manager.get_schema_for_tables(dialect, tables)
+            if tables
+            else db_manager.get_schema(dialect)
+        )
+
+    # Same question against the same schema: reuse the previous answer
+    cached_answer = db_manager.answer_cache.get(user_question, dialect, schema)
+    if cached_answer is not None:
+        return {
+            "final_answer": cached_answer,
+            "answer_from_cache": True,
+            "db_schema": schema,
+            "requires_human_approval": False,
+            "messages": [HumanMessage(content="Answer served from cache")],
+        }
+
+    llm = get_llm()
 
     # Incorporate debugger feedback on retries
     debug_analysis = state.get("debugger_analysis")
 
-    system_prompt = f"""You are an expert SQL developer. Generate a SQL query for the {dialect} database.
-
-DATABASE SCHEMA:
-{schema}
-
-RULES:
-1. Use only tables and columns that exist in the schema
-2. Use proper {dialect} syntax
-3. For aggregations, always include GROUP BY
-4. Use appropriate JOINs when accessing multiple tables
-5. Mark queries as sensitive if they contain DELETE, UPDATE, DROP, TRUNCATE, or ALTER. Use true or false for boolean fields.
-6. Return results in a structured format
-
-{"PREVIOUS ERROR - FIX THIS:" + chr(10) + debug_analysis.root_cause + chr(10) + "Suggested fix:" + debug_analysis.corrected_query if debug_analysis else ""}
-"""
+    # Cached static prefix + dynamic tail, concatenated once
+    parts = [_planner_prefix(dialect, schema)]
+    if debug_analysis:
+        parts += (
+            "PREVIOUS ERROR - FIX THIS:\n",
+            debug_analysis.root_cause,
+            "\nSuggested fix:",
+            debug_analysis.corrected_query,
+        )
+    parts.append("\n")
+    system_prompt = "".join(parts)
 
     response = llm.with_structured_output(SQLQuery).invoke(
         [
@@ -100,6 +152,9 @@ RULES:
         ]
     )
 
+    # Decided by rule, not by the LLM (the field is hidden from its schema)
+    response.is_sensitive = is_sensitive_sql(response.query)
+
     return {
         "generated_sql": response,
         "db_schema": schema,
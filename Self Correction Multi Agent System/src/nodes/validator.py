@@ -21,23 +21,13 @@ True
 
 from __future__ import annotations
 
-import json
-
+import orjson
 from langchain_core.messages import HumanMessage, SystemMessage
 
 from src.llm.provider import get_llm
 from src.models.schemas import ValidationResult
 from src.models.state import AgentState
 
-_llm = None
-
-
-def _get_llm():
-    global _llm
-    if _llm is None:
-        _llm = get_llm()
-    return _llm
-
 
 def result_validator(state: AgentState) -> dict:
     """Validate query results using quick checks + LLM semantic analysis.
@@ -54,7 +44,7 @@ def result_validator(state: AgentState) -> dict:
         Keys: ``validation_result`` (:class:`ValidationResult`),
         ``messages``.
     """
-    llm = _get_llm()
+    llm = get_llm()
 
     execution_result = state["execution_result"]
     user_question = state["user_question"]
@@ -101,10 +91,11 @@ Return your analysis."""
                 content=f"""
 User Question: {user_question}
 SQL Query: {sql.query}
-Results (first 5 rows): {json.dumps(
+Results (first 5 rows): {orjson.dumps(
     execution_result.data[:5] if execution_result.data else [],
     default=str,
-)}
+    option=orjson.OPT_SERIALIZE_NUMPY,
+).decode()}
 Row Count: {execution_result.row_count}
 """
             ),
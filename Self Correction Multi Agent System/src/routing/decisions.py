@@ -7,7 +7,7 @@ that maps to the next node in the LangGraph conditional edges.
 Functions
 ---------
 ``should_get_approval``
-    Planner → Human Approval *or* Executor.
+    Planner → Human Approval, Executor, *or* END (cached answer).
 ``check_approval_results``
     Human Approval → Executor *or* END.
 ``should_retry_or_complete``
@@ -29,26 +29,38 @@ from langgraph.graph import END
 
 from src.models.state import AgentState
 
+# (attempt failed, retries left) → next step after validation
+_RETRY_ROUTES: dict[tuple[bool, bool], Literal["debugger", "answer", "end"]] = {
+    (False, True): "answer",
+    (False, False): "answer",
+    (True, True): "debugger",
+    (True, False): "end",  # max retries exhausted
+}
+
 
 def should_get_approval(
     state: AgentState,
-) -> Literal["human_approval", "executor"]:
+) -> Literal["human_approval", "executor", "end"]:
     """Route based on whether the query needs human approval.
 
     Parameters
     ----------
     state : AgentState
-        Must contain ``requires_human_approval``.
+        Must contain ``requires_human_approval``.  Optional:
+        ``answer_from_cache``.
 
     Returns
     -------
-    ``"human_approval"`` if the query is sensitive, else ``"executor"``.
+    ``"end"`` if the Planner served a cached answer, ``"human_approval"``
+    if the query is sensitive, else ``"executor"``.
 
     Example
     -------
     >>> should_get_approval({"requires_human_approval": False})
     'executor'
     """
+    if state.get("answer_from_cache"):
+        return "end"
     if state.get("requires_human_approval", False):
         return "human_approval"
     return "executor"
@@ -114,15 +126,8 @@ def should_retry_or_complete(
     """
     validation = state.get("validation_result")
     execution = state.get("execution_result")
-    retry_count = state.get("retry_count", 0)
-    max_retries = state.get("max_retries", 3)
-
-    # Execution or validation failure
-    if (execution and not execution.success) or (
-        validation and not validation.is_valid
-    ):
-        if retry_count < max_retries:
-            return "debugger"
-        return "end"  # max retries exhausted
-
-    return "answer"
+    failed = (execution is not None and not execution.success) or (
+        validation is not None and not validation.is_valid
+    )
+    retries_left = state.get("retry_count", 0) < state.get("max_retries", 3)
+    return _RETRY_ROUTES[failed, retries_left]
@@ -0,0 +1,52 @@
+"""
+Unit tests for the interrupt-based human approval node.
+
+Run::
+
+    pytest tests/test_approval.py -v
+"""
+
+import pytest
+from langgraph.graph import END, StateGraph
+from langgraph.types import Command
+
+from src.graph.checkpoint import BatchedMemorySaver, state_serde
+from src.models.schemas import SQLQuery
+from src.models.state import AgentState
+from src.nodes.approval import human_approval
+
+
+def _approval_app():
+    graph = StateGraph(AgentState)
+    graph.add_node("human_approval", human_approval)
+    graph.set_entry_point("human_approval")
+    graph.add_edge("human_approval", END)
+    return graph.compile(checkpointer=BatchedMemorySaver(serde=state_serde()))
+
+
+def _state() -> dict:
+    sql = SQLQuery(query="DROP TABLE logs", explanation="Remove logs", dialect="SQLite")
+    return {"generated_sql": sql, "messages": []}
+
+
+class TestHumanApproval:
+    """Tests for pausing on interrupt() and resuming with Command."""
+
+    def test_pauses_with_query_payload(self):
+        app = _approval_app()
+        config = {"configurable": {"thread_id": "t1"}}
+        chunks = list(app.stream(_state(), config=config))
+        payload = chunks[-1]["__interrupt__"][0].value
+        assert payload == {"query": "DROP TABLE logs", "explanation": "Remove logs"}
+        assert app.get_state(config).next == ("human_approval",)
+
+    @pytest.mark.parametrize(
+        ("reply", "approved"),
+        [("yes", True), (" YES ", True), (True, True), ("no", False)],
+    )
+    def test_resume_decides_approval(self, reply, approved):
+        app = _approval_app()
+        config = {"configurable": {"thread_id": "t1"}}
+        list(app.stream(_state(), config=config))
+        app.invoke(Command(resume=reply), config=config)
+        assert app.get_state(config).values["human_approved"] is approved
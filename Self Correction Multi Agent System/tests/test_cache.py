@@ -6,7 +6,9 @@ Run::
     pytest tests/test_cache.py -v
 """
 
-from src.db.cache import QueryCache
+from concurrent.futures import ThreadPoolExecutor
+
+from src.db.cache import AnswerCache, QueryCache
 from src.models.schemas import QueryResult
 
 
@@ -50,6 +52,14 @@ class TestQueryCache:
         cached = cache.get("MySQL", "select 1")
         assert cached is not None
 
+    def test_precomputed_key_matches_dialect_and_sql(self):
+        cache = QueryCache()
+        key = cache.make_key("MySQL", "SELECT 1")
+        cache.put_by_key(key, self._make_result())
+        assert cache.get("MySQL", "select  1") is not None
+        assert cache.get_by_key(key) is not None
+        assert cache.get_by_key(cache.make_key("SQLite", "SELECT 1")) is None
+
     def test_eviction_on_size_limit(self):
         cache = QueryCache(max_size_bytes=500)  # tiny limit
         for i in range(100):
@@ -71,3 +81,65 @@ class TestQueryCache:
         assert "entries" in stats
         assert "hit_rate" in stats
         assert stats["hit_rate"] == "N/A"
+
+
+    def test_invalidate_tables_drops_dependent_entries(self):
+        cache = QueryCache()
+        cache.put_by_key("a", self._make_result(), frozenset({"users"}))
+        cache.put_by_key("b", self._make_result(), frozenset({"users", "orders"}))
+        cache.put_by_key("c", self._make_result(), frozenset({"orders"}))
+        assert cache.invalidate_tables(["users"]) == 2
+        assert "a" not in cache and "b" not in cache and "c" in cache
+        assert cache.stats()["entries"] == 1
+        assert cache.invalidate_tables(["users"]) == 0
+
+
+class TestAnswerCache:
+    """Tests for the question → answer cache."""
+
+    def test_normalised_question_hits(self):
+        answers = AnswerCache()
+        answers.put("How many users?", "SQLite", "schema", "3")
+        assert answers.get("  how MANY users ", "SQLite", "schema") == "3"
+
+    def test_operators_are_part_of_key(self):
+        answers = AnswerCache()
+        answers.put("Users with age > 30?", "SQLite", "schema", "7")
+        assert answers.get("users with age < 30", "SQLite", "schema") is None
+        assert answers.get("users with  age > 30", "SQLite", "schema") == "7"
+        assert AnswerCache.normalize_question("balance -5") != (
+            AnswerCache.normalize_question("balance 5")
+        )
+
+    def test_schema_and_dialect_are_part_of_key(self):
+        answers = AnswerCache()
+        answers.put("q", "SQLite", "schema", "3")
+        assert answers.get("q", "SQLite", "other schema") is None
+        assert answers.get("q", "MySQL", "schema") is None
+
+    def test_expired_entry_dropped(self):
+        answers = AnswerCache(ttl_seconds=-1)
+        answers.put("q", "SQLite", "schema", "3")
+        assert answers.get("q", "SQLite", "schema") is None
+        assert len(answers) == 0
+
+    def test_lru_eviction(self):
+        answers = AnswerCache(max_entries=2)
+        answers.put("a", "SQLite", "s", "1")
+        answers.put("b", "SQLite", "s", "2")
+        answers.get("a", "SQLite", "s")  # a is now most recent
+        answers.put("c", "SQLite", "s", "3")
+        assert answers.get("b", "SQLite", "s") is None
+        assert answers.get("a", "SQLite", "s") == "1"
+
+    def test_concurrent_get_and_put(self):
+        answers = AnswerCache(max_entries=4)
+
+        def churn(worker: int) -> None:
+            for i in range(2000):
+                answers.put(f"q{i % 8}", "SQLite", "s", str(worker))
+                answers.get(f"q{(i + 3) % 8}", "SQLite", "s")
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(churn, range(8)))  # re-raises any KeyError
+        assert len(answers) == 4
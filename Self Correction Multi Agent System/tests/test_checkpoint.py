@@ -0,0 +1,69 @@
+"""
+Unit tests for BatchedMemorySaver.
+
+Run::
+
+    pytest tests/test_checkpoint.py -v
+"""
+
+import operator
+from typing import Annotated, TypedDict
+
+from langgraph.graph import END, StateGraph
+
+from src.graph.checkpoint import BatchedMemorySaver
+
+
+class _State(TypedDict):
+    steps: Annotated[list, operator.add]
+
+
+def _app(saver, **compile_kwargs):
+    graph = StateGraph(_State)
+    for name in ("a", "b", "c"):
+        graph.add_node(name, lambda state, name=name: {"steps": [name]})
+    graph.set_entry_point("a")
+    graph.add_edge("a", "b")
+    graph.add_edge("b", "c")
+    graph.add_edge("c", END)
+    return graph.compile(checkpointer=saver, **compile_kwargs)
+
+
+class TestBatchedMemorySaver:
+    """Tests for end-of-workflow checkpointing."""
+
+    def test_only_final_checkpoint_stored(self):
+        saver = BatchedMemorySaver()
+        app = _app(saver)
+        config = {"configurable": {"thread_id": "t1"}}
+        app.invoke({"steps": []}, config)
+        assert app.get_state(config).values["steps"] == ["a", "b", "c"]
+        assert len(list(saver.list(config))) == 1
+
+    def test_runs_on_same_thread_chain_parents(self):
+        saver = BatchedMemorySaver()
+        app = _app(saver)
+        config = {"configurable": {"thread_id": "t1"}}
+        app.invoke({"steps": []}, config)
+        app.invoke({"steps": []}, config)
+        history = list(app.get_state_history(config))
+        assert len(history) == 2
+        assert history[0].values["steps"] == ["a", "b", "c"] * 2
+        assert history[0].parent_config == history[1].config
+
+    def test_resume_after_interrupt(self):
+        saver = BatchedMemorySaver()
+        app = _app(saver, interrupt_before=["c"])
+        config = {"configurable": {"thread_id": "t1"}}
+        app.invoke({"steps": []}, config)
+        assert app.get_state(config).next == ("c",)
+        app.invoke(None, config)
+        assert app.get_state(config).values["steps"] == ["a", "b", "c"]
+
+    def test_delete_thread_drops_pending(self):
+        saver = BatchedMemorySaver()
+        app = _app(saver)
+        config = {"configurable": {"thread_id": "t1"}}
+        app.invoke({"steps": []}, config)
+        saver.delete_thread("t1")
+        assert saver.get_tuple(config) is None
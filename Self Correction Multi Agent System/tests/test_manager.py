@@ -0,0 +1,195 @@
+"""
+Unit tests for DatabaseManager (in-memory SQLite).
+
+Run::
+
+    pytest tests/test_manager.py -v
+"""
+
+from src.db import manager
+from src.db.manager import _QUERY_CACHE_SIZE, DatabaseManager
+
+
+def _manager(**kwargs) -> DatabaseManager:
+    db = DatabaseManager(**kwargs)
+    db.get_engine("SQLite", "sqlite://")
+    return db
+
+
+class TestSchemaCache:
+    """Tests for the TTL-cached schema introspection."""
+
+    def test_schema_reused_while_version_unchanged(self, monkeypatch):
+        db = _manager()
+        db.execute_query("SQLite", "CREATE TABLE a (id INTEGER PRIMARY KEY)")
+        first = db.get_schema("SQLite")
+        monkeypatch.setattr("src.db.manager.inspect", None)  # must not be called
+        assert db.get_schema("SQLite") is first
+
+    def test_external_ddl_changes_version(self):
+        db = _manager()
+        db.execute_query("SQLite", "CREATE TABLE a (id INTEGER PRIMARY KEY)")
+        db.get_schema("SQLite")
+        with db.get_engine("SQLite").begin() as conn:
+            conn.exec_driver_sql("CREATE TABLE b (id INTEGER)")
+        assert "Table: b" in db.get_schema("SQLite")
+
+    def test_schema_reused_within_ttl_without_version_probe(self, monkeypatch):
+        no_probe = staticmethod(lambda engine: None)
+        monkeypatch.setattr(DatabaseManager, "_schema_version", no_probe)
+        db = _manager()
+        db.execute_query("SQLite", "CREATE TABLE a (id INTEGER PRIMARY KEY)")
+        first = db.get_schema("SQLite")
+        with db.get_engine("SQLite").begin() as conn:
+            conn.exec_driver_sql("CREATE TABLE b (id INTEGER)")
+        assert db.get_schema("SQLite") == first
+
+    def test_ttl_bounds_schema_with_unchanged_version(self, monkeypatch):
+        same_version = staticmethod(lambda engine: "v1")
+        monkeypatch.setattr(DatabaseManager, "_schema_version", same_version)
+        db = _manager(schema_ttl_seconds=0)
+        db.execute_query("SQLite", "CREATE TABLE a (id INTEGER PRIMARY KEY)")
+        db.get_schema("SQLite")
+        with db.get_engine("SQLite").begin() as conn:
+            conn.exec_driver_sql("ALTER TABLE a ADD COLUMN name TEXT")
+        assert "name" in db.get_schema("SQLite")
+
+    def test_invalidate_schema_forces_reintrospection(self):
+        db = _manager()
+        db.execute_query("SQLite", "CREATE TABLE a (id INTEGER PRIMARY KEY)")
+        db.get_schema("SQLite")
+        with db.get_engine("SQLite").begin() as conn:
+            conn.exec_driver_sql("CREATE TABLE b (id INTEGER)")
+        db.invalidate_schema("SQLite")
+        assert "Table: b" in db.get_schema("SQLite")
+
+    def test_write_statement_invalidates_schema(self):
+        db = _manager()
+        db.execute_query("SQLite", "CREATE TABLE a (id INTEGER PRIMARY KEY)")
+        assert "Table: b" not in db.get_schema("SQLite")
+        db.execute_query("SQLite", "CREATE TABLE b (id INTEGER)")
+        assert "Table: b" in db.get_schema("SQLite")
+
+    def test_zero_ttl_disables_cache(self):
+        db = _manager(schema_ttl_seconds=0)
+        db.get_schema("SQLite")
+        with db.get_engine("SQLite").begin() as conn:
+            conn.exec_driver_sql("CREATE TABLE c (id INTEGER)")
+        assert "Table: c" in db.get_schema("SQLite")
+
+
+class TestSchemaRendering:
+    """Tests for the rendered schema text."""
+
+    def test_tables_columns_and_foreign_keys(self):
+        db = _manager()
+        db.execute_query("SQLite", "CREATE TABLE a (id INTEGER PRIMARY KEY, n TEXT)")
+        db.execute_query(
+            "SQLite",
+            "CREATE TABLE b (id INTEGER PRIMARY KEY, a_id INTEGER REFERENCES a(id))",
+        )
+        assert db.get_schema("SQLite") == (
+            "Table: a\n  Primary Key: ['id']\n  Columns:\n"
+            "  - id: INTEGER\n  - n: TEXT\n\n"
+            "Table: b\n  Primary Key: ['id']\n  Columns:\n"
+            "  - id: INTEGER\n  - a_id: INTEGER\n"
+            "  Foreign Keys:\n  FK: ['a_id'] -> a.['id']"
+        )
+
+    def test_schema_for_tables_includes_fk_neighbours(self):
+        db = _manager()
+        db.execute_query("SQLite", "CREATE TABLE a (id INTEGER PRIMARY KEY)")
+        db.execute_query(
+            "SQLite",
+            "CREATE TABLE b (id INTEGER PRIMARY KEY, a_id INTEGER REFERENCES a(id))",
+        )
+        db.execute_query("SQLite", "CREATE TABLE c (id INTEGER PRIMARY KEY)")
+        assert db.get_table_names("SQLite") == ["a", "b", "c"]
+
+        trimmed = db.get_schema_for_tables("SQLite", ["a"])
+        assert "Table: a" in trimmed and "Table: b" in trimmed
+        assert "Table: c" not in trimmed
+
+        only_a = db.get_schema_for_tables("SQLite", ["a", "nope"], False)
+        assert only_a.startswith("Table: a") and "Table: b" not in only_a
+
+    def test_parallel_introspection_matches_sequential(self, tmp_path, monkeypatch):
+        db = DatabaseManager()
+        engine = db.get_engine("SQLite", f"sqlite:///{tmp_path / 'many.db'}")
+        for i in range(12):
+            db.execute_query("SQLite", f"CREATE TABLE t{i} (id INTEGER PRIMARY KEY)")
+        sequential = db.get_schema("SQLite")
+
+        db.invalidate_schema()
+        # Any non-SQLite backend name takes the thread-pool path
+        monkeypatch.setattr(engine.dialect, "name", "server")
+        assert db.get_schema("SQLite") == sequential
+
+
+class TestExecuteQuery:
+    """Tests for row fetching in execute_query."""
+
+    def test_rows_capped_at_max_rows(self, monkeypatch):
+        monkeypatch.setattr("src.db.manager.MAX_ROWS", 2)
+        db = _manager()
+        db.execute_query("SQLite", "CREATE TABLE t (id INTEGER, name TEXT)")
+        db.execute_query("SQLite", "INSERT INTO t VALUES (1, 'a'), (2, 'b'), (3, 'c')")
+
+        capped, _ = db.execute_query("SQLite", "SELECT * FROM t ORDER BY id")
+        assert capped.data == [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}]
+        assert capped.truncated is True
+
+        exact, _ = db.execute_query("SQLite", "SELECT * FROM t WHERE id < 3")
+        assert exact.row_count == 2
+        assert exact.truncated is False
+
+    def test_unvalidated_result_still_sized(self):
+        db = _manager()
+        result, _ = db.execute_query("SQLite", "SELECT 1 AS n, 'x' AS s")
+        assert result.data == [{"n": 1, "s": "x"}]
+        assert result.byte_size > 256
+        assert result.error_message is None and result.truncated is False
+
+    def test_write_statement_clears_answer_cache(self):
+        db = _manager()
+        db.answer_cache.put("q", "SQLite", "schema", "answer")
+        db.execute_query("SQLite", "CREATE TABLE t (id INTEGER)")
+        assert len(db.answer_cache) == 0
+
+
+    def test_write_evicts_stale_results_only(self):
+        db = _manager()
+        db.execute_query("SQLite", "CREATE TABLE a (id INTEGER)")
+        db.execute_query("SQLite", "CREATE TABLE b (id INTEGER)")
+        db.execute_query("SQLite", "SELECT * FROM a")
+        db.execute_query("SQLite", "SELECT * FROM b")
+
+        db.execute_query("SQLite", "INSERT INTO a VALUES (1)", is_sensitive=True)
+        fresh, from_cache = db.execute_query("SQLite", "SELECT * FROM a")
+        assert (fresh.row_count, from_cache) == (1, False)
+        assert db.execute_query("SQLite", "SELECT * FROM b")[1] is True
+
+
+class TestEngines:
+    """Tests for process-wide engine pooling."""
+
+    def test_file_engine_shared_across_managers(self, tmp_path):
+        url = f"sqlite:///{tmp_path / 'shared.db'}"
+        first = DatabaseManager().get_engine("SQLite", url)
+        assert DatabaseManager().get_engine("SQLite", url) is first
+
+    def test_compiled_cache_size(self, tmp_path):
+        engine = DatabaseManager().get_engine(
+            "SQLite", f"sqlite:///{tmp_path / 'sized.db'}"
+        )
+        assert engine._compiled_cache.capacity == _QUERY_CACHE_SIZE
+
+    def test_memory_engines_not_shared(self):
+        assert _manager().get_engine("SQLite") is not _manager().get_engine("SQLite")
+
+    def test_env_connection_string_loads_dotenv(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(manager, "_ensure_dotenv", lambda: calls.append(1))
+        monkeypatch.setenv("SQLITE_CONNECTION_STRING", "sqlite://")
+        DatabaseManager().get_engine("SQLite")
+        assert calls == [1]
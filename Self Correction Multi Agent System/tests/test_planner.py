@@ -0,0 +1,34 @@
+"""
+Unit tests for the planner's schema trimming helpers.
+
+Run::
+
+    pytest tests/test_planner.py -v
+"""
+
+import pytest
+
+from src.nodes.planner import _match_tables
+
+TABLES = ["customers", "orders", "order_items", "products", "a"]
+
+
+class TestMatchTables:
+    """Tests for question → table-name matching."""
+
+    @pytest.mark.parametrize(
+        ("question", "expected"),
+        [
+            ("Top 5 customers by revenue", {"customers"}),
+            ("How many ORDERS per customer?", {"customers", "orders"}),
+            ("list order items", {"order_items", "orders"}),
+            ("custmers in Paris", {"customers"}),
+            ("average price", set()),
+        ],
+    )
+    def test_matches(self, question, expected):
+        assert _match_tables(question, TABLES) == expected
+
+    def test_short_names_need_exact_word(self):
+        assert _match_tables("a b c", TABLES) == {"a"}
+        assert _match_tables("an apple", TABLES) == set()
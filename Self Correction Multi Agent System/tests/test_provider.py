@@ -0,0 +1,55 @@
+"""
+Unit tests for the LLM provider factory.
+
+Run::
+
+    pytest tests/test_provider.py -v
+"""
+
+import pytest
+
+from src.llm import provider
+from src.llm.provider import get_llm
+
+
+@pytest.fixture(autouse=True)
+def _api_key(monkeypatch):
+    monkeypatch.setenv("GROQ_API_KEY", "test-key")
+
+
+class TestGetLlm:
+    """Tests for client sharing in get_llm."""
+
+    def test_same_settings_share_client(self):
+        assert get_llm() is get_llm()
+        assert get_llm(max_tokens=5) is get_llm(max_tokens=5)
+
+    def test_different_settings_get_own_client(self):
+        assert get_llm(temperature=0.5) is not get_llm(temperature=0.0)
+
+    def test_rotated_key_gets_new_client(self, monkeypatch):
+        first = get_llm()
+        monkeypatch.setenv("GROQ_API_KEY", "other-key")
+        assert get_llm() is not first
+
+    def test_unknown_provider(self):
+        with pytest.raises(ValueError, match="Unknown LLM provider"):
+            get_llm(provider="nope")
+
+    def test_dotenv_loaded_once(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(provider, "_DOTENV_LOADED", False)
+        monkeypatch.setattr(provider, "load_dotenv", lambda: calls.append(1))
+        get_llm()
+        get_llm()
+        assert calls == [1]
+
+    def test_env_defaults_resolved_once(self, monkeypatch):
+        provider._default_model.cache_clear()
+        monkeypatch.setenv("LLM_MODEL", " Some-Model ")
+        assert get_llm().model_name == "some-model"
+        monkeypatch.setenv("LLM_MODEL", "other-model")
+        assert get_llm().model_name == "some-model"
+        provider._default_model.cache_clear()
+        assert get_llm().model_name == "other-model"
+        provider._default_model.cache_clear()
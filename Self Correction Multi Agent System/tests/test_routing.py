@@ -27,6 +27,10 @@ class TestShouldGetApproval:
     def test_missing_key_defaults_to_executor(self):
         assert should_get_approval({}) == "executor"
 
+    def test_cached_answer_routes_to_end(self):
+        state = {"answer_from_cache": True, "requires_human_approval": False}
+        assert should_get_approval(state) == "end"
+
 
 class TestCheckApprovalResults:
 
@@ -74,3 +78,12 @@ class TestShouldRetryOrComplete:
             "max_retries": 3,
         }
         assert should_retry_or_complete(state) == "debugger"
+
+    def test_valid_result_with_no_retries_left_routes_to_answer(self):
+        state = {
+            "execution_result": QueryResult(success=True, row_count=2),
+            "validation_result": ValidationResult(is_valid=True),
+            "retry_count": 3,
+            "max_retries": 3,
+        }
+        assert should_retry_or_complete(state) == "answer"
@@ -46,6 +46,10 @@ class TestSQLQuery:
         )
         assert q.dialect == "MySQL"
 
+    def test_sensitive_flag_hidden_from_llm_schema(self):
+        assert "is_sensitive" not in SQLQuery.model_json_schema()["properties"]
+        assert SQLQuery(query="SELECT 1", explanation="t").is_sensitive is False
+
     def test_invalid_dialect_rejected(self):
         with pytest.raises(Exception):
             SQLQuery(
@@ -75,6 +79,14 @@ class TestQueryResult:
         assert r.error_message is None
         assert r.row_count == 0
 
+    def test_byte_size_grows_with_rows_and_stays_out_of_dump(self):
+        small = QueryResult(success=True, data=[{"id": 1}], row_count=1)
+        big = QueryResult(
+            success=True, data=[{"id": i} for i in range(100)], row_count=100
+        )
+        assert 0 < small.byte_size < big.byte_size
+        assert "byte_size" not in big.model_dump()
+
 
 class TestValidationResult:
     """Tests for the ValidationResult model."""
@@ -0,0 +1,115 @@
+"""
+Unit tests for the SemanticQueryCache.
+
+Run::
+
+    pytest tests/test_semantic_cache.py -v
+"""
+
+import pytest
+
+from src.db.cache import QueryCache
+from src.db.semantic_cache import (
+    SemanticQueryCache,
+    _regex_canonical,
+    canonicalize_sql,
+    referenced_tables,
+)
+from src.models.schemas import QueryResult
+
+
+def _result(n: int = 1) -> QueryResult:
+    return QueryResult(success=True, data=[{"id": i} for i in range(n)], row_count=n)
+
+
+def _store(cache: SemanticQueryCache, sql: str, sensitive: bool = False) -> None:
+    key, _ = cache.lookup("SQLite", sql, sensitive)
+    cache.store("SQLite", sql, key, _result(), sensitive)
+
+
+class TestCanonicalSql:
+    """Tests for the regex canonicaliser."""
+
+    def test_strips_comments_semicolon_and_spacing(self):
+        sql = "SELECT id , name\nFROM users WHERE ( id = 1 ) ; -- note"
+        assert _regex_canonical(sql) == "select id,name from users where(id=1)"
+
+    def test_quoted_literals_kept_verbatim(self):
+        assert _regex_canonical("SELECT * FROM t WHERE n = 'A  B'") == (
+            "select * from t where n='A  B'"
+        )
+
+
+class TestSqlglotCanonicalSql:
+    """Tests for the sqlglot canonicaliser (skipped without the ``sql`` extra)."""
+
+    @pytest.fixture(autouse=True)
+    def _require_sqlglot(self):
+        pytest.importorskip("sqlglot")
+
+    def test_case_spacing_comments_and_semicolon(self):
+        assert canonicalize_sql("select ID , name from USERS", "SQLite") == (
+            canonicalize_sql("SELECT id, name\nFROM users ; -- all", "SQLite")
+        )
+        assert "all" not in canonicalize_sql("SELECT 1 /* all */", "SQLite")
+
+    def test_statements_kept_apart(self):
+        assert canonicalize_sql("SELECT 1; DROP TABLE t", "SQLite") != (
+            canonicalize_sql("SELECT 1", "SQLite")
+        )
+
+    def test_tables_from_ast(self):
+        sql = "SELECT * FROM main.Users u JOIN \"Orders\" o ON u.id = o.id"
+        assert {"users", "orders"} <= referenced_tables(sql, "SQLite")
+
+
+class TestReferencedTables:
+    """Tests for table-dependency extraction."""
+
+    def test_tables_in_every_position(self):
+        sql = (
+            "INSERT INTO audit (id) SELECT u.id FROM main.users u, \"Orders\" o "
+            "LEFT JOIN items i ON i.id = o.id WHERE u.name = 'from secret'"
+        )
+        assert referenced_tables(sql, "SQLite") == {
+            "audit",
+            "users",
+            "orders",
+            "items",
+        }
+
+    def test_table_less_query(self):
+        assert referenced_tables("SELECT 1", "SQLite") == frozenset()
+
+
+class TestSemanticQueryCache:
+    """Tests for signature-based lookups."""
+
+    def test_equivalent_query_hits(self):
+        cache = SemanticQueryCache(QueryCache())
+        _store(cache, "SELECT id FROM users;")
+        _, hit = cache.lookup("SQLite", "select id\nfrom users -- again")
+        assert hit is not None
+        assert cache.cache.hits == 1
+        assert cache.cache.misses == 1  # the initial store lookup only
+
+    def test_sensitive_query_skips_signature(self):
+        cache = SemanticQueryCache(QueryCache())
+        _store(cache, "DELETE FROM users;", sensitive=True)
+        _, hit = cache.lookup("SQLite", "delete from users", is_sensitive=True)
+        assert hit is None
+
+    def test_alias_limit(self):
+        cache = SemanticQueryCache(QueryCache(), max_aliases=1)
+        _store(cache, "SELECT 1")
+        _store(cache, "SELECT 2")
+        assert cache.lookup("SQLite", "SELECT 1;")[1] is None
+        assert cache.lookup("SQLite", "SELECT 2;")[1] is not None
+
+    def test_write_invalidates_dependent_reads(self):
+        cache = SemanticQueryCache(QueryCache())
+        _store(cache, "SELECT * FROM users")
+        _store(cache, "SELECT * FROM orders")
+        assert cache.invalidate("SQLite", "DELETE FROM users WHERE id = 1") == 1
+        assert cache.lookup("SQLite", "SELECT * FROM users")[1] is None
+        assert cache.lookup("SQLite", "SELECT * FROM orders")[1] is not None
@@ -0,0 +1,67 @@
+"""
+Unit tests for rule-based sensitive-query detection.
+
+Run::
+
+    pytest tests/test_sensitivity.py -v
+"""
+
+import pytest
+
+from src.db.sensitivity import is_sensitive_sql
+
+
+class TestIsSensitiveSql:
+    """Tests for is_sensitive_sql."""
+
+    @pytest.mark.parametrize(
+        "sql",
+        [
+            "DELETE FROM logs",
+            "  update users set active = 0",
+            "DROP TABLE t",
+            "TRUNCATE t",
+            "ALTER TABLE t ADD c INT",
+            "INSERT INTO t VALUES (1)",
+            "GRANT SELECT ON t TO bob",
+            "-- purge\nDELETE FROM logs",
+            "/* a */ /* b */ DROP TABLE t",
+            "SELECT 1; DELETE FROM t",
+            "WITH old AS (SELECT id FROM t) DELETE FROM t WHERE id IN old",
+            "CREATE TABLE t (id INT)",
+            "REPLACE INTO t VALUES (1)",
+            "RENAME TABLE a TO b",
+            "EXEC purge_logs",
+            "EXECUTE purge_logs",
+            "CALL purge_logs()",
+            "SELECT * INTO backup FROM users",
+            "COPY users TO '/tmp/users.csv'",
+            "VACUUM",
+            "ATTACH DATABASE 'other.db' AS other",
+            "PRAGMA journal_mode = DELETE",
+            "/* don't */ DELETE FROM t",
+            "SELECT '--'; DELETE FROM t",
+            "WITH d AS (DELETE FROM t RETURNING *) SELECT * FROM d",
+            "WITH u AS (UPDATE t SET a = 1 RETURNING *) SELECT * FROM u",
+            "WITH i AS ( insert INTO t VALUES (1) RETURNING id) SELECT id FROM i",
+            "WITH x AS (SELECT 1), d AS (\n  DELETE FROM t RETURNING *) SELECT 1",
+        ],
+    )
+    def test_sensitive(self, sql):
+        assert is_sensitive_sql(sql) is True
+
+    @pytest.mark.parametrize(
+        "sql",
+        [
+            "SELECT * FROM users",
+            "SELECT update_time, deleted FROM t",
+            "SELECT 'DELETE' AS word",
+            "SELECT 1 -- DROP TABLE t",
+            "WITH x AS (SELECT 1) SELECT * FROM x",
+            "(SELECT 1) UNION (SELECT 2)",
+            "SELECT into_date FROM t WHERE note = 'moved into storage';",
+            "SELECT 'x; DROP TABLE t'",
+        ],
+    )
+    def test_not_sensitive(self, sql):
+        assert is_sensitive_sql(sql) is False
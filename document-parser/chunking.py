@@ -0,0 +1,54 @@
+"""
+Markdown chunking for the conversion workflow.
+
+Kept free of the workflow's LLM and document-rendering dependencies so it
+can be imported (and tested) on its own.
+"""
+
+import bisect
+import re
+from typing import List
+
+CHUNK_SIZE = 1000
+CHUNK_OVERLAP = 100
+
+# Preferred chunk boundaries: before a heading, after a blank line or a sentence
+_SPLIT_RE = re.compile(r"(?m)^(?=#{1,6} )|\n\n|\. ")
+
+
+def fast_markdown_chunks(md: str, size: int = CHUNK_SIZE, overlap: int = CHUNK_OVERLAP) -> List[str]:
+    """
+    Splits markdown into chunks of at most `size` characters, cutting at the last
+    heading, blank line or sentence end that fits. Consecutive chunks share up to
+    `overlap` characters. One regex scan collects the boundary offsets; strings
+    are only sliced once per emitted chunk.
+    """
+    boundaries = [m.end() for m in _SPLIT_RE.finditer(md)]
+    chunks = []
+    start, length = 0, len(md)
+    prev_end = 0  # end of the previous chunk; every cut must pass it
+    while start < length:
+        limit = start + size
+        if limit >= length:
+            end = length
+        else:
+            # Last boundary that fits, else the last space, else a hard cut;
+            # a cut inside the carried-over overlap would repeat it as a chunk
+            i = bisect.bisect_right(boundaries, limit) - 1
+            end = boundaries[i] if i >= 0 and boundaries[i] > max(start, prev_end) else -1
+            if end == -1:
+                end = md.rfind(" ", max(start + 1, prev_end), limit) + 1 or limit
+        chunk = md[start:end].strip()
+        if chunk:
+            chunks.append(chunk)
+        if end >= length:
+            break
+        prev_end = end
+        # Carry the tail over, starting at a word boundary
+        next_start = end
+        if overlap and end - overlap > start:
+            space = md.find(" ", end - overlap, end)
+            if space != -1:
+                next_start = space + 1
+        start = next_start
+    return chunks
@@ -0,0 +1,39 @@
+"""
+Unit tests for the markdown chunker.
+
+Run::
+
+    pytest tests/test_chunking.py -v
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from chunking import fast_markdown_chunks  # noqa: E402
+
+
+class TestFastMarkdownChunks:
+    """Tests for boundary selection and overlap."""
+
+    def test_consecutive_chunks_overlap(self):
+        md = " ".join(f"Sentence number {i} here." for i in range(200))
+        chunks = fast_markdown_chunks(md, size=300, overlap=50)
+        assert len(chunks) > 1
+        assert all(len(chunk) <= 300 for chunk in chunks)
+        for previous, chunk in zip(chunks, chunks[1:]):
+            head = chunk.split()[0]
+            assert head in previous[-60:]
+
+    def test_overlap_is_never_a_chunk_of_its_own(self):
+        # The only boundary is the paragraph break: after the overlap carry
+        # it is behind the previous cut and must not be chosen again
+        md = (
+            " ".join(f"Sentence number {i} here." for i in range(45))
+            + "\n\n"
+            + " ".join(f"word{i}" for i in range(600))
+        )
+        chunks = fast_markdown_chunks(md, size=1000, overlap=100)
+        for previous, chunk in zip(chunks, chunks[1:]):
+            assert chunk not in previous
+        assert chunks[-1].endswith("word599")
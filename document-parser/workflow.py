@@ -1,46 +1,348 @@
+import io
 import os
+import re
+import json
 import base64
+import asyncio
+import hashlib
+import mmap
+import multiprocessing
+import queue
+import shutil
+import subprocess
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from collections import OrderedDict
+from functools import cache, lru_cache
 from pathlib import Path
-from typing import List, TypedDict, Annotated
+from typing import AsyncIterator, Iterable, Iterator, List, TypedDict, Annotated
 from dotenv import load_dotenv
 
-from langchain_core.messages import HumanMessage
+from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.runnables import RunnableLambda
 from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain.text_splitter import MarkdownTextSplitter
 from langgraph.graph import StateGraph, END
+from pydantic import BaseModel, Field
 
 from spire.doc import *
 from spire.doc.common import *
 
+from chunking import fast_markdown_chunks
+
+try:  # optional: fast, parallel rasterization of a LibreOffice PDF export
+    import fitz  # PyMuPDF
+except ImportError:
+    fitz = None
+
+try:  # optional: compact page images (grayscale / palette PNG, JPEG)
+    from PIL import Image, ImageChops
+except ImportError:
+    Image = None
+
+try:  # optional: HTML input without the vision LLM
+    from markdownify import markdownify
+except ImportError:
+    markdownify = None
+
+try:  # optional: markdown (headings, tables) from PDFs with a text layer
+    import pymupdf4llm
+except ImportError:
+    pymupdf4llm = None
+
 # Load environment variables from .env file
 load_dotenv()
 
+# Resolution of pages rasterized from PDF
+RENDER_DPI = int(os.getenv("RENDER_DPI", "200"))
+
+# Spire.Doc Documents kept for reuse; creating one is expensive
+DOC_POOL_SIZE = int(os.getenv("DOC_POOL_SIZE", "4"))
+_doc_pool: queue.Queue = queue.Queue(maxsize=DOC_POOL_SIZE)
+
+# Maximum number of page requests in flight at once (Gemini RPM limits)
+MAX_CONCURRENT_PAGES = int(os.getenv("MAX_CONCURRENT_PAGES", "8"))
+
+# Static instructions, identical for every document. Sent first as the system
+# message so Gemini's implicit prefix caching can reuse them across requests.
+VISION_ANALYST_SYSTEM = "You are an expert document analyst. You convert document pages (provided as images) into clean, well-structured markdown. Preserve headings, lists, tables, and other formatting. Remove any watermarks or content related to spire.doc python package including warnings printed in RED color."
+
+DOCUMENT_TASK = "Analyze the following document pages and return the markdown of every page, in page order, together with the headings each page contains."
+
+PAGE_TASK = "Analyze the following document page and return its markdown together with the headings it contains."
+
+# Attempts per page before the extraction fails (a malformed structured
+# response is retried for that page only)
+PAGE_ATTEMPTS = 2
+
+# Name of an explicit Gemini context cache (`cachedContents/...`) holding the
+# system instruction. Explicit caches have a minimum size far above this short
+# prompt, so this is only useful when the cache also carries shared content.
+GEMINI_CACHED_CONTENT = os.getenv("GEMINI_CACHED_CONTENT")
+
+MODEL_ID = "gemini-2.5-pro"
+
+# Bump when conversion or chunking changes so cached results are not reused
+PIPELINE_VERSION = "3"
+
+_HEADING_RE = re.compile(r"(?m)^#{1,6} +(.+?)\s*$")
+
+# Inputs that are already text: read directly, no rendering or vision LLM
+TEXT_SUFFIXES = {".md", ".markdown", ".txt"}
+HTML_SUFFIXES = {".html", ".htm"}
+
+# Persistent cache of finished extractions (one JSON file per document),
+# fronted by a small in-process LRU
+CACHE_DIR = Path(os.getenv("DOC_PARSER_CACHE_DIR", "~/.cache/doc-parser")).expanduser()
+MEMORY_CACHE_SIZE = 32
+_memory_cache: "OrderedDict[str, dict]" = OrderedDict()
+_memory_cache_lock = threading.Lock()
+
+
+def document_cache_key(fpath: str) -> str:
+    """
+    Returns the cache key of a document: a hash of its bytes plus the prompt,
+    pipeline and model versions that produced its markdown.
+    """
+    digest = hashlib.sha256()
+    with open(fpath, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    prompts = "\0".join([VISION_ANALYST_SYSTEM, DOCUMENT_TASK, PAGE_TASK])
+    prompt_version = hashlib.sha256(prompts.encode()).hexdigest()[:12]
+    return f"{digest.hexdigest()}|{prompt_version}|v{PIPELINE_VERSION}|{MODEL_ID}"
+
+
+def _cache_path(key: str) -> Path:
+    return CACHE_DIR / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+
+
+def _remember(key: str, entry: dict) -> None:
+    with _memory_cache_lock:
+        _memory_cache[key] = entry
+        _memory_cache.move_to_end(key)
+        if len(_memory_cache) > MEMORY_CACHE_SIZE:
+            _memory_cache.popitem(last=False)
+
+
+def cache_get(key: str) -> dict | None:
+    """
+    Returns the cached {"markdown", "chunks", "chunk_pages"} entry for a key, or None.
+    """
+    with _memory_cache_lock:
+        entry = _memory_cache.get(key)
+        if entry is not None:
+            _memory_cache.move_to_end(key)
+            return entry
+    try:
+        entry = json.loads(_cache_path(key).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    _remember(key, entry)
+    return entry
+
+
+def cache_set(key: str, markdown: str, chunks: List[str], chunk_pages: List[int]) -> None:
+    """
+    Stores an extraction result in memory and on disk (written atomically).
+    """
+    entry = {"markdown": markdown, "chunks": chunks, "chunk_pages": chunk_pages}
+    _remember(key, entry)
+    path = _cache_path(key)
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Unique per writer: concurrent runs may store the same document
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_text(json.dumps(entry), encoding="utf-8")
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"WARNING: could not write pipeline cache: {e}")
+
 
 def list_files(directory: str, extension: str) -> list[str]:
     """
-    Lists all files in a directory with a given extension, using a regular expression.
+    Lists all files in a directory (recursively) with a given extension,
+    compared case-insensitively.
     """
-    fpath = Path(directory)
-    # Compile a case-insensitive regex pattern to match the file extension.
-    pattern = re.compile(f".*\\.{extension}$", re.IGNORECASE)
-    
-    # 1. Use glob() with a simple string pattern ('**/*') to find all files recursively.
-    # 2. Then, filter that list using your regex pattern.
-    files_list = [
-        str(p) for p in fpath.glob('**/*') 
-        if p.is_file() and pattern.match(p.name)
+    # A plain suffix test per file name: no regex, no Path object or is_file()
+    # stat per entry (os.walk reads entry types from scandir)
+    suffix = "." + extension.lower()
+    return [
+        os.path.join(root, name)
+        for root, _, names in os.walk(directory)
+        for name in names
+        if name.lower().endswith(suffix)
     ]
-    return files_list
 
 
-def convert_file_to_imgs(fpath: str, output_dir: str) -> List[str]:
+def _convert_to_pdf(fpath: str, output_dir: str) -> str | None:
     """
-    Converts a document file to images, saving them in the specified output directory.
-    Returns a list of file paths to the generated images.
+    Converts a document to PDF with headless LibreOffice.
+    Returns the PDF path, or None when LibreOffice is unavailable or fails.
+    """
+    if fpath.lower().endswith(".pdf"):
+        return fpath
+    soffice = shutil.which("soffice") or shutil.which("libreoffice")
+    if soffice is None:
+        return None
+    try:
+        subprocess.run(
+            [soffice, "--headless", "--convert-to", "pdf", "--outdir", output_dir, fpath],
+            check=True, capture_output=True, timeout=300,
+        )
+    except (OSError, subprocess.SubprocessError) as e:
+        print(f"WARNING: LibreOffice conversion failed, using Spire.Doc: {e}")
+        return None
+    pdf_path = Path(output_dir) / f"{Path(fpath).stem}.pdf"
+    return str(pdf_path) if pdf_path.exists() else None
+
+
+# A page image: the path of the stored file, or the encoded image itself
+PageImage = str | bytes
+# A page image with the SHA-256 digest of its encoded bytes (for deduplication)
+RenderedPage = tuple[PageImage, bytes]
+
+
+def _store_page_image(raw_png: bytes, output_base: str | None) -> RenderedPage:
+    """
+    Encodes a rendered page in the smallest format that keeps it legible: 8-bit
+    grayscale PNG for gray pages, palette PNG for pages with at most 256
+    colors, JPEG (quality 85) otherwise. Without Pillow the PNG is kept
+    unchanged. The image is written to `output_base` plus the format's suffix
+    and that path returned (its suffix gives the MIME type); with no
+    `output_base` the encoded bytes are returned instead. The digest is taken
+    here, while the bytes are at hand, so no page is read back to hash it.
+    """
+    if Image is None:
+        suffix, data = ".png", raw_png
+    else:
+        suffix, data = _compact_image(raw_png)
+    digest = hashlib.sha256(data).digest()
+    if output_base is None:
+        return data, digest
+    output_path = output_base + suffix
+    with open(output_path, "wb") as img_file:
+        img_file.write(data)
+    return output_path, digest
+
+
+def _compact_image(raw_png: bytes) -> tuple[str, bytes]:
+    """
+    Re-encodes a PNG for `_store_page_image`; returns (suffix, encoded bytes).
+    """
+    with Image.open(io.BytesIO(raw_png)) as img:
+        if img.mode in ("RGBA", "LA", "P"):
+            # Flatten transparency onto white, as the page would be printed
+            rgba = img.convert("RGBA")
+            img = Image.new("RGB", rgba.size, "white")
+            img.paste(rgba, mask=rgba.getchannel("A"))
+        else:
+            img = img.convert("RGB")
+
+    buffer = io.BytesIO()
+    red, green, blue = img.split()
+    if (ImageChops.difference(red, green).getbbox() is None
+            and ImageChops.difference(green, blue).getbbox() is None):
+        suffix = ".png"
+        img.convert("L").save(buffer, "PNG", optimize=True)
+    elif img.getcolors(256) is not None:
+        suffix = ".png"
+        img.convert("P", palette=Image.ADAPTIVE, colors=256).save(buffer, "PNG", optimize=True)
+    else:
+        suffix = ".jpg"
+        img.save(buffer, "JPEG", quality=85, optimize=True)
+    return suffix, buffer.getvalue()
+
+
+def _render_pdf_page(pdf_path: str, page_index: int, output_base: str | None) -> RenderedPage:
+    """
+    Rasterizes one PDF page (runs in a worker process).
+    """
+    with fitz.open(pdf_path) as pdf:
+        raw_png = pdf[page_index].get_pixmap(dpi=RENDER_DPI).tobytes("png")
+    return _store_page_image(raw_png, output_base)
+
+
+_render_pool: ProcessPoolExecutor | None = None
+_render_pool_lock = threading.Lock()
+
+
+def _get_render_pool() -> ProcessPoolExecutor:
+    """
+    Process pool for PDF rasterization, created once and shared by all
+    documents. Workers are spawned, not forked: this process has other
+    threads and a live gRPC channel (the Gemini client), which a fork would
+    copy in an inconsistent state.
+    """
+    global _render_pool
+    with _render_pool_lock:
+        if _render_pool is None:
+            _render_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count() or 1,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _render_pool
+
+
+def _iter_pdf_pages(pdf_path: str, output_dir: str, file_stem: str, return_bytes: bool) -> Iterator[RenderedPage]:
+    """
+    Rasterizes PDF pages in parallel across processes, yielding images in page order.
+    """
+    with fitz.open(pdf_path) as pdf:
+        page_count = pdf.page_count
+    output_bases = [
+        None if return_bytes else str(Path(output_dir) / f"{file_stem}_page_{i + 1}")
+        for i in range(page_count)
+    ]
+    if page_count < 2:
+        for i, output_base in enumerate(output_bases):
+            yield _render_pdf_page(pdf_path, i, output_base)
+        return
+    yield from _get_render_pool().map(
+        _render_pdf_page, [pdf_path] * page_count, range(page_count), output_bases
+    )
+
+
+def _acquire_document() -> Document:
+    """
+    Takes a Spire.Doc Document from the pool, or creates one when it is empty.
+    """
+    try:
+        return _doc_pool.get_nowait()
+    except queue.Empty:
+        return Document()
+
+
+def _release_document(document: Document) -> None:
+    """
+    Closes a Document and returns it to the pool, or disposes of it when the
+    pool is full.
+    """
+    document.Close()
+    try:
+        _doc_pool.put_nowait(document)
+    except queue.Full:
+        document.Dispose()
+
+
+def iter_file_pages(fpath: str, output_dir: str, *, return_bytes: bool = False) -> Iterator[PageImage]:
+    """
+    Converts a document file to images one page at a time, saving them in the
+    specified output directory. Yields the file path of each image as soon as
+    that page has been rendered, or with `return_bytes` the encoded image
+    itself, without writing it to disk.
+
+    Uses LibreOffice + PyMuPDF (pages rendered in parallel) when both are
+    available, otherwise Spire.Doc.
+    """
+    for image, _ in _iter_rendered_pages(fpath, output_dir, return_bytes):
+        yield image
+
+
+def _iter_rendered_pages(fpath: str, output_dir: str, return_bytes: bool) -> Iterator[RenderedPage]:
+    """
+    `iter_file_pages`, yielding each page image with its digest.
     """
     print(f"Converting file: {fpath} to images...")
-    document = Document()
-    document.LoadFromFile(fpath)
 
     # create a subdirectory named after the file (without extension)
     file_stem = Path(fpath).stem
@@ -49,22 +351,51 @@ def convert_file_to_imgs(fpath: str, output_dir: str) -> List[str]:
     # use the subdirectory as the output directory for this file
     output_dir = str(subdir)
 
-    image_paths = []
-    for i in range(document.GetPageCount()):
-        # convert image to PNG format
-        image_stream = document.SaveImageToStreams(i, ImageType.Bitmap)
+    pdf_path = _convert_to_pdf(fpath, output_dir) if fitz is not None else None
+    if pdf_path is not None:
+        yield from _iter_pdf_pages(pdf_path, output_dir, file_stem, return_bytes)
+        return
 
-        # save PNG to output directory
-        output_path = Path(output_dir) / f"{Path(fpath).stem}_page_{i + 1}.png"
-        with open(output_path, 'wb') as img_file:
-            img_file.write(image_stream.ToArray())
-        image_paths.append(str(output_path))
+    document = _acquire_document()
+    try:
+        document.LoadFromFile(fpath)
 
-    return image_paths
+        for i in range(document.GetPageCount()):
+            # convert image to PNG format
+            image_stream = document.SaveImageToStreams(i, ImageType.Bitmap)
+
+            # save the page image to output directory
+            output_base = None if return_bytes else str(Path(output_dir) / f"{file_stem}_page_{i + 1}")
+            yield _store_page_image(image_stream.ToArray(), output_base)
+    finally:
+        _release_document(document)
+
+
+def convert_file_to_imgs(fpath: str, output_dir: str, *, return_bytes: bool = False) -> List[PageImage]:
+    """
+    Converts a document file to images, saving them in the specified output directory.
+    Returns a list of file paths to the generated images, or with `return_bytes`
+    the encoded images themselves.
+    """
+    return list(iter_file_pages(fpath, output_dir, return_bytes=return_bytes))
 
 
 # --- 1. Define the State for the Workflow ---
 
+class PageExtraction(BaseModel):
+    """
+    Structured vision-LLM output for one document page.
+    """
+    page_no: int = Field(description="1-based page number.")
+    markdown: str = Field(description="The page content as clean markdown.")
+    headings: List[str] = Field(default_factory=list, description="Headings on the page, in order.")
+
+class DocumentExtraction(BaseModel):
+    """
+    Structured vision-LLM output for a whole document (single-request mode).
+    """
+    pages: List[PageExtraction]
+
 class WorkflowState(TypedDict):
     """
     Defines the state that is passed between nodes in the workflow.
@@ -72,12 +403,85 @@ class WorkflowState(TypedDict):
     input_file: str
     output_dir: str
     image_paths: List[str]
+    # Encoded page images, when they are not written to disk
+    image_bytes: List[bytes]
+    # Write the page images to output_dir (default False: kept in memory)
+    persist_images: bool
     markdown_content: str
+    # Per-page extraction results, in page order
+    pages: List[PageExtraction]
     chunks: List[str]
+    # Page number of each chunk (chunks never span pages)
+    chunk_pages: List[int]
     error: str | None
+    # Send one request per page concurrently (default) instead of one
+    # request with every page
+    parallel_pages: bool
+    # Reuse a previous extraction of the same file (default True)
+    use_cache: bool
+    cache_key: str | None
+    cache_hit: bool
+    # Also return the page images, pages and markdown_content (default False:
+    # only the chunks leave the pipeline node)
+    keep_intermediate: bool
+
+def read_text_pages(fpath: str) -> List[PageExtraction] | None:
+    """
+    Reads the content of inputs that need no vision LLM: markdown and text
+    files, HTML (with markdownify) and PDFs with a text layer on every page
+    (with pymupdf4llm; plain PyMuPDF text has no headings or tables, so
+    without it PDFs go to the vision LLM). Returns None for any other input,
+    which goes through the image pipeline.
+    """
+    suffix = Path(fpath).suffix.lower()
+    if suffix in TEXT_SUFFIXES:
+        texts = [Path(fpath).read_text(encoding="utf-8")]
+    elif suffix in HTML_SUFFIXES and markdownify is not None:
+        texts = [markdownify(Path(fpath).read_text(encoding="utf-8"), heading_style="ATX")]
+    elif suffix == ".pdf" and pymupdf4llm is not None:
+        texts = [page["text"] for page in pymupdf4llm.to_markdown(fpath, page_chunks=True)]
+        # Scanned pages have no text layer: the whole document is sent to the LLM
+        if not texts or not all(text.strip() for text in texts):
+            return None
+    else:
+        return None
+    return [
+        PageExtraction(page_no=page_no, markdown=text, headings=_HEADING_RE.findall(text))
+        for page_no, text in enumerate(texts, start=1)
+    ]
 
 # --- 2. Define the Nodes (Stages) for the Workflow ---
 
+def cache_lookup_node(state: WorkflowState) -> WorkflowState:
+    """
+    Node to look up a previous extraction of the same document content.
+    On a hit the markdown and chunks are returned and every other stage is skipped.
+    """
+    print("--- Stage: Checking Pipeline Cache ---")
+    if not state.get("use_cache", True):
+        return {"cache_key": None, "cache_hit": False, "error": None}
+
+    try:
+        cache_key = document_cache_key(state["input_file"])
+        entry = cache_get(cache_key)
+    except Exception as e:
+        print(f"ERROR in cache_lookup_node: {e}")
+        return {"error": f"Failed to read document: {e}"}
+
+    if entry is None:
+        print("Cache miss.")
+        return {"cache_key": cache_key, "cache_hit": False, "error": None}
+
+    print("Cache hit: skipping conversion and extraction.")
+    return {
+        "cache_key": cache_key,
+        "cache_hit": True,
+        "markdown_content": entry["markdown"] if state.get("keep_intermediate") else None,
+        "chunks": entry["chunks"],
+        "chunk_pages": entry["chunk_pages"],
+        "error": None,
+    }
+
 def doc_to_imgs_converter_node(state: WorkflowState) -> WorkflowState:
     """
     Node to convert the input document file to a series of images.
@@ -88,59 +492,292 @@ def doc_to_imgs_converter_node(state: WorkflowState) -> WorkflowState:
     try:
         input_file = state["input_file"]
         output_dir = state["output_dir"]
+        persist_images = state.get("persist_images", False)
         
         # Call the imported tool function
-        image_paths = convert_file_to_imgs(input_file, output_dir)
+        images = convert_file_to_imgs(input_file, output_dir, return_bytes=not persist_images)
         
-        print(f"Successfully converted document to {len(image_paths)} images.")
-        return {"image_paths": image_paths, "error": None}
+        print(f"Successfully converted document to {len(images)} images.")
+        return {_images_key(state): images, "error": None}
     except Exception as e:
         print(f"ERROR in doc_to_imgs_converter_node: {e}")
         return {"error": f"Failed to convert document: {e}"}
 
-def image_to_markdown_extractor_node(state: WorkflowState) -> WorkflowState:
+def _images_key(state: WorkflowState) -> str:
+    """
+    State key holding the page images: paths when persisted, bytes otherwise.
+    """
+    return "image_paths" if state.get("persist_images", False) else "image_bytes"
+
+_MIME_TYPES = {".png": "image/png", ".jpg": "image/jpeg", ".jpeg": "image/jpeg"}
+
+
+def _image_message(image: PageImage) -> dict:
+    """
+    Builds an inline image message. A stored file is memory-mapped and
+    base64-encoded directly, without first reading its bytes into a Python object.
+    """
+    if isinstance(image, bytes):
+        encoded_image = base64.b64encode(image)
+        mime_type = "image/jpeg" if image.startswith(b"\xff\xd8") else "image/png"
+    else:
+        with open(image, "rb") as image_file, \
+                mmap.mmap(image_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            encoded_image = base64.b64encode(mapped)
+        mime_type = _MIME_TYPES.get(Path(image).suffix.lower(), "image/png")
+    return {
+        "type": "image_url",
+        "image_url": {"url": f"data:{mime_type};base64," + encoded_image.decode("ascii")},
+    }
+
+
+def _vision_messages(task: str, image_messages: List[dict]) -> list:
+    """
+    Builds the request messages: static system prefix, then the task and images.
+    """
+    content = [{"type": "text", "text": task}, *image_messages]
+    if GEMINI_CACHED_CONTENT:
+        # The system instruction lives in the cached content
+        return [HumanMessage(content=content)]
+    return [SystemMessage(content=VISION_ANALYST_SYSTEM), HumanMessage(content=content)]
+
+
+async def _iterate(items: Iterable[RenderedPage]) -> AsyncIterator[RenderedPage]:
+    for item in items:
+        yield item
+
+
+def _page_digest(image: PageImage) -> bytes:
+    """
+    SHA-256 digest of a page image; a stored file is hashed through an mmap.
+    """
+    if isinstance(image, bytes):
+        return hashlib.sha256(image).digest()
+    with open(image, "rb") as image_file, \
+            mmap.mmap(image_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        return hashlib.sha256(mapped).digest()
+
+
+async def _render_pages(
+    fpath: str, output_dir: str, images: List[PageImage], return_bytes: bool
+) -> AsyncIterator[RenderedPage]:
+    """
+    Renders the document in a worker thread and yields each page's image (with
+    its digest) as soon as it is rendered, so extraction of early pages
+    overlaps rendering of later ones. Every image is also appended to `images`.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    done = object()
+
+    def produce() -> None:
+        try:
+            for page in _iter_rendered_pages(fpath, output_dir, return_bytes):
+                loop.call_soon_threadsafe(queue.put_nowait, page)
+        finally:
+            loop.call_soon_threadsafe(queue.put_nowait, done)
+
+    producer = loop.run_in_executor(None, produce)
+    while (page := await queue.get()) is not done:
+        images.append(page[0])
+        yield page
+    await producer  # re-raises a rendering error
+
+
+async def _extract_pages(llm: ChatGoogleGenerativeAI, pages: AsyncIterator[RenderedPage]) -> List[PageExtraction]:
+    """
+    Sends one structured-output request per page concurrently and returns the
+    results in page order. A request starts as soon as its page arrives from
+    `pages`. Each page is encoded only once its request may start, so at most
+    MAX_CONCURRENT_PAGES encoded images are held in memory at a time.
+
+    Pages whose image is identical to an earlier page (blank separators,
+    repeated title or template pages) reuse that page's request.
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_PAGES)
+    structured_llm = llm.with_structured_output(PageExtraction)
+
+    async def extract_page(page_no: int, image: PageImage) -> PageExtraction:
+        async with semaphore:
+            messages = _vision_messages(PAGE_TASK, [_image_message(image)])
+            for attempt in range(1, PAGE_ATTEMPTS + 1):
+                try:
+                    page = await structured_llm.ainvoke(messages)
+                    if page is None:
+                        raise ValueError("no structured output returned")
+                    break
+                except Exception:
+                    if attempt == PAGE_ATTEMPTS:
+                        raise
+            # Page numbers come from the document, not from the model
+            page.page_no = page_no
+            return page
+
+    tasks = []  # one per page; duplicate pages share the first page's task
+    tasks_by_digest = {}
+    try:
+        page_no = 0
+        async for image, digest in pages:
+            page_no += 1
+            task = tasks_by_digest.get(digest)
+            if task is None:
+                task = tasks_by_digest[digest] = asyncio.create_task(extract_page(page_no, image))
+            tasks.append(task)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+    if len(tasks_by_digest) < len(tasks):
+        print(f"Skipping {len(tasks) - len(tasks_by_digest)} duplicate page(s).")
+    responses = await asyncio.gather(*tasks, return_exceptions=True)
+    for page_no, response in enumerate(responses, start=1):
+        if isinstance(response, Exception):
+            raise RuntimeError(f"page {page_no}: {response}") from response
+    return [
+        page if page.page_no == page_no else page.model_copy(update={"page_no": page_no})
+        for page_no, page in enumerate(responses, start=1)
+    ]
+
+
+def _join_pages(pages: List[PageExtraction]) -> str:
+    return "\n\n".join(page.markdown for page in pages)
+
+
+_thread_state = threading.local()
+_helper_loop: asyncio.AbstractEventLoop | None = None
+_helper_loop_lock = threading.Lock()
+
+
+def _get_helper_loop() -> asyncio.AbstractEventLoop:
+    """
+    Event loop running forever on a daemon thread, started on first use.
+    """
+    global _helper_loop
+    with _helper_loop_lock:
+        if _helper_loop is None:
+            _helper_loop = asyncio.new_event_loop()
+            threading.Thread(target=_helper_loop.run_forever, name="doc-parser-loop", daemon=True).start()
+        return _helper_loop
+
+
+def _run_sync(coro):
+    """
+    Runs a coroutine on this thread's persistent event loop. Unlike asyncio.run,
+    the loop outlives the call, so clients bound to it are reused by later runs.
+
+    When this thread is already running a loop (Jupyter, an async web handler
+    calling `app.invoke`), that loop cannot be re-entered: the coroutine runs on
+    a helper thread's loop and this thread blocks until it is done, as a
+    synchronous LLM call would.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        return asyncio.run_coroutine_threadsafe(coro, _get_helper_loop()).result()
+
+    loop = getattr(_thread_state, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = _thread_state.loop = asyncio.new_event_loop()
+    return loop.run_until_complete(coro)
+
+
+@lru_cache(maxsize=4)
+def _cached_llm(model: str, api_key: str | None, loop: asyncio.AbstractEventLoop) -> ChatGoogleGenerativeAI:
+    llm_kwargs = {"cached_content": GEMINI_CACHED_CONTENT} if GEMINI_CACHED_CONTENT else {}
+    return ChatGoogleGenerativeAI(model=model, google_api_key=api_key, **llm_kwargs)
+
+
+def _get_llm(model: str = MODEL_ID) -> ChatGoogleGenerativeAI:
+    """
+    Returns a shared Gemini client, so its channel and credentials are reused by
+    every page request and across workflow runs. The async gRPC channel is bound
+    to the event loop it was created on, hence one client per running loop.
+    """
+    return _cached_llm(model, os.getenv("GOOGLE_API_KEY"), asyncio.get_running_loop())
+
+
+async def aimage_to_markdown_extractor_node(state: WorkflowState) -> WorkflowState:
     """
     Node to extract content from images and generate markdown using a vision LLM.
+    Pages are extracted concurrently unless `parallel_pages` is False.
     """
     print("--- Stage: Extracting Content from Images to Markdown ---")
     try:
-        image_paths = state["image_paths"]
-        if not image_paths:
-            raise ValueError("No image paths found in the state.")
+        images = state.get("image_bytes") or state.get("image_paths")
+        if not images:
+            raise ValueError("No page images found in the state.")
 
-        # Initialize the Gemini 2.5 Pro model
-        llm = ChatGoogleGenerativeAI(model="gemini-2.5-pro", google_api_key=os.getenv("GOOGLE_API_KEY"))
-        
-        image_messages = []
-        for img_path in image_paths:
-            with open(img_path, "rb") as image_file:
-                encoded_image = base64.b64encode(image_file.read()).decode("utf-8")
-                image_messages.append({
-                    "type": "image_url",
-                    "image_url": {"url": f"data:image/png;base64,{encoded_image}"},
-                })
-
-        # Create the prompt for the vision model
-        prompt = HumanMessage(
-            content=[
-                {
-                    "type": "text",
-                    "text": "You are an expert document analyst. Analyze the following document pages (provided as images) and generate a single, clean, and well-structured markdown file representing the full content of the document. Preserve headings, lists, tables, and other formatting. Remove any watermarks or content related to spire.doc python package including warnings printed in RED color.",
-                },
-                *image_messages,
-            ]
-        )
+        llm = _get_llm()
         
-        # Invoke the model
-        response = llm.invoke([prompt])
-        markdown_content = response.content
+        if state.get("parallel_pages", True):
+            pages = await _extract_pages(llm, _iterate((image, _page_digest(image)) for image in images))
+        else:
+            # Single request with every page
+            image_messages = [_image_message(image) for image in images]
+            response = await llm.with_structured_output(DocumentExtraction).ainvoke(
+                _vision_messages(DOCUMENT_TASK, image_messages)
+            )
+            if response is None:
+                raise ValueError("no structured output returned")
+            pages = response.pages
+            for page_no, page in enumerate(pages, start=1):
+                page.page_no = page_no
         
         print("Successfully extracted content to markdown.")
-        return {"markdown_content": markdown_content, "error": None}
+        return {"pages": pages, "markdown_content": _join_pages(pages), "error": None}
     except Exception as e:
         print(f"ERROR in image_to_markdown_extractor_node: {e}")
         return {"error": f"Failed to extract content from images: {e}"}
 
+def image_to_markdown_extractor_node(state: WorkflowState) -> WorkflowState:
+    """
+    Synchronous entry point for `app.invoke`; runs the async node to completion.
+    """
+    return _run_sync(aimage_to_markdown_extractor_node(state))
+
+async def adocument_to_markdown_node(state: WorkflowState) -> WorkflowState:
+    """
+    Node to convert the input document to images and extract markdown from them,
+    pipelined: each page is sent to the vision LLM as soon as it is rendered
+    instead of after the whole document. With `parallel_pages` False the pages
+    are rendered first and sent in a single request.
+    """
+    if not state.get("parallel_pages", True):
+        converted = doc_to_imgs_converter_node(state)
+        if converted.get("error"):
+            return converted
+        extracted = await aimage_to_markdown_extractor_node({**state, **converted})
+        return {**converted, **extracted}
+
+    print("--- Stage: Converting Document and Extracting Markdown ---")
+    images: List[PageImage] = []
+    try:
+        return_bytes = not state.get("persist_images", False)
+        pages = _render_pages(state["input_file"], state["output_dir"], images, return_bytes)
+        extracted = await _extract_pages(_get_llm(), pages)
+        if not images:
+            raise ValueError("The document has no pages.")
+
+        print(f"Successfully extracted {len(images)} pages to markdown.")
+        return {
+            _images_key(state): images,
+            "pages": extracted,
+            "markdown_content": _join_pages(extracted),
+            "error": None,
+        }
+    except Exception as e:
+        print(f"ERROR in document_to_markdown_node: {e}")
+        return {"error": f"Failed to convert document to markdown: {e}"}
+
+def document_to_markdown_node(state: WorkflowState) -> WorkflowState:
+    """
+    Synchronous entry point for `app.invoke`; runs the async node to completion.
+    """
+    return _run_sync(adocument_to_markdown_node(state))
+
 def markdown_chunker_node(state: WorkflowState) -> WorkflowState:
     """
     Node to chunk the generated markdown content.
@@ -151,16 +788,61 @@ def markdown_chunker_node(state: WorkflowState) -> WorkflowState:
         if not markdown_content:
             raise ValueError("No markdown content found in the state.")
             
-        # Use LangChain's MarkdownTextSplitter for adaptable chunking
-        splitter = MarkdownTextSplitter(chunk_size=1000, chunk_overlap=100)
-        chunks = splitter.split_text(markdown_content)
+        # Chunk page by page so every chunk keeps its page number for citations
+        chunks, chunk_pages = [], []
+        for page in state.get("pages") or ():
+            page_chunks = fast_markdown_chunks(page.markdown)
+            chunks.extend(page_chunks)
+            chunk_pages.extend([page.page_no] * len(page_chunks))
+        if not chunks:
+            chunks = fast_markdown_chunks(markdown_content)
+            chunk_pages = []
         
         print(f"Successfully split markdown into {len(chunks)} chunks.")
-        return {"chunks": chunks, "error": None}
+        if state.get("cache_key"):
+            cache_set(state["cache_key"], markdown_content, chunks, chunk_pages)
+        return {"chunks": chunks, "chunk_pages": chunk_pages, "error": None}
     except Exception as e:
         print(f"ERROR in markdown_chunker_node: {e}")
         return {"error": f"Failed to chunk markdown: {e}"}
 
+async def adocument_pipeline_node(state: WorkflowState) -> WorkflowState:
+    """
+    Node running the whole conversion in-process: rendering, extraction and
+    chunking. The stages above are called directly, so only the chunks pass
+    through the graph state; the page images, per-page results and markdown are
+    returned as well when `keep_intermediate` is set.
+
+    Inputs that already contain text (see `read_text_pages`) go straight to
+    the chunker.
+    """
+    try:
+        pages = read_text_pages(state["input_file"])
+    except Exception as e:
+        print(f"ERROR in document_pipeline_node: {e}")
+        return {"error": f"Failed to read document text: {e}"}
+    if pages is not None:
+        print(f"--- Stage: Read {len(pages)} page(s) of text, skipping the vision LLM ---")
+        result = {"pages": pages, "markdown_content": _join_pages(pages), "error": None}
+    else:
+        result = await adocument_to_markdown_node(state)
+    if not result.get("error"):
+        result.update(markdown_chunker_node({**state, **result}))
+
+    if state.get("keep_intermediate"):
+        return result
+    output = {"markdown_content": None, "error": result.get("error")}
+    for key in ("chunks", "chunk_pages"):
+        if key in result:
+            output[key] = result[key]
+    return output
+
+def document_pipeline_node(state: WorkflowState) -> WorkflowState:
+    """
+    Synchronous entry point for `app.invoke`; runs the async node to completion.
+    """
+    return _run_sync(adocument_pipeline_node(state))
+
 # --- 3. Define Conditional Logic for Error Handling ---
 
 def should_continue(state: WorkflowState) -> str:
@@ -172,42 +854,55 @@ def should_continue(state: WorkflowState) -> str:
         return "end"
     return "continue"
 
+def should_convert(state: WorkflowState) -> str:
+    """
+    Skips the conversion stages when the cache lookup found a previous result.
+    """
+    if state.get("cache_hit"):
+        return "cached"
+    return should_continue(state)
+
 # --- 4. Assemble the Workflow Graph ---
 
+@cache
 def build_workflow():
     """
-    Builds and returns the LangGraph workflow.
+    Builds and returns the LangGraph workflow. The graph is compiled once and
+    shared: its nodes keep no state between runs, so it is safe to use from
+    several threads.
     """
     workflow = StateGraph(WorkflowState)
 
     # Add nodes to the graph
-    workflow.add_node("doc_converter", doc_to_imgs_converter_node)
-    workflow.add_node("markdown_extractor", image_to_markdown_extractor_node)
-    workflow.add_node("chunker", markdown_chunker_node)
+    workflow.add_node("cache_lookup", cache_lookup_node)
+    # Rendering, extraction and chunking run as one node. Sync and async
+    # implementations: both app.invoke and app.ainvoke work
+    workflow.add_node(
+        "document_pipeline",
+        RunnableLambda(
+            document_pipeline_node,
+            afunc=adocument_pipeline_node,
+            name="document_pipeline",
+        ),
+    )
 
     # Set the entry point
-    workflow.set_entry_point("doc_converter")
+    workflow.set_entry_point("cache_lookup")
 
     # Add conditional edges for error handling
     workflow.add_conditional_edges(
-        "doc_converter",
-        should_continue,
-        {"continue": "markdown_extractor", "end": END},
-    )
-    workflow.add_conditional_edges(
-        "markdown_extractor",
-        should_continue,
-        {"continue": "chunker", "end": END},
-    )
-    workflow.add_conditional_edges(
-        "chunker",
-        should_continue,
-        {"continue": END, "end": END},
+        "cache_lookup",
+        should_convert,
+        {"continue": "document_pipeline", "cached": END, "end": END},
     )
+    workflow.add_edge("document_pipeline", END)
 
     # Compile the graph
     return workflow.compile()
 
+# Compiled at import, off the request path
+APP = build_workflow()
+
 if __name__ == "__main__":
     # Define the input file and output directory
     input_doc = "<input your document file path here>"
@@ -217,11 +912,12 @@ if __name__ == "__main__":
     initial_state = {
         "input_file": input_doc,
         "output_dir": output_dir,
+        # The markdown is saved below
+        "keep_intermediate": True,
     }
 
-    # Build and run the workflow
-    app = build_workflow()
-    final_state = app.invoke(initial_state)
+    # Run the workflow
+    final_state = APP.invoke(initial_state)
 
     # Print the final results
     print("\n--- Workflow Finished ---")